@@ -1,9 +1,11 @@
 __author__ = "Md Apurba Khan"
 __version__ = "2.1.0"
 
-from .bank_account import BankAccount
+from .bank_account import BankAccount, apply_transactions, transfer_many
 from .chequing_account import ChequingAccount
 from .investment_account import InvestmentAccount
 from .savings_account import SavingsAccount
+from .account_store import AccountStore, AccountView, BatchResult
 
-__all__ = ['BankAccount', 'ChequingAccount', 'InvestmentAccount', 'SavingsAccount']
\ No newline at end of file
+__all__ = ['BankAccount', 'apply_transactions', 'transfer_many', 'ChequingAccount', 'InvestmentAccount',
+           'SavingsAccount', 'AccountStore', 'AccountView', 'BatchResult']
\ No newline at end of file
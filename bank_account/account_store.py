@@ -0,0 +1,528 @@
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+from array import array
+from datetime import date
+import math
+from typing import NamedTuple
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.fixed_point import CENTS_PER_DOLLAR, MAX_CENTS, MIN_CENTS, format_cents, from_cents, to_cents
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from patterns.observer.observer_registry import LARGE_TRANSACTION, LOW_BALANCE
+from patterns.strategy.strategy_registry import strategy_registry
+
+# Result codes returned by AccountStore.apply for each transaction.
+ACCEPTED = 0
+INVALID_AMOUNT = 1
+INSUFFICIENT_FUNDS = 2
+OVERDRAFT_LIMIT_EXCEEDED = 3
+UNKNOWN_ACCOUNT = 4
+BALANCE_OVERFLOW = 5
+
+# Marks an unused optional column in a fixed-point store, where NaN is not available.
+NULL_CENTS = MIN_CENTS
+
+# Account type codes, in the order of ACCOUNT_TYPES.
+CHEQUING = 0
+SAVINGS = 1
+INVESTMENT = 2
+ACCOUNT_TYPES = ("ChequingAccount", "SavingsAccount", "InvestmentAccount")
+
+class BatchResult(NamedTuple):
+    """The outcome of a batch of transactions, one entry per transaction.
+
+    Attributes:
+        codes (array): The result code of each transaction (ACCEPTED or a rejection code).
+        low_balance (array): 1 where an accepted transaction left the balance below
+            BankAccount.LOW_BALANCE_LEVEL, otherwise 0.
+        large_transaction (array): 1 where an accepted transaction exceeded
+            BankAccount.LARGE_TRANSACTION_THRESHOLD, otherwise 0.
+    """
+    codes: array
+    low_balance: array
+    large_transaction: array
+
+    def rejected(self) -> list:
+        """Returns the positions of the transactions that were rejected."""
+        return [row for row, code in enumerate(self.codes) if code != ACCEPTED]
+
+class AccountStore:
+    """Columnar store of bank accounts, addressed by account index.
+
+    Each attribute is held in one typed array, so a batch of transactions is applied by a
+    single loop over flat arrays rather than a method call chain per account. Callers that
+    expect BankAccount objects can use view() to get a thin AccountView over one row.
+
+    In fixed-point mode balances, limits, minimum balances and fees are held as integer
+    cents (int64) and apply() takes amounts in cents, so postings are exact and limit and
+    overflow checks are integer comparisons. Values are converted to float dollars only
+    where they leave the store: views, account() and service charge strategies.
+
+    Attributes:
+        __fixed_point (bool): True if money columns hold integer cents.
+        __account_numbers (list): The account number of each account.
+        __client_numbers (list): The client number of each account.
+        __positions (dict): Maps account_number (str) to its account index.
+        __balances (array): The balance of each account (float64, or int64 cents).
+        __floors (array): The lowest balance a withdrawal may leave (float64, or int64
+            cents): the overdraft limit for chequing accounts and 0 otherwise.
+        __types (array): The account type code of each account (uint8).
+        __dates (array): The creation date of each account as an ordinal (int32).
+        __overdraft_rates (array): The overdraft rate, NaN where unused (float64).
+        __minimum_balances (array): The minimum balance, NaN (or NULL_CENTS) where unused.
+        __management_fees (array): The management fee, NaN (or NULL_CENTS) where unused.
+    """
+
+    def __init__(self, fixed_point: bool = False) -> None:
+        """Initialize an empty AccountStore.
+
+        Args:
+            fixed_point (bool): If True, hold money as integer cents.
+        """
+        money = "q" if fixed_point else "d"
+        self.__fixed_point = fixed_point
+        self.__account_numbers = []
+        self.__client_numbers = []
+        self.__positions = {}
+        self.__balances = array(money)
+        self.__floors = array(money)
+        self.__types = array("B")
+        self.__dates = array("i")
+        self.__overdraft_rates = array("d")
+        self.__minimum_balances = array(money)
+        self.__management_fees = array(money)
+
+    @classmethod
+    def from_values(cls, rows, fixed_point: bool = False) -> 'AccountStore':
+        """Create an AccountStore from rows of typed account values.
+
+        Args:
+            rows (iterable): Tuples of (account_number, client_number, balance, date_created,
+                account_type, overdraft_limit, overdraft_rate, minimum_balance, management_fee).
+            fixed_point (bool): If True, hold money as integer cents.
+
+        Returns:
+            AccountStore: A store holding every row, in order.
+        """
+        store = cls(fixed_point)
+        for values in rows:
+            store.add(values)
+        return store
+
+    def add(self, values: tuple) -> int:
+        """Add an account to the store.
+
+        Args:
+            values (tuple): (account_number, client_number, balance, date_created, account_type,
+                overdraft_limit, overdraft_rate, minimum_balance, management_fee), with None for
+                the columns the account type does not use. Money values are in dollars and are
+                converted to cents in fixed-point mode.
+
+        Returns:
+            int: The index of the new account.
+
+        Raises:
+            ValueError: If the account number is already stored, the account type is unknown
+                or a money value cannot be stored.
+        """
+        (account_number, client_number, balance, date_created, account_type,
+         overdraft_limit, overdraft_rate, minimum_balance, management_fee) = values
+        if account_number in self.__positions:
+            raise ValueError(f"Account {account_number} is already in the store.")
+        if account_type not in ACCOUNT_TYPES:
+            raise ValueError("Not a valid account type")
+
+        type_code = ACCOUNT_TYPES.index(account_type)
+        money = (self.__stored_money(balance),
+                 self.__stored_money(overdraft_limit if type_code == CHEQUING else 0.0),
+                 self.__stored_money(minimum_balance),
+                 self.__stored_money(management_fee))
+        index = len(self.__account_numbers)
+        self.__positions[account_number] = index
+        self.__account_numbers.append(account_number)
+        self.__client_numbers.append(client_number)
+        self.__balances.append(money[0])
+        self.__floors.append(money[1])
+        self.__types.append(type_code)
+        self.__dates.append(date_created.toordinal())
+        self.__overdraft_rates.append(_stored(overdraft_rate))
+        self.__minimum_balances.append(money[2])
+        self.__management_fees.append(money[3])
+        return index
+
+    def __stored_money(self, value):
+        """Returns the stored form of an optional dollar value."""
+        if not self.__fixed_point:
+            return _stored(value)
+        if value is None:
+            return NULL_CENTS
+        cents = to_cents(value)
+        if not MIN_CENTS < cents <= MAX_CENTS:
+            raise ValueError(f"{value!r} is too large to store in cents.")
+        return cents
+
+    def __money(self, value):
+        """Returns a stored money value as float dollars, or None if it is unused."""
+        if not self.__fixed_point:
+            return _optional(value)
+        return None if value == NULL_CENTS else from_cents(value)
+
+    @property
+    def fixed_point(self) -> bool:
+        """True if the store holds money as integer cents."""
+        return self.__fixed_point
+
+    def __len__(self) -> int:
+        """Returns the number of accounts in the store."""
+        return len(self.__account_numbers)
+
+    def __contains__(self, account_number: str) -> bool:
+        """Returns True if the account number is in the store."""
+        return account_number in self.__positions
+
+    def index_of(self, account_number: str) -> int:
+        """Returns the index of an account.
+
+        Raises:
+            KeyError: If the account number is not in the store.
+        """
+        return self.__positions[account_number]
+
+    def balances(self) -> array:
+        """Returns a copy of the balance of every account, in index order.
+
+        The balances are float dollars, or integer cents in fixed-point mode.
+        """
+        return array(self.__balances.typecode, self.__balances)
+
+    def balance_cents(self, index: int) -> int:
+        """Returns the balance of one account in cents, exactly in fixed-point mode."""
+        balance = self.__balances[index]
+        return balance if self.__fixed_point else to_cents(balance)
+
+    def apply(self, indices, amounts) -> BatchResult:
+        """Apply a batch of transactions in order.
+
+        A positive amount is a deposit and a negative amount a withdrawal. Each transaction
+        is checked against the balance left by the ones before it, with the same rules as
+        the deposit and withdraw methods of the account classes: a rejected transaction
+        leaves the balance unchanged and does not stop the rest of the batch. In fixed-point
+        mode a transaction that would take a balance outside int64 is rejected with
+        BALANCE_OVERFLOW.
+
+        Args:
+            indices (sequence of int): The account index of each transaction.
+            amounts (sequence of float | int): The amount of each transaction, in dollars, or
+                in integer cents in fixed-point mode.
+
+        Returns:
+            BatchResult: The result code and the notification flags of each transaction.
+
+        Raises:
+            ValueError: If indices and amounts differ in length.
+            TypeError: If an amount is not a number, or not an integer in fixed-point mode.
+            OverflowError: If an amount in cents does not fit in int64.
+        """
+        typecode = self.__balances.typecode
+        amounts = amounts if isinstance(amounts, array) and amounts.typecode == typecode else array(typecode, amounts)
+        if len(indices) != len(amounts):
+            raise ValueError("indices and amounts must have the same length.")
+
+        count = len(amounts)
+        codes = array("B", bytes(count))
+        low_balance = array("B", bytes(count))
+        large_transaction = array("B", bytes(count))
+        balances = self.__balances
+        floors = self.__floors
+        types = self.__types
+        size = len(balances)
+        low_level = BankAccount.LOW_BALANCE_LEVEL
+        large_threshold = BankAccount.LARGE_TRANSACTION_THRESHOLD
+        lowest, highest = -math.inf, math.inf
+        if self.__fixed_point:
+            low_level, large_threshold = to_cents(low_level), to_cents(large_threshold)
+            lowest, highest = MIN_CENTS, MAX_CENTS
+
+        for row, index, amount in zip(range(count), indices, amounts):
+            if not 0 <= index < size:
+                codes[row] = UNKNOWN_ACCOUNT
+                continue
+            if amount == 0 or not -math.inf < amount < math.inf:
+                codes[row] = INVALID_AMOUNT
+                continue
+            balance = balances[index] + amount
+            if amount < 0 and balance < floors[index]:
+                codes[row] = OVERDRAFT_LIMIT_EXCEEDED if types[index] == CHEQUING else INSUFFICIENT_FUNDS
+                continue
+            if not lowest <= balance <= highest:
+                codes[row] = BALANCE_OVERFLOW
+                continue
+            balances[index] = balance
+            if balance < low_level:
+                low_balance[row] = 1
+            if amount > large_threshold or amount < -large_threshold:
+                large_transaction[row] = 1
+
+        return BatchResult(codes, low_balance, large_transaction)
+
+    def view(self, index: int) -> 'AccountView':
+        """Returns a BankAccount view of one account.
+
+        Raises:
+            IndexError: If there is no account at the index.
+        """
+        if not 0 <= index < len(self.__account_numbers):
+            raise IndexError("account index out of range")
+        return AccountView(self, index)
+
+    def account(self, index: int) -> BankAccount:
+        """Returns a standalone BankAccount subclass holding a copy of one account.
+
+        Args:
+            index (int): The account index.
+
+        Returns:
+            BankAccount: A ChequingAccount, SavingsAccount or InvestmentAccount.
+        """
+        account_number, client_number, balance, date_created = self._common_values(index)
+        type_code = self.__types[index]
+        if type_code == CHEQUING:
+            return ChequingAccount._from_parsed(account_number, client_number, balance, date_created,
+                                                self._floor(index), self.__overdraft_rates[index])
+        elif type_code == SAVINGS:
+            return SavingsAccount._from_parsed(account_number, client_number, balance, date_created,
+                                               self.__money(self.__minimum_balances[index]))
+        return InvestmentAccount._from_parsed(account_number, client_number, balance, date_created,
+                                              self.__money(self.__management_fees[index]))
+
+    def _common_values(self, index: int) -> tuple:
+        """Returns (account_number, client_number, balance, date_created) of one account."""
+        return (self.__account_numbers[index], self.__client_numbers[index],
+                self.__money(self.__balances[index]), date.fromordinal(self.__dates[index]))
+
+    def _account_type(self, index: int) -> int:
+        """Returns the account type code of one account."""
+        return self.__types[index]
+
+    def _floor(self, index: int) -> float:
+        """Returns the lowest balance a withdrawal may leave in one account."""
+        return self.__money(self.__floors[index])
+
+    def _adjust_balance(self, index: int, amount: float) -> float:
+        """Adds a dollar amount to the balance of one account without any limit checks.
+
+        Returns:
+            float: The new balance.
+
+        Raises:
+            ValueError: If the amount is not finite or the balance would no longer fit a
+                fixed-point store; the balance is left unchanged.
+        """
+        if not math.isfinite(amount):
+            raise ValueError("Amount must be a finite number.")
+        if self.__fixed_point:
+            if not MIN_CENTS < amount * CENTS_PER_DOLLAR <= MAX_CENTS:
+                raise ValueError(f"{amount!r} is too large to store in cents.")
+            balance = self.__balances[index] + to_cents(amount)
+            if not MIN_CENTS < balance <= MAX_CENTS:
+                raise ValueError("Balance would overflow.")
+            self.__balances[index] = balance
+        else:
+            self.__balances[index] += amount
+        return self.__money(self.__balances[index])
+
+    def _stored_balance(self, index: int):
+        """Returns the balance of one account in the units taken by apply()."""
+        return self.__balances[index]
+
+    def _restore_balance(self, index: int, balance) -> None:
+        """Sets the balance of one account to a value returned by _stored_balance."""
+        self.__balances[index] = balance
+
+    def _format(self, value) -> str:
+        """Formats a stored money value as a "$x,xxx.xx" label."""
+        return format_cents(value) if self.__fixed_point else f"${value:,.2f}"
+
+    def _stored_amounts(self, amounts: list) -> list:
+        """Returns dollar amounts in the units taken by apply()."""
+        return [to_cents(amount) for amount in amounts] if self.__fixed_point else amounts
+
+    def service_charges(self) -> array:
+        """Calculate the service charges of every account with the registered batch kernels.
+
+        Returns:
+            array: The service charge of each account in index order, in float dollars, or
+            in integer cents in fixed-point mode.
+        """
+        rows = {type_code: [] for type_code in range(len(ACCOUNT_TYPES))}
+        for index, type_code in enumerate(self.__types):
+            rows[type_code].append(index)
+
+        charges = array(self.__balances.typecode, bytes(self.__balances.itemsize * len(self)))
+        for type_code, indices in rows.items():
+            if not indices:
+                continue
+            balances = [self.__money(self.__balances[index]) for index in indices]
+            type_charges = strategy_registry.calculate_many(ACCOUNT_TYPES[type_code], balances,
+                                                            self.__strategy_params(type_code, indices))
+            for index, charge in zip(indices, type_charges):
+                charges[index] = to_cents(charge) if self.__fixed_point else charge
+        return charges
+
+    def __strategy_params(self, type_code: int, indices: list) -> dict:
+        """Returns the strategy constructor arguments of the given accounts, by name."""
+        if type_code == CHEQUING:
+            return {"overdraft_rate": [self.__overdraft_rates[index] for index in indices],
+                    "overdraft_limit": [self._floor(index) for index in indices]}
+        elif type_code == SAVINGS:
+            return {"minimum_balance": [self.__money(self.__minimum_balances[index]) for index in indices]}
+        return {"management_fee": [self.__money(self.__management_fees[index]) for index in indices],
+                "account_open_date": [date.fromordinal(self.__dates[index]) for index in indices]}
+
+    def _strategy(self, index: int):
+        """Returns the shared service charge strategy of one account."""
+        type_code = self.__types[index]
+        params = self.__strategy_params(type_code, [index])
+        return strategy_registry.strategy(ACCOUNT_TYPES[type_code], *(column[0] for column in params.values()))
+
+class AccountView(BankAccount):
+    """A BankAccount backed by one row of an AccountStore.
+
+    Reads and writes go straight to the store, so changes made through a view are seen by
+    the store's batch operations and by every other view of the same account. Observers
+    are attached to the view itself, not to the stored account.
+
+    Attributes:
+        __store (AccountStore): The store holding the account.
+        __index (int): The account index in the store.
+    """
+
+    __slots__ = ('__store', '__index')
+
+    def __init__(self, store: AccountStore, index: int) -> None:
+        """Initialize a view of the account at index in store."""
+        self.__store = store
+        self.__index = index
+        self._observers = None
+
+    @property
+    def balance(self) -> float:
+        """Get the current balance of the account."""
+        return self.__store._common_values(self.__index)[2]
+
+    @property
+    def account_number(self) -> str:
+        """Get the account number."""
+        return self.__store._common_values(self.__index)[0]
+
+    @property
+    def client_number(self) -> str:
+        """Get the client number associated with the account."""
+        return self.__store._common_values(self.__index)[1]
+
+    @property
+    def account_type(self) -> str:
+        """Get the name of the stored account's type."""
+        return ACCOUNT_TYPES[self.__store._account_type(self.__index)]
+
+    @property
+    def date_created(self) -> date:
+        """Get the date the account was created."""
+        return self.__store._common_values(self.__index)[3]
+
+    def update_balance(self, amount: float) -> None:
+        """Update the stored balance and notify observers if conditions are met.
+
+        Args:
+            amount (float): The amount to add (positive) or subtract (negative) from the balance.
+
+        Raises:
+            ValueError: If the amount is not a valid, finite number or the balance would
+                overflow a fixed-point store.
+        """
+        if not self._is_valid_float(amount):
+            raise ValueError("Amount must be a valid number.")
+        amount = float(amount)
+        balance = self.__store._adjust_balance(self.__index, amount)
+        account_number = self.account_number
+        if balance < self.LOW_BALANCE_LEVEL:
+            self.notify(f"Low balance warning ${balance:,.2f}: on account {account_number}", LOW_BALANCE)
+        if abs(amount) > self.LARGE_TRANSACTION_THRESHOLD:
+            self.notify(f"Large transaction ${abs(amount):,.2f}: on account {account_number}", LARGE_TRANSACTION)
+
+    def deposit(self, amount: float) -> None:
+        """Deposit an amount into the account."""
+        if not self._is_valid_float(amount) or float(amount) <= 0:
+            raise ValueError("Deposit amount must be a positive number.")
+        self.update_balance(float(amount))
+
+    def withdraw(self, amount: float) -> None:
+        """Withdraw an amount from the account."""
+        if not self._is_valid_float(amount) or float(amount) <= 0:
+            raise ValueError("Withdrawal amount must be a positive number.")
+        amount = float(amount)
+        self._validate_withdrawal(amount)
+        self.update_balance(-amount)
+
+    def _withdrawal_floor(self) -> float:
+        """Return the lowest balance a withdrawal may leave in the stored account."""
+        return self.__store._floor(self.__index)
+
+    def _validate_withdrawal(self, amount: float) -> None:
+        """Check a withdrawal with the message of the stored account's type."""
+        if self.balance - amount < self._withdrawal_floor():
+            if self.__store._account_type(self.__index) == CHEQUING:
+                raise ValueError(ChequingAccount._WITHDRAWAL_REJECTED)
+            raise ValueError(BankAccount._WITHDRAWAL_REJECTED)
+
+    def _apply_amounts(self, amounts: list) -> tuple[list, list]:
+        """Apply validated amounts through AccountStore.apply without notifying observers."""
+        store = self.__store
+        stored_amounts = store._stored_amounts(amounts)
+        balance = store._stored_balance(self.__index)
+        result = store.apply([self.__index] * len(amounts), stored_amounts)
+        rejections = []
+        messages = []
+        for position, amount in enumerate(stored_amounts):
+            code = result.codes[position]
+            if code == OVERDRAFT_LIMIT_EXCEEDED:
+                rejections.append((position, ChequingAccount._WITHDRAWAL_REJECTED))
+            elif code == BALANCE_OVERFLOW:
+                rejections.append((position, "Balance would overflow."))
+            elif code != ACCEPTED:
+                rejections.append((position, BankAccount._WITHDRAWAL_REJECTED))
+            else:
+                balance += amount
+                if result.low_balance[position]:
+                    messages.append((f"Low balance warning {store._format(balance)}: on account {self.account_number}",
+                                     LOW_BALANCE))
+                if result.large_transaction[position]:
+                    messages.append((f"Large transaction {store._format(abs(amount))}: on account {self.account_number}",
+                                     LARGE_TRANSACTION))
+        return rejections, messages
+
+    def _saved_balance(self):
+        """Return the stored balance, exactly as the store holds it."""
+        return self.__store._stored_balance(self.__index)
+
+    def _restore_balance(self, saved) -> None:
+        """Put back a stored balance returned by _saved_balance."""
+        self.__store._restore_balance(self.__index, saved)
+
+    def get_service_charges(self) -> float:
+        """Calculate service charges for the account."""
+        return self.__store._strategy(self.__index).calculate_service_charges(self)
+
+    def __str__(self) -> str:
+        """Return the string representation of the equivalent account class."""
+        return str(self.__store.account(self.__index))
+
+def _stored(value) -> float:
+    """Returns the stored form of an optional value, NaN for None."""
+    return math.nan if value is None else value
+
+def _optional(value: float):
+    """Returns None for the NaN used to store an unused optional value."""
+    return None if math.isnan(value) else value
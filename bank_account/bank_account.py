@@ -3,7 +3,9 @@ __version__ = "2.9.1"
 
 from abc import ABC, abstractmethod
 from datetime import date
+import math
 from patterns.observer.observer import Subject, Observer
+from patterns.observer.observer_registry import LARGE_TRANSACTION, LOW_BALANCE, ObserverRegistry
 
 
 class BankAccount(Subject, ABC):
@@ -18,15 +20,22 @@ class BankAccount(Subject, ABC):
         _client_number (str): The client number associated with the account.
         _balance (float): The current balance of the account.
         _date_created (date): The date the account was created.
-        _observers (list): List of observers subscribed to account updates.
+        _observers (ObserverRegistry): The observers subscribed to account updates, held by
+            weak reference, or None until the first observer is attached.
+        _service_charge (tuple): The last (charge, cutoff) calculated by _cached_service_charges,
+            or None once the balance has changed.
 
     Constants:
         LOW_BALANCE_LEVEL (float): Threshold for low balance notification (default: 100.00).
         LARGE_TRANSACTION_THRESHOLD (float): Threshold for large transaction notification (default: 10000.00).
     """
 
+    __slots__ = ('_account_number', '_client_number', '_balance', '_date_created', '_observers',
+                 '_service_charge')
+
     LOW_BALANCE_LEVEL = 100.00
     LARGE_TRANSACTION_THRESHOLD = 10000.00
+    _WITHDRAWAL_REJECTED = "Insufficient funds for withdrawal."
 
     def __init__(self, account_number: str, client_number: str, balance: float, date_created: date) -> None:
         """Initialize a BankAccount instance with the given parameters.
@@ -51,7 +60,35 @@ class BankAccount(Subject, ABC):
         self._client_number = client_number
         self._balance = float(balance) if self._is_valid_float(balance) else 0.0
         self._date_created = date_created if isinstance(date_created, date) else date.today()
-        self._observers = []
+        self._observers = None
+        self._service_charge = None
+
+    def _init_parsed(self, account_number: str, client_number: str, balance: float, date_created: date) -> None:
+        """Initialize the BankAccount attributes from values that are already parsed.
+
+        This is the trusted construction path used when loading stored accounts: the balance
+        must already be a float and date_created a date, so neither is validated again.
+
+        Args:
+            account_number (str): The unique account number.
+            client_number (str): The client number associated with the account.
+            balance (float): The initial balance of the account.
+            date_created (date): The date the account was created.
+
+        Raises:
+            TypeError: If account_number or client_number is not a non-empty string.
+        """
+        if not isinstance(account_number, str) or not account_number:
+            raise TypeError("Account number must be a non-empty string.")
+        if not isinstance(client_number, str) or not client_number:
+            raise TypeError("Client number must be a non-empty string.")
+
+        self._account_number = account_number
+        self._client_number = client_number
+        self._balance = balance
+        self._date_created = date_created
+        self._observers = None
+        self._service_charge = None
 
     def _is_valid_float(self, value) -> bool:
         """Validate if a value can be converted to a float.
@@ -68,14 +105,20 @@ class BankAccount(Subject, ABC):
         except (ValueError, TypeError):
             return False
 
-    def attach(self, observer: Observer) -> None:
-        """Add an observer to the list of subscribers.
+    def attach(self, observer: Observer, topics=None) -> None:
+        """Subscribe an observer to the account's notifications.
+
+        The account only holds a weak reference, so the observer stops being notified once
+        nothing else refers to it.
 
         Args:
             observer (Observer): The observer to attach.
+            topics (iterable): The topics to notify it of, LOW_BALANCE and LARGE_TRANSACTION
+                from patterns.observer.observer_registry, or None for all of them.
         """
-        if observer not in self._observers:
-            self._observers.append(observer)
+        if self._observers is None:
+            self._observers = ObserverRegistry()
+        self._observers.attach(observer, topics)
 
     def detach(self, observer: Observer) -> None:
         """Remove an observer from the list of subscribers.
@@ -83,17 +126,18 @@ class BankAccount(Subject, ABC):
         Args:
             observer (Observer): The observer to detach.
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
+        if self._observers is not None:
+            self._observers.detach(observer)
 
-    def notify(self, message: str) -> None:
-        """Notify all observers of a change with the given message.
+    def notify(self, message: str, topic: str = None) -> None:
+        """Notify the observers subscribed to a topic with the given message.
 
         Args:
             message (str): The message to send to observers.
+            topic (str): The topic of the message, or None to notify every observer.
         """
-        for observer in self._observers:
-            observer.update(message)
+        if self._observers is not None:
+            self._observers.notify(message, topic)
 
     @property
     def balance(self) -> float:
@@ -122,6 +166,15 @@ class BankAccount(Subject, ABC):
         """
         return self._client_number
 
+    @property
+    def account_type(self) -> str:
+        """Get the name of the account type, such as "SavingsAccount".
+
+        Returns:
+            str: The account type name used by the strategy registry and alert rules.
+        """
+        return type(self).__name__
+
     @property
     def date_created(self) -> date:
         """Get the date the account was created.
@@ -148,10 +201,142 @@ class BankAccount(Subject, ABC):
             raise ValueError("Amount must be a valid number.")
         amount = float(amount)
         self._balance += amount
+        self._service_charge = None
         if self._balance < self.LOW_BALANCE_LEVEL:
-            self.notify(f"Low balance warning ${self._balance:,.2f}: on account {self._account_number}")
+            self.notify(f"Low balance warning ${self._balance:,.2f}: on account {self._account_number}",
+                        LOW_BALANCE)
         if abs(amount) > self.LARGE_TRANSACTION_THRESHOLD:
-            self.notify(f"Large transaction ${abs(amount):,.2f}: on account {self._account_number}")
+            self.notify(f"Large transaction ${abs(amount):,.2f}: on account {self._account_number}",
+                        LARGE_TRANSACTION)
+
+    def _cached_service_charges(self, strategy) -> float:
+        """Return the charge of a strategy for this account, calculating it only when needed.
+
+        The charge is recalculated after the balance changes through update_balance or a
+        batch of transactions, or when the strategy's cutoff() changes, such as when the
+        management fee waiver date moves forward a day.
+
+        Args:
+            strategy (ServiceChargeStrategy): The account's service charge strategy.
+
+        Returns:
+            float: The service charge.
+        """
+        cutoff = strategy.cutoff()
+        cached = self._service_charge
+        if cached is not None and cached[1] == cutoff:
+            return cached[0]
+        charge = strategy.calculate_service_charges(self)
+        self._service_charge = (charge, cutoff)
+        return charge
+
+    def _withdrawal_floor(self) -> float:
+        """Return the lowest balance a withdrawal may leave in the account.
+
+        Returns:
+            float: 0.0 unless a subclass allows the balance to go lower.
+        """
+        return 0.0
+
+    def _validate_withdrawal(self, amount: float) -> None:
+        """Check that withdrawing a positive amount keeps the balance within the account's limit.
+
+        Args:
+            amount (float): The amount to withdraw.
+
+        Raises:
+            ValueError: If the withdrawal would take the balance below _withdrawal_floor().
+        """
+        if self.balance - amount < self._withdrawal_floor():
+            raise ValueError(self._WITHDRAWAL_REJECTED)
+
+    def apply_transactions(self, transactions) -> list:
+        """Apply a sequence of transactions and then notify observers once the batch is done.
+
+        Each transaction is an amount: positive for a deposit and negative for a withdrawal.
+        All amounts are validated before any is applied. They are then applied in order with
+        the same rules as deposit and withdraw; a withdrawal that breaks the account's limit is
+        rejected and the batch carries on. The low balance and large transaction notifications
+        are collected while applying and sent afterwards, in order.
+
+        Args:
+            transactions (iterable): The signed amount of each transaction.
+
+        Returns:
+            list: (position, message) for each rejected transaction.
+
+        Raises:
+            ValueError: If any amount is not a valid non-zero number; nothing is applied.
+        """
+        rejections, messages = self._apply_amounts(_validated_amounts(transactions))
+        for message, topic in messages:
+            self.notify(message, topic)
+        return rejections
+
+    def _apply_amounts(self, amounts: list) -> tuple[list, list]:
+        """Apply validated amounts in order without notifying observers.
+
+        Args:
+            amounts (list): Non-zero float amounts.
+
+        Returns:
+            tuple: (rejections, messages) where rejections are (position, message) pairs and
+            messages are the (message, topic) notifications to send, in order.
+        """
+        rejections = []
+        messages = []
+        floor = self._withdrawal_floor()
+        low_level = self.LOW_BALANCE_LEVEL
+        large_threshold = self.LARGE_TRANSACTION_THRESHOLD
+        balance = self._balance
+        for position, amount in enumerate(amounts):
+            new_balance = balance + amount
+            if amount < 0 and new_balance < floor:
+                rejections.append((position, self._WITHDRAWAL_REJECTED))
+                continue
+            balance = new_balance
+            if balance < low_level:
+                messages.append((f"Low balance warning ${balance:,.2f}: on account {self._account_number}",
+                                 LOW_BALANCE))
+            if amount > large_threshold or amount < -large_threshold:
+                messages.append((f"Large transaction ${abs(amount):,.2f}: on account {self._account_number}",
+                                 LARGE_TRANSACTION))
+        if balance != self._balance:
+            self._balance = balance
+            self._service_charge = None
+        return rejections, messages
+
+    def _saved_balance(self):
+        """Return the balance in the form _restore_balance takes back."""
+        return self._balance
+
+    def _restore_balance(self, saved) -> None:
+        """Put back a balance returned by _saved_balance, without any checks or notifications.
+
+        Args:
+            saved: The value returned by _saved_balance.
+        """
+        self._balance = saved
+        self._service_charge = None
+
+    def transfer_to(self, target: 'BankAccount', amount: float) -> None:
+        """Move an amount from this account to another account as one operation.
+
+        The withdrawal is checked against this account's rules (insufficient funds or the
+        overdraft limit) before either balance changes, so a rejected transfer leaves both
+        accounts as they were. Pass both accounts to one manage_data.update_many call to
+        persist the two legs together.
+
+        Args:
+            target (BankAccount): The account receiving the amount.
+            amount (float): The positive amount to move.
+
+        Raises:
+            TypeError: If target is not a BankAccount.
+            ValueError: If the amount is not a positive number, target is this account, or the
+                withdrawal would break this account's limit.
+        """
+        transfer_many(self, [(target, amount)])
 
     @abstractmethod
     def deposit(self, amount: float) -> None:
@@ -198,4 +383,148 @@ class BankAccount(Subject, ABC):
         Returns:
             str: A string in the format "Account Number: {number} Balance: ${balance}".
         """
-        return f"Account Number: {self._account_number} Balance: ${self._balance:,.2f}"
\ No newline at end of file
+        return f"Account Number: {self._account_number} Balance: ${self._balance:,.2f}"
+
+def apply_transactions(accounts: dict, transactions) -> list:
+    """Apply (account_number, amount) transactions across a dictionary of accounts.
+
+    Transactions are grouped by account and applied with BankAccount.apply_transactions,
+    so each account sees its own transactions in their original order. Notifications are
+    sent only after every account has been updated.
+
+    Args:
+        accounts (dict): Maps account_number (str) to BankAccount.
+        transactions (iterable): (account_number, amount) pairs, with a positive amount for
+            a deposit and a negative amount for a withdrawal.
+
+    Returns:
+        list: (position, message) for each rejected transaction, ordered by position.
+
+    Raises:
+        ValueError: If any amount is not a valid non-zero number; nothing is applied.
+    """
+    transactions = list(transactions)
+    amounts = _validated_amounts(amount for _, amount in transactions)
+    batches = {}
+    rejections = []
+    for position, (account_number, _) in enumerate(transactions):
+        if account_number in accounts:
+            batches.setdefault(account_number, []).append(position)
+        else:
+            rejections.append((position, f"Account {account_number} not found."))
+
+    notifications = []
+    for account_number, positions in batches.items():
+        account = accounts[account_number]
+        account_rejections, messages = account._apply_amounts([amounts[position] for position in positions])
+        rejections.extend((positions[index], message) for index, message in account_rejections)
+        notifications.append((account, messages))
+
+    for account, messages in notifications:
+        for message, topic in messages:
+            account.notify(message, topic)
+    rejections.sort()
+    return rejections
+
+def transfer_many(source: BankAccount, transfers) -> list:
+    """Move amounts from one account to many others as one all-or-nothing operation.
+
+    This is the payroll-style fan-out: the source is debited once with the total, which is
+    checked against its rules before any balance changes, and each target is then credited
+    its amount. If the total is rejected or any transfer is invalid, no account changes.
+    Notifications are sent after every account has been updated.
+
+    Args:
+        source (BankAccount): The account the amounts are taken from.
+        transfers (iterable): (target BankAccount, amount) pairs. A target may appear more
+            than once.
+
+    Returns:
+        list: The source followed by each distinct target, ready to be persisted together
+        with manage_data.update_many.
+
+    Raises:
+        TypeError: If a target is not a BankAccount.
+        ValueError: If an amount is not a positive number, a target is the source, or the
+            total would break the source's limit.
+    """
+    changed, notifications = _transfer_many(source, transfers)
+    for account, messages in notifications:
+        for message, topic in messages:
+            account.notify(message, topic)
+    return changed
+
+def _transfer_many(source: BankAccount, transfers) -> tuple[list, list]:
+    """Make the transfers of transfer_many without notifying observers.
+
+    Returns:
+        tuple: (changed, notifications) where changed is the list returned by transfer_many
+        and notifications are the (account, [(message, topic), ...]) pairs to send, in order.
+    """
+    transfers = list(transfers)
+    amounts = []
+    for position, (target, amount) in enumerate(transfers):
+        if not isinstance(target, BankAccount):
+            raise TypeError(f"Transfer {position}: target must be a BankAccount.")
+        if target.account_number == source.account_number:
+            raise ValueError(f"Transfer {position}: cannot transfer to the source account.")
+        try:
+            amount = float(amount)
+        except (ValueError, TypeError):
+            amount = math.nan
+        if not 0 < amount < math.inf:
+            raise ValueError(f"Transfer {position}: amount must be a positive number.")
+        amounts.append(amount)
+    if not amounts:
+        return [source], []
+
+    total = math.fsum(amounts)
+    saved = {source.account_number: (source, source._saved_balance())}
+    rejections, source_messages = source._apply_amounts([-total])
+    if rejections:
+        raise ValueError(rejections[0][1])
+
+    notifications = [(source, source_messages)]
+    try:
+        for (target, _), amount in zip(transfers, amounts):
+            if target.account_number not in saved:
+                saved[target.account_number] = (target, target._saved_balance())
+            rejections, messages = target._apply_amounts([amount])
+            if rejections:
+                # Only a fixed-point account store can refuse a deposit (on overflow).
+                raise ValueError(rejections[0][1])
+            notifications.append((target, messages))
+    except BaseException:
+        # Put the saved balances back as they were, whatever stopped the credits: undoing
+        # them as withdrawals could be refused by a target's withdrawal floor.
+        for account, balance in saved.values():
+            account._restore_balance(balance)
+        raise
+
+    changed = {source.account_number: source}
+    for target, _ in transfers:
+        changed.setdefault(target.account_number, target)
+    return list(changed.values()), notifications
+
+def _validated_amounts(transactions) -> list:
+    """Convert transaction amounts to floats, rejecting the batch if any is invalid.
+
+    Raises:
+        ValueError: If an amount is not a number, is zero or is not finite.
+    """
+    transactions = list(transactions)
+    try:
+        amounts = list(map(float, transactions))
+        if 0.0 not in amounts and all(map(math.isfinite, amounts)):
+            return amounts
+    except (ValueError, TypeError):
+        pass
+
+    # Find the first invalid amount to report it.
+    for position, amount in enumerate(transactions):
+        try:
+            amount = float(amount)
+        except (ValueError, TypeError):
+            raise ValueError(f"Transaction {position}: amount must be a valid number.")
+        if amount == 0 or not math.isfinite(amount):
+            raise ValueError(f"Transaction {position}: amount must be a finite, non-zero number.")
@@ -8,13 +8,28 @@ __version__ = "2.1.0"
 class ChequingAccount(BankAccount):
     """Class representing a chequing account, inheriting from BankAccount."""
 
+    __slots__ = ('__overdraft_limit', '__overdraft_rate', '__service_charge_strategy')
+
+    _WITHDRAWAL_REJECTED = "Withdrawal exceeds overdraft limit."
+
     def __init__(self, account_number: str, client_number: str, balance: float, 
                  date_created: date, overdraft_limit: float, overdraft_rate: float) -> None:
         """Initialize a ChequingAccount instance."""
         super().__init__(account_number, client_number, balance, date_created)
         self.__overdraft_limit = float(overdraft_limit) if self._is_valid_float(overdraft_limit) else -100.0
         self.__overdraft_rate = float(overdraft_rate) if self._is_valid_float(overdraft_rate) else 0.05
-        self.__service_charge_strategy = OverdraftStrategy(self.__overdraft_rate, self.__overdraft_limit)
+        self.__service_charge_strategy = OverdraftStrategy.shared(self.__overdraft_rate, self.__overdraft_limit)
+
+    @classmethod
+    def _from_parsed(cls, account_number: str, client_number: str, balance: float,
+                     date_created: date, overdraft_limit: float, overdraft_rate: float) -> 'ChequingAccount':
+        """Create a ChequingAccount from already parsed values without validating them again."""
+        account = cls.__new__(cls)
+        account._init_parsed(account_number, client_number, balance, date_created)
+        account.__overdraft_limit = overdraft_limit
+        account.__overdraft_rate = overdraft_rate
+        account.__service_charge_strategy = OverdraftStrategy.shared(overdraft_rate, overdraft_limit)
+        return account
 
     def deposit(self, amount: float) -> None:
         """Deposit an amount into the chequing account."""
@@ -27,13 +42,16 @@ class ChequingAccount(BankAccount):
         if not self._is_valid_float(amount) or float(amount) <= 0:
             raise ValueError("Withdrawal amount must be a positive number.")
         amount = float(amount)
-        if self._balance - amount < self.__overdraft_limit:
-            raise ValueError("Withdrawal exceeds overdraft limit.")
+        self._validate_withdrawal(amount)
         self.update_balance(-amount)
 
+    def _withdrawal_floor(self) -> float:
+        """Return the overdraft limit, the lowest balance a withdrawal may leave."""
+        return self.__overdraft_limit
+
     def get_service_charges(self) -> float:
         """Calculate service charges for the chequing account."""
-        return self.__service_charge_strategy.calculate_service_charges(self)
+        return self._cached_service_charges(self.__service_charge_strategy)
 
     def __str__(self) -> str:
         """Return a string representation of the ChequingAccount."""
@@ -0,0 +1,73 @@
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_EVEN
+
+CENTS_PER_DOLLAR = 100
+# Balances in cents are stored as signed 64-bit integers.
+MIN_CENTS = -2 ** 63
+MAX_CENTS = 2 ** 63 - 1
+_CENT = Decimal("0.01")
+
+def to_cents(amount) -> int:
+    """Convert a dollar amount to a whole number of cents.
+
+    Floats are converted through their shortest decimal representation, so 301.54 becomes
+    30154 rather than the 30153 that truncating 301.54 * 100 would give. Amounts with
+    fractions of a cent are rounded half to even.
+
+    Args:
+        amount (int | float | str | Decimal): The dollar amount.
+
+    Returns:
+        int: The amount in cents.
+
+    Raises:
+        ValueError: If the amount is not a finite number.
+    """
+    if isinstance(amount, int) and not isinstance(amount, bool):
+        return amount * CENTS_PER_DOLLAR
+    try:
+        value = Decimal(repr(amount) if isinstance(amount, float) else amount)
+        return int(value.quantize(_CENT, rounding=ROUND_HALF_EVEN).scaleb(2))
+    except (InvalidOperation, TypeError, ValueError, OverflowError):
+        raise ValueError(f"{amount!r} is not a valid amount.")
+
+def from_cents(cents: int) -> float:
+    """Convert a whole number of cents to a float dollar amount for display or float APIs.
+
+    Args:
+        cents (int): The amount in cents.
+
+    Returns:
+        float: The amount in dollars.
+    """
+    return cents / CENTS_PER_DOLLAR
+
+def format_cents(cents: int) -> str:
+    """Format a whole number of cents as a dollar label without going through float.
+
+    The result matches f"${dollars:,.2f}", the format used by the account classes.
+
+    Args:
+        cents (int): The amount in cents.
+
+    Returns:
+        str: The amount formatted as "$x,xxx.xx".
+    """
+    dollars, remainder = divmod(abs(cents), CENTS_PER_DOLLAR)
+    sign = "-" if cents < 0 else ""
+    return f"${sign}{dollars:,}.{remainder:02d}"
+
+def cents_to_text(cents: int) -> str:
+    """Format a whole number of cents as a plain decimal for storage, such as "-1234.56".
+
+    Args:
+        cents (int): The amount in cents.
+
+    Returns:
+        str: The amount in dollars with two decimal places and no separators.
+    """
+    dollars, remainder = divmod(abs(cents), CENTS_PER_DOLLAR)
+    sign = "-" if cents < 0 else ""
+    return f"{sign}{dollars}.{remainder:02d}"
@@ -8,12 +8,24 @@ __version__ = "1.7.0"
 class InvestmentAccount(BankAccount):
     """Class representing an investment account, inheriting from BankAccount."""
 
+    __slots__ = ('__management_fee', '__service_charge_strategy')
+
     def __init__(self, account_number: str, client_number: str, balance: float, 
                  date_created: date, management_fee: float) -> None:
         """Initialize an InvestmentAccount instance."""
         super().__init__(account_number, client_number, balance, date_created)
         self.__management_fee = float(management_fee) if self._is_valid_float(management_fee) else 2.55
-        self.__service_charge_strategy = ManagementFeeStrategy(self.__management_fee, self._date_created)
+        self.__service_charge_strategy = ManagementFeeStrategy.shared(self.__management_fee, self._date_created)
+
+    @classmethod
+    def _from_parsed(cls, account_number: str, client_number: str, balance: float,
+                     date_created: date, management_fee: float) -> 'InvestmentAccount':
+        """Create an InvestmentAccount from already parsed values without validating them again."""
+        account = cls.__new__(cls)
+        account._init_parsed(account_number, client_number, balance, date_created)
+        account.__management_fee = management_fee
+        account.__service_charge_strategy = ManagementFeeStrategy.shared(management_fee, date_created)
+        return account
 
     def deposit(self, amount: float) -> None:
         """Deposit an amount into the investment account."""
@@ -26,13 +38,12 @@ class InvestmentAccount(BankAccount):
         if not self._is_valid_float(amount) or float(amount) <= 0:
             raise ValueError("Withdrawal amount must be a positive number.")
         amount = float(amount)
-        if self._balance - amount < 0:
-            raise ValueError("Insufficient funds for withdrawal.")
+        self._validate_withdrawal(amount)
         self.update_balance(-amount)
 
     def get_service_charges(self) -> float:
         """Calculate service charges for the investment account."""
-        return self.__service_charge_strategy.calculate_service_charges(self)
+        return self._cached_service_charges(self.__service_charge_strategy)
 
     def __str__(self) -> str:
         """Return a string representation of the InvestmentAccount."""
@@ -8,12 +8,24 @@ __version__ = "2.2.0"
 class SavingsAccount(BankAccount):
     """Class representing a savings account, inheriting from BankAccount."""
 
+    __slots__ = ('__minimum_balance', '__service_charge_strategy')
+
     def __init__(self, account_number: str, client_number: str, balance: float, 
                  date_created: date, minimum_balance: float) -> None:
         """Initialize a SavingsAccount instance."""
         super().__init__(account_number, client_number, balance, date_created)
         self.__minimum_balance = float(minimum_balance) if self._is_valid_float(minimum_balance) else 50.0
-        self.__service_charge_strategy = MinimumBalanceStrategy(self.__minimum_balance)
+        self.__service_charge_strategy = MinimumBalanceStrategy.shared(self.__minimum_balance)
+
+    @classmethod
+    def _from_parsed(cls, account_number: str, client_number: str, balance: float,
+                     date_created: date, minimum_balance: float) -> 'SavingsAccount':
+        """Create a SavingsAccount from already parsed values without validating them again."""
+        account = cls.__new__(cls)
+        account._init_parsed(account_number, client_number, balance, date_created)
+        account.__minimum_balance = minimum_balance
+        account.__service_charge_strategy = MinimumBalanceStrategy.shared(minimum_balance)
+        return account
 
     def deposit(self, amount: float) -> None:
         """Deposit an amount into the savings account."""
@@ -26,13 +38,12 @@ class SavingsAccount(BankAccount):
         if not self._is_valid_float(amount) or float(amount) <= 0:
             raise ValueError("Withdrawal amount must be a positive number.")
         amount = float(amount)
-        if self._balance - amount < 0:
-            raise ValueError("Insufficient funds for withdrawal.")
+        self._validate_withdrawal(amount)
         self.update_balance(-amount)
 
     def get_service_charges(self) -> float:
         """Calculate service charges for the savings account."""
-        return self.__service_charge_strategy.calculate_service_charges(self)
+        return self._cached_service_charges(self.__service_charge_strategy)
 
     def __str__(self) -> str:
         """Return a string representation of the SavingsAccount."""
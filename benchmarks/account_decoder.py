@@ -0,0 +1,70 @@
+"""
+Description: Measures the positional accounts.csv decoder against the original
+DictReader/strptime/validating-constructor loop.
+Usage:
+    python -m benchmarks.account_decoder [account_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import csv
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from bank_account import ChequingAccount, InvestmentAccount, SavingsAccount
+from benchmarks.synthetic_data import write_synthetic_data
+from user_interface import manage_data
+
+def reference_load_accounts(accounts_path: str, client_numbers: set) -> dict:
+    """The account loop of load_data before the fast-path decoder, kept for comparison."""
+    accounts = {}
+    with open(accounts_path, newline='') as csvfile:
+        for record in csv.DictReader(csvfile):
+            try:
+                account_number = str(record["account_number"])
+                client_number = str(record["client_number"])
+                balance = float(record["balance"])
+                date_created = datetime.strptime(record["date_created"], "%Y-%m-%d").date()
+                account_type = record["account_type"]
+                if account_type == "ChequingAccount":
+                    account = ChequingAccount(account_number, client_number, balance, date_created,
+                                              float(record["overdraft_limit"]), float(record["overdraft_rate"]))
+                elif account_type == "SavingsAccount":
+                    account = SavingsAccount(account_number, client_number, balance, date_created,
+                                             float(record["minimum_balance"]))
+                elif account_type == "InvestmentAccount":
+                    account = InvestmentAccount(account_number, client_number, balance, date_created, 2.55)
+                else:
+                    raise ValueError("Not a valid account type")
+                if int(client_number) in client_numbers:
+                    accounts[account_number] = account
+            except Exception:
+                pass
+    return accounts
+
+def main():
+    """Time both decoders over the same synthetic accounts.csv and check they agree."""
+    account_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    with tempfile.TemporaryDirectory() as directory:
+        manage_data.clients_csv_path, manage_data.accounts_csv_path = write_synthetic_data(directory, account_count)
+        manage_data.accounts_journal_path = os.path.join(directory, "accounts.journal")
+        client_numbers = {client.client_number for client in manage_data.iter_clients()}
+
+        start = time.perf_counter()
+        reference = reference_load_accounts(manage_data.accounts_csv_path, client_numbers)
+        reference_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        accounts = {account.account_number: account for account in manage_data.iter_accounts(client_numbers)}
+        decoder_time = time.perf_counter() - start
+
+        assert {number: str(account) for number, account in accounts.items()} == \
+            {number: str(account) for number, account in reference.items()}
+        print(f"{len(accounts):,} accounts")
+        print(f"reference loop: {reference_time:.2f}s")
+        print(f"fast decoder:   {decoder_time:.2f}s (speedup {reference_time / decoder_time:.2f}x)")
+
+if __name__ == "__main__":
+    main()
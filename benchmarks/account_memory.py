@@ -0,0 +1,83 @@
+"""
+Description: Measures the memory retained per loaded account with tracemalloc, for the slotted
+account classes and for a reference copy of the previous dict-based layout.
+Usage:
+    python -m benchmarks.account_memory [account_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from benchmarks.synthetic_data import write_synthetic_data
+from user_interface import manage_data
+
+class ReferenceStrategy:
+    """The previous strategy layout: one instance per account, holding that account's parameters."""
+
+    def __init__(self, first, second=None) -> None:
+        """Keep the parameters in the instance __dict__, as each strategy class did."""
+        self.__first = first
+        if second is not None:
+            self.__second = second
+
+class ReferenceAccount:
+    """The previous account layout: an instance __dict__, an observer list and a strategy of its own."""
+
+    def __init__(self, values: tuple) -> None:
+        """Build the account from values in the order returned by manage_data._parse_account_record."""
+        (account_number, client_number, balance, date_created, account_type,
+         overdraft_limit, overdraft_rate, minimum_balance, _) = values
+        self._account_number = account_number
+        self._client_number = client_number
+        self._balance = balance
+        self._date_created = date_created
+        self._observers = []
+        if account_type == "ChequingAccount":
+            self.__overdraft_limit = overdraft_limit
+            self.__overdraft_rate = overdraft_rate
+            self.__service_charge_strategy = ReferenceStrategy(overdraft_rate, overdraft_limit)
+        elif account_type == "SavingsAccount":
+            self.__minimum_balance = minimum_balance
+            self.__service_charge_strategy = ReferenceStrategy(minimum_balance)
+        else:
+            self.__management_fee = 2.55
+            self.__service_charge_strategy = ReferenceStrategy(2.55, date_created)
+
+def measure(load) -> tuple[int, int]:
+    """Returns (accounts, bytes retained) for the accounts returned by load."""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    accounts = load()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return len(accounts), retained
+
+def main():
+    """Load a synthetic accounts.csv both ways and report the bytes retained per account."""
+    account_count = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    with tempfile.TemporaryDirectory() as directory:
+        manage_data.clients_csv_path, manage_data.accounts_csv_path = write_synthetic_data(directory, account_count)
+        manage_data.accounts_journal_path = os.path.join(directory, "accounts.journal")
+        client_numbers = {client.client_number for client in manage_data.iter_clients()}
+
+        results = {
+            "dict-based accounts, strategy per account": measure(
+                lambda: [ReferenceAccount(values) for values, _ in manage_data._iter_account_values(client_numbers)]),
+            "slotted accounts, shared strategies": measure(
+                lambda: list(manage_data.iter_accounts(client_numbers))),
+        }
+
+    reference = results["dict-based accounts, strategy per account"][1]
+    for label, (count, retained) in results.items():
+        saving = f", {reference / retained:.2f}x less" if retained != reference else ""
+        print(f"{label}: {count:,} accounts, {retained / 2**20:.1f} MiB "
+              f"({retained / count:.0f} bytes per account{saving})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Description: Compares applying a batch of transactions to account objects one at a time
+with AccountStore.apply.
+Usage:
+    python -m benchmarks.account_store [account_count] [transaction_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import os
+import random
+import sys
+import tempfile
+import time
+from benchmarks.synthetic_data import write_synthetic_data
+from user_interface import manage_data
+
+def main():
+    """Apply the same random transactions both ways and check the balances agree."""
+    account_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    transaction_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        manage_data.clients_csv_path, manage_data.accounts_csv_path = write_synthetic_data(directory, account_count)
+        manage_data.accounts_journal_path = os.path.join(directory, "accounts.journal")
+        accounts = list(manage_data.iter_accounts())
+        store = manage_data.load_account_store()
+
+    rng = random.Random(7)
+    indices = [rng.randrange(account_count) for _ in range(transaction_count)]
+    amounts = [round(rng.uniform(-2000, 1500), 2) or 1.0 for _ in range(transaction_count)]
+
+    start = time.perf_counter()
+    rejected = 0
+    for index, amount in zip(indices, amounts):
+        account = accounts[index]
+        try:
+            if amount > 0:
+                account.deposit(amount)
+            else:
+                account.withdraw(-amount)
+        except ValueError:
+            rejected += 1
+    object_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = store.apply(indices, amounts)
+    store_time = time.perf_counter() - start
+
+    assert len(result.rejected()) == rejected
+    assert list(store.balances()) == [account.balance for account in accounts]
+    print(f"{transaction_count:,} transactions over {account_count:,} accounts ({rejected:,} rejected)")
+    print(f"account objects: {object_time:.2f}s")
+    print(f"AccountStore:    {store_time:.2f}s (speedup {object_time / store_time:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Description: Compares emails sent and time spent when a client's alerts go straight to it or through an AlertCoalescer.
+Usage:
+    python -m benchmarks.alert_coalescing [transaction_count] [account_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import sys
+import time
+from datetime import date
+from bank_account.chequing_account import ChequingAccount
+from client.client import Client
+from patterns.observer import notification_dispatcher
+from patterns.observer.alert_coalescer import AlertCoalescer
+from patterns.observer.notification_dispatcher import NotificationDispatcher
+
+def run(count: int, account_count: int, coalesce: bool) -> tuple[float, int]:
+    """Moves the client's accounts in and out of a low balance and returns (seconds, emails)."""
+    emails = []
+    dispatcher = NotificationDispatcher(emails.extend)
+    previous = notification_dispatcher.set_dispatcher(dispatcher)
+    client = Client(1001, "John", "Doe", "johndoe@pixell.com")
+    observer = AlertCoalescer(client) if coalesce else client
+    accounts = [ChequingAccount(str(number), "1001", 500.0, date(2023, 1, 1), -100.0, 0.05)
+                for number in range(account_count)]
+    for account in accounts:
+        account.attach(observer)
+
+    start = time.perf_counter()
+    for number in range(count // 2):
+        account = accounts[number % account_count]
+        account.withdraw(450.0)
+        account.deposit(450.0)
+    if coalesce:
+        observer.flush()
+    dispatcher.shutdown()
+    elapsed = time.perf_counter() - start
+    notification_dispatcher.set_dispatcher(previous)
+    return elapsed, len(emails)
+
+def main():
+    """Report the emails and time per transaction with and without coalescing."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    account_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    print(f"{count:,} transactions over {account_count} accounts of one client")
+    for label, coalesce in (("Client attached directly", False), ("AlertCoalescer", True)):
+        elapsed, emails = run(count, account_count, coalesce)
+        print(f"{label}: {elapsed:.3f}s ({1e6 * elapsed / count:.2f}us per transaction), {emails:,} emails")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Description: Measures posting cost with the built-in thresholds and with the AlertRuleEngine's compiled rules.
+Usage:
+    python -m benchmarks.alert_rules [transaction_count] [account_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import random
+import sys
+import time
+from datetime import date
+from bank_account import apply_transactions
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from services.alert_rules import (DEFAULT_RULES, AlertRuleEngine, balance_below, count_above,
+                                  total_above)
+
+# Default thresholds, a savings override, a client override and two windowed rules.
+RULES = DEFAULT_RULES + (
+    balance_below(500.00, account_type="SavingsAccount"),
+    balance_below(1000.00, client_number="1000"),
+    count_above(5, 600),
+    total_above(5000.00, 3600),
+)
+
+def make_accounts(account_count: int) -> dict:
+    """Returns alternating chequing and savings accounts spread over a hundred clients."""
+    accounts = {}
+    for number in range(account_count):
+        account_number = str(100000 + number)
+        client_number = str(1000 + number % 100)
+        if number % 2:
+            accounts[account_number] = SavingsAccount(account_number, client_number, 1000.0, date(2023, 1, 1), 50.0)
+        else:
+            accounts[account_number] = ChequingAccount(account_number, client_number, 1000.0, date(2023, 1, 1),
+                                                       -1000.0, 0.05)
+    return accounts
+
+def make_transactions(accounts: dict, count: int) -> tuple[list, list]:
+    """Returns random (account_number, amount) transactions and a timestamp for each, ten a second."""
+    generator = random.Random(42)
+    numbers = list(accounts)
+    transactions = [(generator.choice(numbers), round(generator.uniform(-400.0, 400.0), 2) or 1.0)
+                    for _ in range(count)]
+    return transactions, [tick / 10 for tick in range(count)]
+
+def main():
+    """Post the same transactions with the built-in thresholds, the default rules and the full rule set."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    account_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    transactions, timestamps = make_transactions(make_accounts(account_count), count)
+    print(f"{count:,} transactions over {account_count:,} accounts")
+
+    accounts = make_accounts(account_count)
+    start = time.perf_counter()
+    apply_transactions(accounts, transactions)
+    elapsed = time.perf_counter() - start
+    print(f"apply_transactions, built-in thresholds: {elapsed:.3f}s ({1e6 * elapsed / count:.2f}us each)")
+
+    for label, rules in (("default rules", DEFAULT_RULES), ("7 rules with velocity and cumulative", RULES)):
+        accounts = make_accounts(account_count)
+        engine = AlertRuleEngine(rules)
+        start = time.perf_counter()
+        result = engine.apply_transactions(accounts, transactions, timestamps)
+        elapsed = time.perf_counter() - start
+        print(f"AlertRuleEngine batch, {label}: {elapsed:.3f}s ({1e6 * elapsed / count:.2f}us each), "
+              f"{len(result.alerts):,} alerts")
+
+    accounts = make_accounts(account_count)
+    engine = AlertRuleEngine(RULES)
+    start = time.perf_counter()
+    alerts = 0
+    for (account_number, amount), timestamp in zip(transactions, timestamps):
+        account = accounts[account_number]
+        try:
+            alerts += len(engine.post(account, amount, timestamp))
+        except ValueError:
+            continue
+    elapsed = time.perf_counter() - start
+    print(f"AlertRuleEngine per transaction, 7 rules: {elapsed:.3f}s ({1e6 * elapsed / count:.2f}us each), "
+          f"{alerts:,} alerts")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Description: Compares replaying transactions through deposit/withdraw with
+BankAccount.apply_transactions and with plain float addition.
+Usage:
+    python -m benchmarks.apply_transactions [transaction_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import random
+import sys
+import time
+from datetime import date
+from bank_account import ChequingAccount
+
+def main():
+    """Replay the same amounts three ways and check the balances agree."""
+    transaction_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(3)
+    amounts = [round(rng.uniform(-200, 210), 2) or 1.0 for _ in range(transaction_count)]
+
+    account = ChequingAccount("20001", "1001", 50000.00, date(2023, 1, 1), -1000.00, 0.05)
+    start = time.perf_counter()
+    for amount in amounts:
+        try:
+            if amount > 0:
+                account.deposit(amount)
+            else:
+                account.withdraw(-amount)
+        except ValueError:
+            pass
+    single_time = time.perf_counter() - start
+
+    batch_account = ChequingAccount("20001", "1001", 50000.00, date(2023, 1, 1), -1000.00, 0.05)
+    start = time.perf_counter()
+    batch_account.apply_transactions(amounts)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    balance = 50000.00
+    for amount in amounts:
+        balance += amount
+    arithmetic_time = time.perf_counter() - start
+
+    assert batch_account.balance == account.balance
+    print(f"{transaction_count:,} transactions")
+    print(f"deposit/withdraw:   {single_time:.2f}s")
+    print(f"apply_transactions: {batch_time:.2f}s (speedup {single_time / batch_time:.2f}x)")
+    print(f"plain addition:     {arithmetic_time:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Description: Compares posting amounts to a balance as float, Decimal and integer cents,
+and AccountStore.apply in float and fixed-point mode.
+Usage:
+    python -m benchmarks.fixed_point [posting_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import random
+import sys
+import time
+from datetime import date
+from decimal import Decimal
+from bank_account.account_store import AccountStore
+from bank_account.fixed_point import format_cents
+
+def timed(function, *args):
+    """Returns (result, seconds) of calling function with args."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+def post(balance, amounts):
+    """Adds every amount to balance in a plain loop."""
+    for amount in amounts:
+        balance += amount
+    return balance
+
+def main():
+    """Post the same random amounts every way and report the time and the drift."""
+    posting_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(11)
+    cents = [rng.randrange(-20000, 20000) or 1 for _ in range(posting_count)]
+    floats = [amount / 100 for amount in cents]
+    decimals = [Decimal(amount).scaleb(-2) for amount in cents]
+
+    exact, cents_time = timed(post, 0, cents)
+    float_balance, float_time = timed(post, 0.0, floats)
+    decimal_balance, decimal_time = timed(post, Decimal(0), decimals)
+    assert decimal_balance == Decimal(exact).scaleb(-2)
+
+    print(f"{posting_count:,} postings, exact balance {format_cents(exact)}")
+    print(f"float:   {float_time:.3f}s, drift {float_balance - exact / 100:+.3e} dollars")
+    print(f"Decimal: {decimal_time:.3f}s, exact")
+    print(f"cents:   {cents_time:.3f}s, exact")
+
+    row = ("20001", "1001", 1_000_000.00, date(2023, 1, 1), "ChequingAccount", -1_000_000.00, 0.05, None, None)
+    indices = [0] * posting_count
+    float_store = AccountStore.from_values([row])
+    cents_store = AccountStore.from_values([row], fixed_point=True)
+    _, float_apply_time = timed(float_store.apply, indices, floats)
+    _, cents_apply_time = timed(cents_store.apply, indices, cents)
+    assert cents_store.balance_cents(0) == 100_000_000 + exact
+    print(f"AccountStore.apply float: {float_apply_time:.3f}s, "
+          f"drift {float_store.balances()[0] - cents_store.balances()[0] / 100:+.3e} dollars")
+    print(f"AccountStore.apply cents: {cents_apply_time:.3f}s, exact")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Description: Times the month-end service charge run over a synthetic book of accounts.
+Usage:
+    python -m benchmarks.month_end [account_count] [workers]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import os
+import sys
+import tempfile
+import time
+from benchmarks.synthetic_data import write_synthetic_data
+from services.month_end_charges import run_month_end
+from user_interface import manage_data
+
+def main():
+    """Run the month-end charges once and report the throughput."""
+    account_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    with tempfile.TemporaryDirectory() as directory:
+        manage_data.clients_csv_path, manage_data.accounts_csv_path = write_synthetic_data(directory, account_count)
+        manage_data.accounts_journal_path = os.path.join(directory, "accounts.journal")
+
+        start = time.perf_counter()
+        summary = run_month_end("benchmark", workers, os.path.join(directory, "month_end"))
+        elapsed = time.perf_counter() - start
+
+    print(f"{summary.accounts_charged:,} accounts charged in {summary.shards} shards with {workers} workers")
+    print(f"{elapsed:.2f}s ({summary.accounts_charged / elapsed:,.0f} accounts/s, "
+          f"{10_000_000 * elapsed / summary.accounts_charged / 60:.1f} min per 10M accounts)")
+
+if __name__ == "__main__":
+    main()
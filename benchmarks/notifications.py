@@ -0,0 +1,76 @@
+"""
+Description: Measures how long large transactions wait for their alerts, sent inline or via the dispatcher.
+Usage:
+    python -m benchmarks.notifications [transaction_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+from bank_account.chequing_account import ChequingAccount
+from patterns.observer.notification_dispatcher import NotificationDispatcher
+from patterns.observer.observer import Observer
+
+class InlineEmailer(Observer):
+    """Writes each alert to the email file as it happens, as Client.update used to."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize with the path of the email file."""
+        self.path = path
+
+    def update(self, message: str) -> None:
+        """Append one alert, opening and closing the file."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a") as file:
+            file.write(f"---\nTo: client@pixell.com\nSubject: ALERT\nMessage: {message}\n---\n")
+
+class QueuedEmailer(Observer):
+    """Hands each alert to a notification dispatcher."""
+
+    def __init__(self, dispatcher: NotificationDispatcher) -> None:
+        """Initialize with the dispatcher that delivers the alerts."""
+        self.dispatcher = dispatcher
+
+    def update(self, message: str) -> None:
+        """Queue one alert."""
+        self.dispatcher.dispatch("client@pixell.com", "ALERT", message)
+
+def run(observer: Observer, count: int) -> float:
+    """Alternates large deposits and withdrawals and returns the seconds spent in them."""
+    account = ChequingAccount("1", "1001", 50000.0, date(2023, 1, 1), -100.0, 0.05)
+    account.attach(observer)
+    start = time.perf_counter()
+    for _ in range(count // 2):
+        account.deposit(20000.0)
+        account.withdraw(20000.0)
+    return time.perf_counter() - start
+
+def main():
+    """Compare inline delivery with the dispatcher, writing to a temporary email file."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "output", "observer_emails.txt")
+        inline = run(InlineEmailer(path), count)
+
+        def append_batch(notifications):
+            with open(path, "a") as file:
+                file.write("".join(f"---\nTo: {notification.email_address}\nSubject: {notification.subject}\n"
+                                   f"Message: {notification.message}\n---\n" for notification in notifications))
+
+        dispatcher = NotificationDispatcher(append_batch)
+        queued = run(QueuedEmailer(dispatcher), count)
+        start = time.perf_counter()
+        dispatcher.shutdown()
+        drained = time.perf_counter() - start
+
+    print(f"{count:,} large transactions")
+    print(f"inline delivery: {inline:.3f}s in transactions ({1e6 * inline / count:.1f}us each)")
+    print(f"dispatcher:      {queued:.3f}s in transactions ({1e6 * queued / count:.1f}us each), "
+          f"{drained:.3f}s more to drain at shutdown")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Description: Compares the list of observers accounts used to keep with the weak, topic-indexed ObserverRegistry.
+Usage:
+    python -m benchmarks.observer_registry [observer_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import sys
+import time
+from patterns.observer.observer import Observer
+from patterns.observer.observer_registry import LARGE_TRANSACTION, ObserverRegistry
+
+class ObserverList:
+    """The previous BankAccount observer list: membership tests and list.remove."""
+
+    def __init__(self) -> None:
+        """Initialize with no observers."""
+        self.observers = []
+
+    def attach(self, observer, topics=None) -> None:
+        """Append an observer unless it is already in the list."""
+        if observer not in self.observers:
+            self.observers.append(observer)
+
+    def detach(self, observer) -> None:
+        """Remove an observer if it is in the list."""
+        if observer in self.observers:
+            self.observers.remove(observer)
+
+    def notify(self, message: str, topic: str = None) -> None:
+        """Send the message to every observer."""
+        for observer in self.observers:
+            observer.update(message)
+
+class LargeTransactionWatcher(Observer):
+    """Observer that only cares about large transactions, counting the ones it sees."""
+
+    def __init__(self) -> None:
+        """Initialize the count."""
+        self.count = 0
+
+    def update(self, message: str) -> None:
+        """Count large transaction messages and ignore the rest."""
+        if message.startswith("Large transaction"):
+            self.count += 1
+
+def churn(registry, observers: list) -> float:
+    """Attaches then detaches every observer and returns the seconds taken."""
+    start = time.perf_counter()
+    for observer in observers:
+        registry.attach(observer)
+    for observer in observers:
+        registry.detach(observer)
+    return time.perf_counter() - start
+
+def fan_out(registry, observers: list, interested: int, count: int) -> float:
+    """Notifies count low balance warnings with a few large transaction watchers attached."""
+    for position, observer in enumerate(observers):
+        registry.attach(observer, None if position < interested else [LARGE_TRANSACTION])
+    start = time.perf_counter()
+    for _ in range(count):
+        registry.notify("Low balance warning $50.00: on account CHK123", "low_balance")
+    return time.perf_counter() - start
+
+def main():
+    """Report attach/detach churn and topic fan-out for both implementations."""
+    observer_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    observers = [LargeTransactionWatcher() for _ in range(observer_count)]
+    print(f"attach and detach {observer_count:,} observers")
+    for label, factory in (("list", ObserverList), ("ObserverRegistry", ObserverRegistry)):
+        print(f"  {label}: {churn(factory(), observers):.3f}s")
+
+    watchers = observers[:1000]
+    print("10,000 low balance warnings to 1,000 observers, 10 of them subscribed to every topic")
+    for label, factory in (("list", ObserverList), ("ObserverRegistry", ObserverRegistry)):
+        print(f"  {label}: {fan_out(factory(), watchers, 10, 10_000):.3f}s")
+
+if __name__ == "__main__":
+    main()
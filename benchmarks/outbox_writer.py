@@ -0,0 +1,55 @@
+"""
+Description: Compares per-email open/append with the buffered OutboxWriter at 100k messages.
+Usage:
+    python -m benchmarks.outbox_writer [message_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import os
+import sys
+import tempfile
+import time
+from utility.outbox_writer import OutboxWriter
+
+def send_email_per_open(path: str, email_address: str, subject: str, message: str) -> None:
+    """The previous simulate_send_email: resolve the directory and open the file for every email."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a") as file:
+        file.write(f"---\nTo: {email_address}\nSubject: {subject}\nMessage: {message}\n---\n")
+
+def main():
+    """Write the same low balance alerts with each approach and report messages per second."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    messages = [(f"client{number % 1000}@pixell.com", "ALERT: Unusual Activity",
+                 f"Low balance warning $42.00: on account {100000 + number}") for number in range(count)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        path = os.path.join(directory, "per_open", "observer_emails.txt")
+        start = time.perf_counter()
+        for message in messages:
+            send_email_per_open(path, *message)
+        results["open/append per email"] = (time.perf_counter() - start, os.path.getsize(path))
+
+        for label, options in (("OutboxWriter", {}),
+                               ("OutboxWriter, 1 MiB gzip segments", {"segment_bytes": 1024 * 1024,
+                                                                      "compress": True})):
+            path = os.path.join(directory, label.replace(" ", "_").replace(",", ""), "observer_emails.txt")
+            start = time.perf_counter()
+            with OutboxWriter(path, **options) as outbox:
+                for message in messages:
+                    outbox.write(*message)
+            elapsed = time.perf_counter() - start
+            size = sum(os.path.getsize(os.path.join(os.path.dirname(path), name))
+                       for name in os.listdir(os.path.dirname(path)))
+            results[label] = (elapsed, size)
+
+    baseline = results["open/append per email"][0]
+    print(f"{count:,} messages")
+    for label, (elapsed, size) in results.items():
+        print(f"{label}: {elapsed:.3f}s ({count / elapsed:,.0f} messages/s, {baseline / elapsed:.1f}x), "
+              f"{size / 1024 / 1024:.1f} MiB on disk")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Description: Compares the wall time of serial and multi-process loading in manage_data.load_data.
+The CPU time of the parent process is reported too: the parent only wraps the validated
+columns the workers return, so its share bounds the parallel load once the workers have CPUs
+of their own. With a single CPU they share it with the parent and the pool only adds overhead.
+Usage:
+    python -m benchmarks.parallel_load [account_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import os
+import sys
+import tempfile
+import time
+from benchmarks.synthetic_data import write_synthetic_data
+from user_interface import manage_data
+
+def timed_load(workers: int = None) -> tuple[int, float, float]:
+    """Returns (accounts, wall seconds, parent CPU seconds) for one load_data call."""
+    start, start_cpu = time.perf_counter(), time.process_time()
+    _, accounts = manage_data.load_data(workers=workers)
+    return len(accounts), time.perf_counter() - start, time.process_time() - start_cpu
+
+def main():
+    """Time the serial load and load_data with 2, 4 and 8 workers over synthetic files."""
+    account_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    with tempfile.TemporaryDirectory() as directory:
+        manage_data.clients_csv_path, manage_data.accounts_csv_path = write_synthetic_data(directory, account_count)
+        manage_data.accounts_journal_path = os.path.join(directory, "accounts.journal")
+
+        count, serial, serial_cpu = timed_load()
+        print(f"{cpus} CPU(s) available")
+        print(f"serial: {count:,} accounts in {serial:.2f}s ({serial_cpu:.2f}s CPU)")
+        best = None
+        for workers in (2, 4, 8):
+            count, elapsed, parent_cpu = timed_load(workers)
+            best = min(best or elapsed, elapsed)
+            print(f"parallel, {workers} workers: {count:,} accounts in {elapsed:.2f}s "
+                  f"({serial / elapsed:.2f}x the serial speed), {parent_cpu:.2f}s CPU in the parent")
+
+    verdict = "faster" if best < serial else "slower"
+    print(f"best parallel load: {best:.2f}s, {verdict} than the serial {serial:.2f}s")
+    if cpus < 2:
+        print("the workers share the only CPU with the parent, so the pool cannot pay off here")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Description: Writes synthetic clients.csv and accounts.csv files for the benchmarks.
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import csv
+import os
+import random
+from datetime import date, timedelta
+
+ACCOUNT_FIELDS = ["account_number", "client_number", "balance", "date_created", "account_type",
+                  "overdraft_limit", "overdraft_rate", "minimum_balance", "management_fee"]
+
+def write_synthetic_data(directory: str, account_count: int, client_count: int = 1000, seed: int = 1) -> tuple[str, str]:
+    """Writes clients.csv and accounts.csv with the given number of rows.
+
+    Args:
+        directory (str): The directory to write the files to.
+        account_count (int): The number of accounts to write.
+        client_count (int): The number of clients to write.
+        seed (int): The random seed, so runs are repeatable.
+
+    Returns:
+        tuple: The paths of (clients.csv, accounts.csv).
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    clients_path = os.path.join(directory, "clients.csv")
+    accounts_path = os.path.join(directory, "accounts.csv")
+
+    with open(clients_path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["client_number", "first_name", "last_name", "email_address"])
+        for number in range(1, client_count + 1):
+            writer.writerow([1000 + number, f"First{number}", f"Last{number}", f"client{number}@pixell.com"])
+
+    first_day = date(2015, 1, 1)
+    with open(accounts_path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(ACCOUNT_FIELDS)
+        for number in range(account_count):
+            created = first_day + timedelta(days=rng.randrange(3650))
+            row = [str(100000 + number), str(1001 + rng.randrange(client_count)),
+                   f"{rng.uniform(-500, 50000):.2f}", created.isoformat()]
+            kind = number % 3
+            if kind == 0:
+                row += ["ChequingAccount", f"{-rng.randrange(50, 1000)}", f"{rng.uniform(0.01, 0.08):.3f}", "Null", "Null"]
+            elif kind == 1:
+                row += ["SavingsAccount", "Null", "Null", str(rng.randrange(10, 100)), "Null"]
+            else:
+                row += ["InvestmentAccount", "Null", "Null", "Null", f"{rng.uniform(0.5, 5):.2f}"]
+            writer.writerow(row)
+
+    return (clients_path, accounts_path)
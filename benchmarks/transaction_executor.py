@@ -0,0 +1,46 @@
+"""
+Description: Measures TransactionExecutor throughput for different worker counts.
+Usage:
+    python -m benchmarks.transaction_executor [transfer_count] [account_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import os
+import random
+import sys
+import tempfile
+import time
+from benchmarks.synthetic_data import write_synthetic_data
+from services.transaction_executor import TransactionExecutor
+from user_interface import manage_data
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+def main():
+    """Run the same random transfers with each worker count, persisting to the journal."""
+    transfer_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    account_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    with tempfile.TemporaryDirectory() as directory:
+        manage_data.clients_csv_path, manage_data.accounts_csv_path = write_synthetic_data(directory, account_count)
+        manage_data.accounts_journal_path = os.path.join(directory, "accounts.journal")
+        rng = random.Random(9)
+        numbers = [str(100000 + number) for number in range(account_count)]
+        transfers = [(rng.choice(numbers), rng.choice(numbers), round(rng.uniform(1, 100), 2))
+                     for _ in range(transfer_count)]
+
+        print(f"{transfer_count:,} transfers over {account_count:,} accounts, journaled")
+        for workers in WORKER_COUNTS:
+            _, accounts = manage_data.load_data()
+            total = sum(account.balance for account in accounts.values())
+            start = time.perf_counter()
+            with TransactionExecutor(accounts, workers=workers) as executor:
+                for source, target, amount in transfers:
+                    executor.transfer(source, target, amount)
+            elapsed = time.perf_counter() - start
+            assert abs(sum(account.balance for account in accounts.values()) - total) < 1e-6
+            manage_data.compact_journal()
+            print(f"{workers} workers: {elapsed:.2f}s ({transfer_count / elapsed:,.0f} transfers/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Description: Load generator for the transaction server with thousands of concurrent clients.
+Usage:
+    python -m benchmarks.transaction_server [client_count] [requests_per_client] [address]
+
+Without an address, a server is started in this process over synthetic accounts, so the
+server and its clients share one core. With an address (a port or a Unix socket path), the
+load is sent to a server that is already running; its accounts must include 100000-100999.
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from benchmarks.synthetic_data import write_synthetic_data
+from services.transaction_client import TransactionClient
+from services.transaction_server import TransactionServer
+from user_interface import manage_data
+
+ACCOUNT_COUNT = 1_000
+# Requests each client keeps in flight on its connection.
+PIPELINE_DEPTH = 4
+
+async def run_client(connect, requests: int, seed: int, latencies: list) -> int:
+    """Sends a mix of lookups, deposits and withdrawals, and returns the number rejected."""
+    rng = random.Random(seed)
+    rejected = 0
+    async with await connect() as client:
+        async def one_request():
+            nonlocal rejected
+            number = str(100000 + rng.randrange(ACCOUNT_COUNT))
+            kind = rng.random()
+            start = time.perf_counter()
+            try:
+                if kind < 0.4:
+                    await client.lookup(number)
+                elif kind < 0.7:
+                    await client.deposit(number, round(rng.uniform(1, 100), 2))
+                else:
+                    await client.withdraw(number, round(rng.uniform(1, 100), 2))
+            except ValueError:
+                rejected += 1
+            latencies.append(time.perf_counter() - start)
+
+        for first in range(0, requests, PIPELINE_DEPTH):
+            await asyncio.gather(*(one_request() for _ in range(min(PIPELINE_DEPTH, requests - first))))
+    return rejected
+
+async def generate_load(connect, client_count: int, requests_per_client: int) -> None:
+    """Runs the clients at once and prints the throughput and latency percentiles."""
+    latencies = []
+    start = time.perf_counter()
+    rejected = await asyncio.gather(*(run_client(connect, requests_per_client, seed, latencies)
+                                      for seed in range(client_count)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    total = len(latencies)
+    print(f"{client_count:,} clients, {total:,} requests ({sum(rejected):,} rejected) in {elapsed:.2f}s: "
+          f"{total / elapsed:,.0f} requests/s")
+    print("latency p50 {:.1f}ms p99 {:.1f}ms max {:.1f}ms".format(
+        *(1000 * latencies[min(total - 1, int(total * share))] for share in (0.5, 0.99, 1.0))))
+
+async def main():
+    """Generates load against a running server, or against one started here."""
+    client_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    requests_per_client = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    address = sys.argv[3] if len(sys.argv) > 3 else None
+    if address is not None:
+        path = None if address.isdigit() else address
+        port = int(address) if path is None else None
+        await generate_load(lambda: TransactionClient.connect(port=port, path=path), client_count, requests_per_client)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        manage_data.clients_csv_path, manage_data.accounts_csv_path = write_synthetic_data(directory, ACCOUNT_COUNT)
+        manage_data.accounts_journal_path = os.path.join(directory, "accounts.journal")
+        server = TransactionServer.from_data()
+        path = os.path.join(directory, "transactions.sock")
+        await server.start(path=path)
+        try:
+            await generate_load(lambda: TransactionClient.connect(path=path), client_count, requests_per_client)
+        finally:
+            await server.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
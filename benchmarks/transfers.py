@@ -0,0 +1,52 @@
+"""
+Description: Compares a payroll fan-out made of separate withdrawals and deposits with transfer_many.
+Usage:
+    python -m benchmarks.transfers [payee_count]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import os
+import sys
+import tempfile
+import time
+from bank_account.bank_account import transfer_many
+from benchmarks.synthetic_data import write_synthetic_data
+from user_interface import manage_data
+
+PAYER = "100000"
+
+def main():
+    """Pay every other account from one account, persisting to the journal."""
+    payee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    with tempfile.TemporaryDirectory() as directory:
+        manage_data.clients_csv_path, manage_data.accounts_csv_path = write_synthetic_data(directory, payee_count + 1)
+        manage_data.accounts_journal_path = os.path.join(directory, "accounts.journal")
+
+        _, accounts = manage_data.load_data()
+        payer = accounts[PAYER]
+        payer.deposit(payee_count * 10.0)
+        payees = [account for number, account in accounts.items() if number != PAYER]
+        start = time.perf_counter()
+        for payee in payees:
+            payer.withdraw(10.0)
+            manage_data.update_data(payer, journaled=True)
+            payee.deposit(10.0)
+            manage_data.update_data(payee, journaled=True)
+        separate = time.perf_counter() - start
+        manage_data.compact_journal()
+
+        _, accounts = manage_data.load_data()
+        payer = accounts[PAYER]
+        payer.deposit(payee_count * 10.0)
+        payees = [account for number, account in accounts.items() if number != PAYER]
+        start = time.perf_counter()
+        manage_data.update_many(transfer_many(payer, [(payee, 10.0) for payee in payees]), journaled=True)
+        bulk = time.perf_counter() - start
+
+        print(f"{payee_count:,} payees, journaled")
+        print(f"withdraw + deposit per payee: {separate:.3f}s")
+        print(f"transfer_many + update_many:  {bulk:.3f}s ({separate / bulk:.0f}x faster)")
+
+if __name__ == "__main__":
+    main()
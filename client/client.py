@@ -1,5 +1,5 @@
 from patterns.observer.observer import Observer
-from utility.file_utils import simulate_send_email
+from patterns.observer import notification_dispatcher
 from datetime import datetime
 import re
 
@@ -59,10 +59,14 @@ class Client(Observer):
         return self._email_address
 
     def update(self, message: str) -> None:
-        """Update the client with a notification message."""
+        """Update the client with a notification message.
+
+        The email is queued on the shared notification dispatcher and sent by its worker, so
+        the transaction that raised the notification does not wait for it.
+        """
         subject = f"ALERT: Unusual Activity: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         email_message = f"Notification for {self._client_number}: {self._first_name} {self._last_name}: {message}"
-        simulate_send_email(self._email_address, subject, email_message)
+        notification_dispatcher.dispatch(self._email_address, subject, email_message)
 
     def __eq__(self, other: object) -> bool:
         """Check equality based on client number."""
@@ -70,6 +74,10 @@ class Client(Observer):
             return False
         return self._client_number == other._client_number
 
+    def __hash__(self) -> int:
+        """Hash on the client number, consistent with equality."""
+        return hash(self._client_number)
+
     def __lt__(self, other: object) -> bool:
         """Compare clients based on client number for less than."""
         if not isinstance(other, Client):
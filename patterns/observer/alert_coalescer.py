@@ -0,0 +1,118 @@
+import atexit
+import threading
+import weakref
+from patterns.observer.observer import Observer
+# Imported so the dispatcher's exit hook is registered first and runs after _flush_coalescers.
+from patterns.observer import notification_dispatcher
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+# Seconds alerts are gathered before a digest is sent.
+DEFAULT_WINDOW = 60.0
+
+class AlertCoalescer(Observer):
+    """Gathers the alerts meant for one observer and forwards them as a single digest.
+
+    Attach one coalescer to each of a client's accounts instead of the client itself. The
+    first alert starts a window; alerts raised during the window are grouped by kind and
+    account, so a hundred low balance warnings on one account become one line carrying the
+    latest warning and how often it fired. When the window ends, the wrapped observer gets
+    one update: the alert unchanged if it was the only one, or else a digest of every group
+    in the order they first fired. Accounts only hold their observers weakly, so keep a
+    reference to the coalescer while it is attached. Coalescers still holding alerts are
+    flushed at exit.
+
+    Attributes:
+        __observer (Observer): The observer that receives the digests, such as a Client.
+        __window (float): Seconds alerts are gathered, or None to hold them until flush.
+        __pending (dict): The latest message and count for each (kind, account) group.
+        __timer (threading.Timer): The scheduled end of the current window, if any.
+        __lock (threading.Lock): Guards the pending alerts and the timer.
+    """
+
+    def __init__(self, observer: Observer, window: float = DEFAULT_WINDOW) -> None:
+        """Initialize the coalescer for an observer.
+
+        Args:
+            observer (Observer): The observer that receives the digests.
+            window (float): Seconds alerts are gathered after the first one, or None to
+                hold them until flush is called.
+        """
+        self.__observer = observer
+        self.__window = window
+        self.__pending = {}
+        self.__timer = None
+        self.__lock = threading.Lock()
+        _coalescers.add(self)
+
+    @property
+    def observer(self) -> Observer:
+        """Get the observer that receives the digests."""
+        return self.__observer
+
+    def update(self, message: str) -> None:
+        """Add an alert to the current window, starting the window if needed.
+
+        Args:
+            message (str): The alert raised by the account.
+        """
+        key = _alert_key(message)
+        with self.__lock:
+            group = self.__pending.get(key)
+            if group is None:
+                self.__pending[key] = [message, 1]
+            else:
+                group[0] = message
+                group[1] += 1
+            if self.__window is not None and self.__timer is None:
+                self.__timer = threading.Timer(self.__window, self.flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+    def flush(self) -> None:
+        """End the current window and forward its alerts to the observer."""
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            groups, self.__pending = list(self.__pending.values()), {}
+        if not groups:
+            return
+        if len(groups) == 1 and groups[0][1] == 1:
+            self.__observer.update(groups[0][0])
+        else:
+            self.__observer.update(format_digest(groups))
+
+def format_digest(groups) -> str:
+    """Return the digest message for a window of grouped alerts.
+
+    Args:
+        groups (iterable): [message, count] for each group, in the order they first fired.
+
+    Returns:
+        str: The alerts as one message, such as
+            "3 alerts: Low balance warning $50.00: on account CHK123 (x2); Large ...".
+    """
+    total = 0
+    lines = []
+    for message, count in groups:
+        total += count
+        lines.append(message if count == 1 else f"{message} (x{count})")
+    return f"{total} alerts: " + "; ".join(lines)
+
+def _alert_key(message: str):
+    """Returns the group of an alert: its kind and account, or the message if it has no amount."""
+    kind, dollar, rest = message.partition(" $")
+    if not dollar:
+        return message
+    return kind, rest.rpartition(": ")[2]
+
+# Every live coalescer, so the alerts they hold are not lost at exit.
+_coalescers = weakref.WeakSet()
+
+@atexit.register
+def _flush_coalescers() -> None:
+    """Forwards the alerts still held by any coalescer when the interpreter exits."""
+    for coalescer in list(_coalescers):
+        coalescer.flush()
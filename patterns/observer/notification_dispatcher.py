@@ -0,0 +1,192 @@
+import atexit
+import logging
+import queue
+import threading
+from typing import NamedTuple
+from utility.file_utils import simulate_send_emails
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+# Notifications waiting for the worker before dispatch applies back-pressure.
+DEFAULT_QUEUE_SIZE = 10000
+# The most notifications handed to the sink in one call.
+DELIVERY_BATCH_SIZE = 512
+
+class Notification(NamedTuple):
+    """An email notification waiting to be delivered.
+
+    Attributes:
+        email_address (str): The recipient.
+        subject (str): The subject line.
+        message (str): The body of the email.
+    """
+    email_address: str
+    subject: str
+    message: str
+
+class NotificationDispatcher:
+    """Delivers notifications from a bounded queue on a background worker thread.
+
+    dispatch only queues the notification, so observers do not pay the cost of delivery
+    inside a transaction. The worker hands whatever has queued up to the sink in batches.
+    When the queue is full, dispatch blocks until the worker makes room, which slows the
+    producers down to the rate the sink can take; if room does not appear within the
+    timeout, the notification is delivered on the calling thread instead of being dropped.
+    Notifications dispatched after shutdown are also delivered on the calling thread.
+
+    Attributes:
+        __sink (callable): Called with a list of Notification to deliver them.
+        __timeout (float): Seconds dispatch waits for room in a full queue, or None to wait forever.
+        __queue (queue.Queue): The notifications waiting for the worker, and None to stop it.
+        __stopped (bool): Whether shutdown has been called.
+        __putting (int): The dispatch calls between checking __stopped and queueing their notification.
+        __lock (threading.Lock): Guards __stopped and __putting; never held while dispatch waits for room.
+        __idle (threading.Condition): Signalled on __lock when the last dispatch in __putting is done,
+            so shutdown only queues the stop after every notification that was let in.
+        __worker (threading.Thread): Delivers the queued notifications.
+    """
+
+    def __init__(self, sink=simulate_send_emails, maxsize: int = DEFAULT_QUEUE_SIZE,
+                 timeout: float = None) -> None:
+        """Starts the worker thread.
+
+        Args:
+            sink (callable): Delivers a list of Notification. Defaults to writing them to the
+                simulated email file through its buffered outbox writer.
+            maxsize (int): The number of notifications that may wait before dispatch blocks.
+            timeout (float): Seconds dispatch waits for room in a full queue before delivering
+                on the calling thread, or None to wait as long as it takes.
+        """
+        self.__sink = sink
+        self.__timeout = timeout
+        self.__queue = queue.Queue(maxsize)
+        self.__stopped = False
+        self.__putting = 0
+        self.__lock = threading.Lock()
+        self.__idle = threading.Condition(self.__lock)
+        self.__worker = threading.Thread(target=self.__deliver, name="notification-dispatcher", daemon=True)
+        self.__worker.start()
+
+    def dispatch(self, email_address: str, subject: str, message: str) -> None:
+        """Queues a notification for delivery.
+
+        Args:
+            email_address (str): The recipient.
+            subject (str): The subject line.
+            message (str): The body of the email.
+        """
+        notification = Notification(email_address, subject, message)
+        with self.__lock:
+            stopped = self.__stopped
+            if not stopped:
+                self.__putting += 1
+        if not stopped:
+            # Wait for room without the lock, so a full queue does not hold up the other callers.
+            try:
+                self.__queue.put(notification, timeout=self.__timeout)
+                return
+            except queue.Full:
+                pass
+            finally:
+                with self.__lock:
+                    self.__putting -= 1
+                    if not self.__putting:
+                        self.__idle.notify_all()
+        self.__send([notification])
+
+    def flush(self) -> None:
+        """Waits until every notification dispatched so far has been delivered."""
+        self.__queue.join()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the worker once it has delivered every queued notification.
+
+        Args:
+            wait (bool): If True, wait for the queued notifications to be delivered.
+        """
+        with self.__lock:
+            if self.__stopped:
+                return
+            self.__stopped = True
+            self.__idle.wait_for(lambda: not self.__putting)
+            self.__queue.put(None)
+        if wait:
+            self.__worker.join()
+
+    def __enter__(self) -> 'NotificationDispatcher':
+        """Returns the dispatcher for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Shuts the dispatcher down when the with block exits."""
+        self.shutdown()
+
+    def __deliver(self) -> None:
+        """Delivers queued notifications in batches until shutdown."""
+        stopping = False
+        while not stopping:
+            batch = [self.__queue.get()]
+            while len(batch) < DELIVERY_BATCH_SIZE:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = None in batch
+            try:
+                self.__send([notification for notification in batch if notification is not None])
+            finally:
+                for _ in batch:
+                    self.__queue.task_done()
+
+    def __send(self, notifications: list) -> None:
+        """Hands notifications to the sink, logging any failure."""
+        if not notifications:
+            return
+        try:
+            self.__sink(notifications)
+        except Exception as e:
+            logging.error(f"Unable to deliver {len(notifications)} notifications: {str(e)}")
+
+# The dispatcher used by dispatch(), created on first use.
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+def get_dispatcher() -> NotificationDispatcher:
+    """Returns the shared dispatcher, starting one with the default sink on first use.
+
+    The shared dispatcher is flushed and shut down when the interpreter exits.
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = NotificationDispatcher()
+    return _dispatcher
+
+def set_dispatcher(dispatcher: NotificationDispatcher) -> NotificationDispatcher:
+    """Replaces the shared dispatcher, such as with one using a different sink.
+
+    The previous dispatcher is returned still running; shut it down to flush it.
+
+    Args:
+        dispatcher (NotificationDispatcher): The new shared dispatcher, or None to start a
+            default one on next use.
+
+    Returns:
+        NotificationDispatcher: The previous shared dispatcher, or None.
+    """
+    global _dispatcher
+    with _dispatcher_lock:
+        previous, _dispatcher = _dispatcher, dispatcher
+    return previous
+
+def dispatch(email_address: str, subject: str, message: str) -> None:
+    """Queues a notification on the shared dispatcher."""
+    get_dispatcher().dispatch(email_address, subject, message)
+
+@atexit.register
+def _shutdown_dispatcher() -> None:
+    """Delivers the notifications still queued on the shared dispatcher at exit."""
+    if _dispatcher is not None:
+        _dispatcher.shutdown()
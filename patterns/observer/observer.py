@@ -6,6 +6,8 @@ __version__ = "1.1.0"
 class Observer(ABC):
     """Abstract base class for observers in the Observer Pattern."""
 
+    __slots__ = ()
+
     @abstractmethod
     def update(self, message: str) -> None:
         """Update the observer with a message."""
@@ -14,9 +16,11 @@ class Observer(ABC):
 class Subject(ABC):
     """Abstract base class for subjects in the Observer Pattern."""
 
+    __slots__ = ()
+
     @abstractmethod
-    def attach(self, observer: 'Observer') -> None:
-        """Add an observer to the list."""
+    def attach(self, observer: 'Observer', topics=None) -> None:
+        """Add an observer, optionally only for some topics."""
         pass
 
     @abstractmethod
@@ -25,6 +29,6 @@ class Subject(ABC):
         pass
 
     @abstractmethod
-    def notify(self, message: str) -> None:
-        """Notify all observers of a change."""
+    def notify(self, message: str, topic: str = None) -> None:
+        """Notify the observers subscribed to the topic of a change."""
         pass
\ No newline at end of file
@@ -0,0 +1,109 @@
+import weakref
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+# Topic of the notification sent when a balance falls below the low balance level.
+LOW_BALANCE = "low_balance"
+# Topic of the notification sent for a transaction above the large transaction threshold.
+LARGE_TRANSACTION = "large_transaction"
+# Topic of the notification sent when transactions come faster than a velocity rule allows.
+VELOCITY = "velocity"
+# Topic of the notification sent when the amount moved in a window passes a rule's limit.
+CUMULATIVE_AMOUNT = "cumulative_amount"
+TOPICS = frozenset((LOW_BALANCE, LARGE_TRANSACTION, VELOCITY, CUMULATIVE_AMOUNT))
+
+class ObserverRegistry:
+    """The observers of a subject, held by weak reference and indexed by topic.
+
+    Observers are kept in an insertion-ordered dictionary of weak references, so attach and
+    detach take constant time and an observer that is no longer referenced anywhere else is
+    dropped instead of being kept alive by the subjects it watched. Whoever attaches an
+    observer must therefore hold on to it for as long as it should be notified.
+
+    An observer can subscribe to every notification or only to some topics. The observers of
+    each topic are worked out on the first notification after a change and kept, so notify
+    only visits the observers interested in the topic. A notification without a topic goes
+    to every observer. Observers are notified in the order they were attached. Observers must
+    be hashable and weakly referenceable; equal observers count as the same one.
+
+    Attributes:
+        __observers (dict): The topics of each observer, keyed by a weak reference to it,
+            with None for observers of every topic.
+        __targets (dict): The weak references to notify for each topic, and for None, built
+            on demand and cleared whenever the observers change.
+        __discard (callable): Removes the reference of an observer that has been collected.
+    """
+
+    __slots__ = ('__observers', '__targets', '__discard', '__weakref__')
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self.__observers = {}
+        self.__targets = {}
+        registry = weakref.ref(self)
+
+        def discard(reference: weakref.ref) -> None:
+            """Drops a collected observer, unless the registry itself is gone."""
+            self = registry()
+            if self is not None:
+                self.__observers.pop(reference, None)
+                self.__targets.clear()
+
+        self.__discard = discard
+
+    def attach(self, observer, topics=None) -> None:
+        """Subscribe an observer.
+
+        Attaching an observer again does nothing unless its topics change, in which case it
+        is subscribed anew and moves to the end of the notification order.
+
+        Args:
+            observer (Observer): The observer to attach.
+            topics (iterable): The topics the observer is notified of, such as LOW_BALANCE,
+                or None for every notification.
+        """
+        topics = None if topics is None else frozenset(topics)
+        reference = weakref.ref(observer, self.__discard)
+        if reference in self.__observers:
+            if self.__observers[reference] == topics:
+                return
+            del self.__observers[reference]
+        self.__observers[reference] = topics
+        self.__targets.clear()
+
+    def detach(self, observer) -> None:
+        """Unsubscribe an observer, if it is attached.
+
+        Args:
+            observer (Observer): The observer to detach.
+        """
+        reference = weakref.ref(observer)
+        if reference in self.__observers:
+            del self.__observers[reference]
+            self.__targets.clear()
+
+    def notify(self, message: str, topic: str = None) -> None:
+        """Send a message to the observers subscribed to its topic.
+
+        Args:
+            message (str): The message to send.
+            topic (str): The topic of the message, or None to send it to every observer.
+        """
+        targets = self.__targets.get(topic)
+        if targets is None:
+            targets = self.__targets[topic] = tuple(
+                reference for reference, topics in self.__observers.copy().items()
+                if topic is None or topics is None or topic in topics)
+        for reference in targets:
+            observer = reference()
+            if observer is not None:
+                observer.update(message)
+
+    def __len__(self) -> int:
+        """Returns the number of attached observers."""
+        return len(self.__observers)
+
+    def __contains__(self, observer) -> bool:
+        """Returns whether an observer is attached."""
+        return weakref.ref(observer) in self.__observers
@@ -1,4 +1,5 @@
 from abc import ABC
+from patterns.observer.observer_registry import ObserverRegistry
 
 __author__ = "Md Apurba Khan"
 __version__ = "1.6.0"
@@ -7,21 +8,21 @@ class Subject(ABC):
     """Abstract base class for subjects in the Observer Pattern.
 
     Attributes:
-        _observers (list): The list of observers attached to the subject.
+        _observers (ObserverRegistry): The observers attached to the subject, held by weak reference.
     """
 
     def __init__(self):
-        """Initialize the subject with an empty list of observers."""
-        self._observers = []
+        """Initialize the subject with no observers."""
+        self._observers = ObserverRegistry()
 
-    def attach(self, observer):
+    def attach(self, observer, topics=None):
         """Attach an observer to the subject.
 
         Args:
             observer (Observer): The observer to be added.
+            topics (iterable): The topics to notify it of, or None for every notification.
         """
-        if observer not in self._observers:
-            self._observers.append(observer)
+        self._observers.attach(observer, topics)
 
     def detach(self, observer):
         """Detach an observer from the subject.
@@ -29,14 +30,13 @@ class Subject(ABC):
         Args:
             observer (Observer): The observer to be removed.
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
+        self._observers.detach(observer)
 
-    def notify(self, message):
-        """Notify all observers of a state change.
+    def notify(self, message, topic=None):
+        """Notify the observers subscribed to a topic of a state change.
 
         Args:
-            message (str): The message to be sent to all observers.
+            message (str): The message to be sent to the observers.
+            topic (str): The topic of the message, or None to notify every observer.
         """
-        for observer in self._observers:
-            observer.update(message)
\ No newline at end of file
+        self._observers.notify(message, topic)
\ No newline at end of file
@@ -1,23 +1,75 @@
+from array import array
 from .service_charge_strategy import ServiceChargeStrategy
 from bank_account.bank_account import BankAccount
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+import time
 
 __author__ = "Md Apurba Khan"
 __version__ = "1.4.0"
 
+class _YearsBeforeToday:
+    """Class attribute that evaluates to the date a number of years before today.
+
+    The date is worked out again after every local midnight, so a long-running process
+    never uses a stale cutoff, while other accesses only cost a clock read.
+    """
+
+    __slots__ = ('__period', '__date', '__expires')
+
+    def __init__(self, years: float) -> None:
+        """Initialize with the number of years, counted as 365.25 days each."""
+        self.__period = timedelta(days=years * 365.25)
+        self.__date = None
+        self.__expires = 0.0
+
+    def __get__(self, instance, owner) -> date:
+        """Return the date the period before today."""
+        if time.time() >= self.__expires:
+            today = date.today()
+            self.__date = today - self.__period
+            self.__expires = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+        return self.__date
+
 class ManagementFeeStrategy(ServiceChargeStrategy):
     """Strategy for calculating service charges for investment accounts."""
 
-    TEN_YEARS_AGO = date.today() - timedelta(days=10 * 365.25)
+    __slots__ = ('__management_fee', '__account_open_date')
+
+    # Accounts opened on or before this date have the management fee waived.
+    TEN_YEARS_AGO = _YearsBeforeToday(10)
 
     def __init__(self, management_fee: float, account_open_date: date) -> None:
         """Initialize the ManagementFeeStrategy with specific attributes."""
         self.__management_fee = management_fee
         self.__account_open_date = account_open_date
 
+    def cutoff(self) -> date:
+        """Return the waiver cutoff, which moves forward every day."""
+        return self.TEN_YEARS_AGO
+
     def calculate_service_charges(self, account: BankAccount) -> float:
         """Calculate service charges for the investment account."""
         service_charge = self.BASE_SERVICE_CHARGE
         if self.__account_open_date > self.TEN_YEARS_AGO:
             service_charge += self.__management_fee
-        return service_charge
\ No newline at end of file
+        return service_charge
+
+    @classmethod
+    def calculate_many(cls, balances, params: dict) -> array:
+        """Calculate the service charges of many investment accounts at once.
+
+        The charge does not depend on the balance, so balances only sets the batch length.
+
+        Args:
+            balances (sequence of float): The balance of each account.
+            params (dict): "management_fee" and "account_open_date" (date) sequences, one
+                per account.
+
+        Returns:
+            array: The service charge of each account (float64).
+        """
+        base = cls.BASE_SERVICE_CHARGE
+        ten_years_ago = cls.TEN_YEARS_AGO
+        return array("d", [base + fee if opened > ten_years_ago else base
+                           for _, fee, opened in zip(balances, params["management_fee"],
+                                                     params["account_open_date"])])
\ No newline at end of file
@@ -1,3 +1,4 @@
+from array import array
 from .service_charge_strategy import ServiceChargeStrategy
 from bank_account.bank_account import BankAccount
 
@@ -7,6 +8,8 @@ __version__ = "1.4.0"
 class MinimumBalanceStrategy(ServiceChargeStrategy):
     """Strategy for calculating service charges for savings accounts."""
 
+    __slots__ = ('__minimum_balance',)
+
     SERVICE_CHARGE_PREMIUM = 2.0
 
     def __init__(self, minimum_balance: float) -> None:
@@ -18,4 +21,20 @@ class MinimumBalanceStrategy(ServiceChargeStrategy):
         service_charge = self.BASE_SERVICE_CHARGE
         if account.balance < self.__minimum_balance:
             service_charge *= self.SERVICE_CHARGE_PREMIUM
-        return service_charge
\ No newline at end of file
+        return service_charge
+
+    @classmethod
+    def calculate_many(cls, balances, params: dict) -> array:
+        """Calculate the service charges of many savings accounts at once.
+
+        Args:
+            balances (sequence of float): The balance of each account.
+            params (dict): A "minimum_balance" sequence, one per account.
+
+        Returns:
+            array: The service charge of each account (float64).
+        """
+        base = cls.BASE_SERVICE_CHARGE
+        premium = base * cls.SERVICE_CHARGE_PREMIUM
+        return array("d", [premium if balance < minimum_balance else base
+                           for balance, minimum_balance in zip(balances, params["minimum_balance"])])
\ No newline at end of file
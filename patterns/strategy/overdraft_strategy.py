@@ -1,3 +1,4 @@
+from array import array
 from .service_charge_strategy import ServiceChargeStrategy
 from bank_account.bank_account import BankAccount
 
@@ -7,6 +8,8 @@ __version__ = "1.2.0"
 class OverdraftStrategy(ServiceChargeStrategy):
     """Strategy for calculating service charges for chequing accounts with overdraft."""
 
+    __slots__ = ('__overdraft_rate', '__overdraft_limit')
+
     def __init__(self, overdraft_rate: float, overdraft_limit: float) -> None:
         """Initialize the OverdraftStrategy with specific attributes."""
         self.__overdraft_rate = overdraft_rate
@@ -19,4 +22,19 @@ class OverdraftStrategy(ServiceChargeStrategy):
         if balance < 0:
             overdraft_amount = abs(balance)
             service_charge += overdraft_amount * self.__overdraft_rate
-        return service_charge
\ No newline at end of file
+        return service_charge
+
+    @classmethod
+    def calculate_many(cls, balances, params: dict) -> array:
+        """Calculate the service charges of many chequing accounts at once.
+
+        Args:
+            balances (sequence of float): The balance of each account.
+            params (dict): "overdraft_rate" and "overdraft_limit" sequences, one per account.
+
+        Returns:
+            array: The service charge of each account (float64).
+        """
+        base = cls.BASE_SERVICE_CHARGE
+        return array("d", [base + -balance * rate if balance < 0 else base
+                           for balance, rate in zip(balances, params["overdraft_rate"])])
\ No newline at end of file
@@ -1,15 +1,94 @@
 from abc import ABC, abstractmethod
+from array import array
+import functools
 from bank_account.bank_account import BankAccount
 
 __author__ = "Md Apurba Khan"
 __version__ = "1.1.0"
 
+# The number of distinct strategy instances kept for sharing.
+STRATEGY_CACHE_SIZE = 65536
+
 class ServiceChargeStrategy(ABC):
-    """Abstract base class for service charge calculation strategies."""
+    """Abstract base class for service charge calculation strategies.
+
+    Strategies are immutable once constructed, so accounts with the same parameters can
+    share one instance through shared(). calculate_many() charges a whole batch of balances
+    at once; subclasses override it with a loop specialised to their rule. A strategy whose
+    charge depends on today's date overrides cutoff() so cached charges expire with it.
+    """
+
+    __slots__ = ()
 
     BASE_SERVICE_CHARGE = 0.50
 
+    @classmethod
+    def shared(cls, *args) -> 'ServiceChargeStrategy':
+        """Return a shared instance of the strategy for the given constructor arguments.
+
+        Args:
+            *args: The arguments the strategy is constructed with.
+
+        Returns:
+            ServiceChargeStrategy: An instance that may also be used by other accounts.
+        """
+        return _shared_strategy(cls, *args)
+
+    def __setattr__(self, name: str, value) -> None:
+        """Allow each attribute to be set once, so shared instances cannot be changed.
+
+        Raises:
+            AttributeError: If the attribute is already set.
+        """
+        if hasattr(self, name):
+            raise AttributeError(f"{type(self).__name__} is immutable.")
+        super().__setattr__(name, value)
+
+    def cutoff(self):
+        """Return the date-dependent input of the charge, such as a date cutoff.
+
+        Accounts cache their service charge and reuse it while their balance and this value
+        are unchanged.
+
+        Returns:
+            The value the charge depends on besides the account, or None if the charge only
+            depends on the account.
+        """
+        return None
+
     @abstractmethod
     def calculate_service_charges(self, account: BankAccount) -> float:
         """Calculate service charges based on the account."""
-        pass
\ No newline at end of file
+        pass
+
+    @classmethod
+    def calculate_many(cls, balances, params: dict) -> array:
+        """Calculate the service charges of many accounts at once.
+
+        This generic version calls calculate_service_charges on a shared instance per
+        account, so any strategy supports batches.
+
+        Args:
+            balances (sequence of float): The balance of each account.
+            params (dict): Maps each constructor argument name, in constructor order, to a
+                sequence with that argument for each account.
+
+        Returns:
+            array: The service charge of each account (float64).
+        """
+        return array("d", (cls.shared(*row).calculate_service_charges(_Balance(balance))
+                           for balance, *row in zip(balances, *params.values())))
+
+class _Balance:
+    """Stands in for an account where a strategy only needs the balance."""
+
+    __slots__ = ('balance',)
+
+    def __init__(self, balance: float) -> None:
+        """Initialize with the balance to charge."""
+        self.balance = balance
+
+@functools.lru_cache(maxsize=STRATEGY_CACHE_SIZE)
+def _shared_strategy(strategy_class: type, *args) -> ServiceChargeStrategy:
+    """Construct a strategy once per distinct class and arguments."""
+    return strategy_class(*args)
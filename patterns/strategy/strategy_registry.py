@@ -0,0 +1,84 @@
+from array import array
+from .service_charge_strategy import ServiceChargeStrategy
+from .management_fee_strategy import ManagementFeeStrategy
+from .minimum_balance_strategy import MinimumBalanceStrategy
+from .overdraft_strategy import OverdraftStrategy
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class StrategyRegistry:
+    """Registry of the service charge strategy and batch kernel for each account type.
+
+    Strategies are handed out as shared flyweights, one per distinct set of parameters.
+    A batch kernel is any callable taking (balances, params) and returning one charge per
+    balance, as ServiceChargeStrategy.calculate_many does; account types registered without
+    one use their strategy's calculate_many.
+
+    Attributes:
+        __strategies (dict): Maps an account type name to its strategy class.
+        __kernels (dict): Maps an account type name to its batch kernel.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self.__strategies = {}
+        self.__kernels = {}
+
+    def register(self, account_type: str, strategy_class: type, kernel=None) -> None:
+        """Register the strategy and batch kernel of an account type.
+
+        Args:
+            account_type (str): The account type name, such as "SavingsAccount".
+            strategy_class (type): A ServiceChargeStrategy subclass.
+            kernel (callable): The batch kernel. Defaults to strategy_class.calculate_many.
+
+        Raises:
+            TypeError: If strategy_class is not a ServiceChargeStrategy subclass.
+        """
+        if not (isinstance(strategy_class, type) and issubclass(strategy_class, ServiceChargeStrategy)):
+            raise TypeError("strategy_class must be a ServiceChargeStrategy subclass.")
+        self.__strategies[account_type] = strategy_class
+        self.__kernels[account_type] = kernel or strategy_class.calculate_many
+
+    def __contains__(self, account_type: str) -> bool:
+        """Returns True if the account type is registered."""
+        return account_type in self.__strategies
+
+    def strategy(self, account_type: str, *params) -> ServiceChargeStrategy:
+        """Return the shared strategy of an account type for the given parameters.
+
+        Args:
+            account_type (str): A registered account type name.
+            *params: The strategy's constructor arguments.
+
+        Returns:
+            ServiceChargeStrategy: A flyweight shared by every caller with equal parameters.
+
+        Raises:
+            KeyError: If the account type is not registered.
+        """
+        return self.__strategies[account_type].shared(*params)
+
+    def calculate_many(self, account_type: str, balances, params: dict) -> array:
+        """Calculate the service charges of many accounts of one type with its batch kernel.
+
+        Args:
+            account_type (str): A registered account type name.
+            balances (sequence of float): The balance of each account.
+            params (dict): Maps each strategy constructor argument name to a sequence with
+                that argument for each account.
+
+        Returns:
+            array: The service charge of each account (float64).
+
+        Raises:
+            KeyError: If the account type is not registered.
+        """
+        return self.__kernels[account_type](balances, params)
+
+# The registry used by the account store, with the built-in account types.
+strategy_registry = StrategyRegistry()
+strategy_registry.register("ChequingAccount", OverdraftStrategy)
+strategy_registry.register("SavingsAccount", MinimumBalanceStrategy)
+strategy_registry.register("InvestmentAccount", ManagementFeeStrategy)
@@ -0,0 +1,589 @@
+"""
+Description: Evaluates configurable alert rules, including velocity and cumulative amount rules, over the transaction stream.
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+from array import array
+import math
+import time
+from typing import NamedTuple
+from bank_account.bank_account import BankAccount, _validated_amounts
+from bank_account.fixed_point import to_cents
+from patterns.observer.observer_registry import CUMULATIVE_AMOUNT, LARGE_TRANSACTION, LOW_BALANCE, VELOCITY
+
+# Rule kinds.
+BALANCE_BELOW = "balance_below"
+AMOUNT_ABOVE = "amount_above"
+COUNT_ABOVE = "count_above"
+TOTAL_ABOVE = "total_above"
+
+# The transactions a rule looks at.
+WITHDRAWALS = -1
+DEPOSITS = 1
+ANY = 0
+
+# How each direction is described in alert messages: (plural noun, past participle).
+_DIRECTION_WORDS = {WITHDRAWALS: ("withdrawals", "Withdrawn"), DEPOSITS: ("deposits", "Deposited"),
+                    ANY: ("transactions", "Moved")}
+# Entries a new window ring buffer has room for before it grows.
+_INITIAL_CAPACITY = 8
+
+class AlertRule(NamedTuple):
+    """A condition checked after every transaction, built with one of the rule functions.
+
+    A rule can be limited to an account type, a client or both. When several rules share a
+    name, each account uses the most specific one that applies to it: client and type first,
+    then client, then type, then the rule for everyone. This is how per-type and per-client
+    thresholds override the general ones.
+
+    Attributes:
+        name (str): The rule name, shared by the rules that override each other.
+        kind (str): BALANCE_BELOW, AMOUNT_ABOVE, COUNT_ABOVE or TOTAL_ABOVE.
+        threshold (float): The balance level, amount, number of transactions or total amount.
+        window (float): The seconds a COUNT_ABOVE or TOTAL_ABOVE rule looks back, else None.
+        direction (int): WITHDRAWALS, DEPOSITS or ANY.
+        topic (str): The observer topic the alert is sent under.
+        account_type (str): The account type name the rule is limited to, or None.
+        client_number (str): The client number the rule is limited to, or None.
+    """
+    name: str
+    kind: str
+    threshold: float
+    window: float
+    direction: int
+    topic: str
+    account_type: str = None
+    client_number: str = None
+
+class Alert(NamedTuple):
+    """An alert raised by a rule.
+
+    Attributes:
+        position (int): The position of the transaction in its batch, or None for a single
+            transaction.
+        account_number (str): The account the transaction was applied to.
+        rule (str): The name of the rule.
+        topic (str): The observer topic of the alert.
+        message (str): The notification sent to the account's observers.
+    """
+    position: int
+    account_number: str
+    rule: str
+    topic: str
+    message: str
+
+class RuleResult(NamedTuple):
+    """The outcome of applying a batch of transactions with an AlertRuleEngine.
+
+    Attributes:
+        rejections (list): (position, message) for each rejected transaction, by position.
+        alerts (list): The Alert raised by each accepted transaction, by position.
+    """
+    rejections: list
+    alerts: list
+
+def _finite(value: float) -> float:
+    """Returns value as a float, raising ValueError unless it is a finite number."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("Threshold must be a valid number.")
+    if not math.isfinite(value):
+        raise ValueError("Threshold must be a finite number.")
+    return value
+
+def _window(window: float) -> float:
+    """Returns window as a float, raising ValueError unless it is a positive number of seconds."""
+    try:
+        window = float(window)
+    except (TypeError, ValueError):
+        raise ValueError("Window must be a number of seconds.")
+    if not window > 0 or not math.isfinite(window):
+        raise ValueError("Window must be a positive number of seconds.")
+    return window
+
+def _direction(direction: int) -> int:
+    """Returns direction, raising ValueError unless it is WITHDRAWALS, DEPOSITS or ANY."""
+    if direction not in _DIRECTION_WORDS:
+        raise ValueError("Direction must be WITHDRAWALS, DEPOSITS or ANY.")
+    return direction
+
+def balance_below(level: float, name: str = "low_balance", account_type: str = None,
+                  client_number: str = None) -> AlertRule:
+    """Return a rule that fires when a transaction leaves the balance below a level.
+
+    Args:
+        level (float): The balance level.
+        name (str): The rule name.
+        account_type (str): Limits the rule to an account type, such as "SavingsAccount".
+        client_number (str): Limits the rule to one client's accounts.
+
+    Returns:
+        AlertRule: The rule, sent under the LOW_BALANCE topic.
+
+    Raises:
+        ValueError: If level is not a finite number.
+    """
+    return AlertRule(name, BALANCE_BELOW, _finite(level), None, ANY, LOW_BALANCE, account_type, client_number)
+
+def amount_above(amount: float, name: str = "large_transaction", direction: int = ANY,
+                 account_type: str = None, client_number: str = None) -> AlertRule:
+    """Return a rule that fires on a transaction larger than an amount.
+
+    Args:
+        amount (float): The amount a transaction must exceed.
+        name (str): The rule name.
+        direction (int): WITHDRAWALS, DEPOSITS or ANY.
+        account_type (str): Limits the rule to an account type.
+        client_number (str): Limits the rule to one client's accounts.
+
+    Returns:
+        AlertRule: The rule, sent under the LARGE_TRANSACTION topic.
+
+    Raises:
+        ValueError: If amount is not a finite number or direction is not valid.
+    """
+    return AlertRule(name, AMOUNT_ABOVE, _finite(amount), None, _direction(direction), LARGE_TRANSACTION,
+                     account_type, client_number)
+
+def count_above(count: int, window: float, name: str = "velocity", direction: int = WITHDRAWALS,
+                account_type: str = None, client_number: str = None) -> AlertRule:
+    """Return a velocity rule: more than count transactions within window seconds.
+
+    Args:
+        count (int): The number of transactions allowed in the window.
+        window (float): The length of the window in seconds.
+        name (str): The rule name.
+        direction (int): WITHDRAWALS, DEPOSITS or ANY.
+        account_type (str): Limits the rule to an account type.
+        client_number (str): Limits the rule to one client's accounts.
+
+    Returns:
+        AlertRule: The rule, sent under the VELOCITY topic.
+
+    Raises:
+        ValueError: If count is not a non-negative integer or window is not positive.
+    """
+    if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+        raise ValueError("Count must be a non-negative integer.")
+    return AlertRule(name, COUNT_ABOVE, count, _window(window), _direction(direction), VELOCITY,
+                     account_type, client_number)
+
+def total_above(total: float, window: float, name: str = "cumulative_amount", direction: int = WITHDRAWALS,
+                account_type: str = None, client_number: str = None) -> AlertRule:
+    """Return a cumulative amount rule: more than total moved within window seconds.
+
+    Args:
+        total (float): The amount allowed in the window.
+        window (float): The length of the window in seconds.
+        name (str): The rule name.
+        direction (int): WITHDRAWALS, DEPOSITS or ANY.
+        account_type (str): Limits the rule to an account type.
+        client_number (str): Limits the rule to one client's accounts.
+
+    Returns:
+        AlertRule: The rule, sent under the CUMULATIVE_AMOUNT topic.
+
+    Raises:
+        ValueError: If total is not a finite number or window is not positive.
+    """
+    return AlertRule(name, TOTAL_ABOVE, _finite(total), _window(window), _direction(direction), CUMULATIVE_AMOUNT,
+                     account_type, client_number)
+
+# The two checks BankAccount.update_balance makes, as rules.
+DEFAULT_RULES = (balance_below(BankAccount.LOW_BALANCE_LEVEL),
+                 amount_above(BankAccount.LARGE_TRANSACTION_THRESHOLD))
+
+class CompiledRules:
+    """The rules that apply to one account type and client, arranged for evaluation.
+
+    Attributes:
+        rules (tuple): The AlertRule that apply, one per rule name.
+        balance_rules (tuple): The BALANCE_BELOW rules.
+        amount_rules (tuple): (rule, sign) for the AMOUNT_ABOVE rules, where sign is the
+            direction the amount must have, or 0 for either.
+        streams (tuple): (direction, count rules, total rules) for each direction that
+            velocity or cumulative rules look at; the total rules carry their limit in cents.
+    """
+
+    __slots__ = ('rules', 'balance_rules', 'amount_rules', 'streams')
+
+    def __init__(self, rules: tuple) -> None:
+        """Arrange the rules that apply to an account.
+
+        Args:
+            rules (tuple): The AlertRule that apply, one per rule name.
+        """
+        self.rules = rules
+        self.balance_rules = tuple(rule for rule in rules if rule.kind == BALANCE_BELOW)
+        self.amount_rules = tuple((rule, rule.direction) for rule in rules if rule.kind == AMOUNT_ABOVE)
+        streams = []
+        for direction in (WITHDRAWALS, DEPOSITS, ANY):
+            counts = tuple(rule for rule in rules if rule.kind == COUNT_ABOVE and rule.direction == direction)
+            totals = tuple((rule, to_cents(rule.threshold)) for rule in rules
+                           if rule.kind == TOTAL_ABOVE and rule.direction == direction)
+            if counts or totals:
+                streams.append((direction, counts, totals))
+        self.streams = tuple(streams)
+
+class _Window:
+    """The recent transactions of one account in one direction, in a growable ring buffer.
+
+    Entries are addressed by their sequence number; an entry lives at sequence & mask. Each
+    total rule keeps the sequence number of the oldest entry inside its window and the sum of
+    the entries from there on, so every transaction costs constant time per rule.
+    """
+
+    __slots__ = ('times', 'cents', 'mask', 'start', 'end', 'keep', 'tails', 'sums')
+
+    def __init__(self, counts: tuple, totals: tuple) -> None:
+        """Initialize an empty window for a stream's count and total rules."""
+        self.times = array('d', bytes(8 * _INITIAL_CAPACITY))
+        self.cents = array('q', bytes(8 * _INITIAL_CAPACITY))
+        self.mask = _INITIAL_CAPACITY - 1
+        self.start = 0
+        self.end = 0
+        self.keep = max((rule.threshold + 1 for rule in counts), default=0)
+        self.tails = [0] * len(totals)
+        self.sums = [0] * len(totals)
+
+    def add(self, timestamp: float, cents: int, counts: tuple, totals: tuple) -> list:
+        """Record a transaction and return (rule, total cents) for each rule it breaks."""
+        if self.end - self.start > self.mask:
+            self.grow()
+        times = self.times
+        mask = self.mask
+        times[self.end & mask] = timestamp
+        self.cents[self.end & mask] = cents
+        self.end += 1
+
+        fired = []
+        for rule in counts:
+            earliest = self.end - 1 - rule.threshold
+            if earliest >= self.start and timestamp - times[earliest & mask] < rule.window:
+                fired.append((rule, None))
+        start = self.end - self.keep
+        for number, (rule, limit) in enumerate(totals):
+            tail = self.tails[number]
+            total = self.sums[number] + cents
+            horizon = timestamp - rule.window
+            while times[tail & mask] <= horizon:
+                total -= self.cents[tail & mask]
+                tail += 1
+            self.tails[number] = tail
+            self.sums[number] = total
+            if tail < start:
+                start = tail
+            if total > limit:
+                fired.append((rule, total))
+        if start > self.start:
+            self.start = start
+        return fired
+
+    def newest(self) -> float:
+        """Returns the timestamp of the latest transaction in the window."""
+        return self.times[(self.end - 1) & self.mask]
+
+    def grow(self) -> None:
+        """Doubles the capacity, keeping every entry at its sequence number."""
+        capacity = 2 * (self.mask + 1)
+        mask = capacity - 1
+        times = array('d', bytes(8 * capacity))
+        cents = array('q', bytes(8 * capacity))
+        for sequence in range(self.start, self.end):
+            times[sequence & mask] = self.times[sequence & self.mask]
+            cents[sequence & mask] = self.cents[sequence & self.mask]
+        self.times, self.cents, self.mask = times, cents, mask
+
+class AlertRuleEngine:
+    """Evaluates a fixed set of alert rules over the transactions posted to accounts.
+
+    The rules are compiled once per account type and client, on first use, into the few
+    checks that apply, so evaluating a transaction only visits its own account's rules.
+    Velocity and cumulative amount rules keep a sliding window per account and direction in
+    a compact ring buffer of timestamps and amounts in cents. Alerts are sent to the
+    account's observers under the rule's topic.
+
+    Post transactions through the engine, with post or apply_transactions, so its rules
+    replace the low balance and large transaction checks built into the accounts: these
+    apply the transactions without the built-in notifications. Transactions made with
+    deposit, withdraw or update_balance have already sent the built-in ones.
+
+    Each account's transactions must be evaluated in time order, and not from two threads at
+    once; the TransactionExecutor's per-account locks provide this when the engine is called
+    from inside an operation. The windows of an account are dropped once its latest
+    transaction is older than the longest rule window, measured from the latest timestamp
+    the engine has seen, so timestamps should come from one clock.
+
+    Attributes:
+        __rules (tuple): The AlertRule the engine evaluates.
+        __compiled (dict): Maps (account_type, client_number) to CompiledRules.
+        __windows (dict): Maps an account_number to the _Window of each of its streams.
+        __clock (callable): Returns the current time in seconds.
+        __longest (float): The longest window of any rule, or None without windowed rules.
+        __latest (float): The latest timestamp evaluated by a windowed rule.
+        __next_prune (float): The timestamp from which the next evaluation drops stale windows.
+    """
+
+    def __init__(self, rules=DEFAULT_RULES, clock=time.time) -> None:
+        """Initialize the engine.
+
+        Args:
+            rules (iterable): The AlertRule to evaluate. Defaults to the two checks that
+                BankAccount.update_balance makes.
+            clock (callable): Returns the time of transactions given no timestamp.
+
+        Raises:
+            TypeError: If a rule is not an AlertRule.
+        """
+        self.__rules = tuple(rules)
+        if not all(isinstance(rule, AlertRule) for rule in self.__rules):
+            raise TypeError("Rules must be AlertRule instances.")
+        self.__compiled = {}
+        self.__windows = {}
+        self.__clock = clock
+        self.__longest = max((rule.window for rule in self.__rules if rule.window is not None), default=None)
+        self.__latest = -math.inf
+        self.__next_prune = -math.inf
+
+    @property
+    def rules(self) -> tuple:
+        """Get the rules the engine evaluates."""
+        return self.__rules
+
+    @property
+    def windowed_accounts(self) -> int:
+        """Get the number of accounts whose recent transactions are kept for windowed rules."""
+        return len(self.__windows)
+
+    def compile(self, account_type: str, client_number: str) -> CompiledRules:
+        """Return the rules that apply to an account type and client.
+
+        Args:
+            account_type (str): The account type name, such as "ChequingAccount".
+            client_number (str): The client number.
+
+        Returns:
+            CompiledRules: The compiled rules, shared by every account of the type and client.
+        """
+        key = (account_type, client_number)
+        compiled = self.__compiled.get(key)
+        if compiled is None:
+            chosen = {}
+            for rule in self.__rules:
+                if rule.account_type not in (None, account_type) or rule.client_number not in (None, client_number):
+                    continue
+                specificity = 2 * (rule.client_number is not None) + (rule.account_type is not None)
+                current = chosen.get(rule.name)
+                if current is None or specificity >= current[0]:
+                    chosen[rule.name] = (specificity, rule)
+            compiled = self.__compiled[key] = CompiledRules(tuple(rule for _, rule in chosen.values()))
+        return compiled
+
+    def post(self, account: BankAccount, amount: float, timestamp: float = None) -> list:
+        """Apply one transaction to an account and evaluate the rules for it.
+
+        The transaction is checked against the account's withdrawal limit like deposit and
+        withdraw, but only the engine's alerts are sent, not the account's built-in ones.
+
+        Args:
+            account (BankAccount): The account.
+            amount (float): The signed amount, positive for a deposit.
+            timestamp (float): When the transaction happened, in seconds. Defaults to now.
+
+        Returns:
+            list: The Alert raised, in rule order.
+
+        Raises:
+            ValueError: If the amount is not a valid non-zero number or the withdrawal would
+                break the account's limit; the account is unchanged.
+        """
+        amounts = _validated_amounts([amount])
+        rejections, _ = account._apply_amounts(amounts)
+        if rejections:
+            raise ValueError(rejections[0][1])
+        return self.evaluate(account, amounts[0], timestamp)
+
+    def evaluate(self, account: BankAccount, amount: float, timestamp: float = None, notify: bool = True) -> list:
+        """Evaluate the rules for one transaction that has just been applied to an account.
+
+        The transaction must have been applied without the account's built-in notifications,
+        as BankAccount._apply_amounts does, or the alerts are sent twice; post does both.
+
+        Args:
+            account (BankAccount): The account, already holding the transaction's balance.
+            amount (float): The signed amount of the transaction.
+            timestamp (float): When the transaction happened, in seconds. Defaults to now.
+            notify (bool): If True, send the alerts to the account's observers.
+
+        Returns:
+            list: The Alert raised, in rule order.
+        """
+        alerts = self.evaluate_many(account, [float(amount)], [account.balance],
+                                    [self.__clock() if timestamp is None else timestamp], notify)
+        return [alert._replace(position=None) for alert in alerts]
+
+    def evaluate_many(self, account: BankAccount, amounts: list, balances: list, timestamps: list = None,
+                      notify: bool = True, positions: list = None) -> list:
+        """Evaluate the rules for a run of transactions applied to one account, in order.
+
+        Args:
+            account (BankAccount): The account the transactions were applied to.
+            amounts (list): The signed float amount of each transaction.
+            balances (list): The balance after each transaction.
+            timestamps (list): When each transaction happened, in seconds. Defaults to now
+                for all of them.
+            notify (bool): If True, send the alerts to the account's observers afterwards.
+            positions (list): The position to report for each transaction. Defaults to its
+                index in amounts.
+
+        Returns:
+            list: The Alert raised, by transaction and then rule order.
+        """
+        compiled = self.compile(account.account_type, account.client_number)
+        account_number = account.account_number
+        if timestamps is None:
+            timestamps = [self.__clock()] * len(amounts)
+        if positions is None:
+            positions = range(len(amounts))
+        alerts = []
+
+        for rule in compiled.balance_rules:
+            level = rule.threshold
+            for index, balance in enumerate(balances):
+                if balance < level:
+                    alerts.append((index, Alert(positions[index], account_number, rule.name, rule.topic,
+                                                f"Low balance warning ${balance:,.2f}: on account {account_number}")))
+        for rule, sign in compiled.amount_rules:
+            limit = rule.threshold
+            for index, amount in enumerate(amounts):
+                if (amount > limit or amount < -limit) and (sign == 0 or (amount > 0) == (sign > 0)):
+                    alerts.append((index, Alert(positions[index], account_number, rule.name, rule.topic,
+                                                f"Large transaction ${abs(amount):,.2f}: on account {account_number}")))
+
+        if compiled.streams:
+            windows = self.__windows.get(account_number)
+            if windows is None:
+                windows = self.__windows[account_number] = [_Window(counts, totals)
+                                                            for _, counts, totals in compiled.streams]
+            for window, (direction, counts, totals) in zip(windows, compiled.streams):
+                noun, participle = _DIRECTION_WORDS[direction]
+                for index, amount in enumerate(amounts):
+                    if direction and (amount > 0) != (direction > 0):
+                        continue
+                    for rule, total in window.add(timestamps[index], to_cents(abs(amount)), counts, totals):
+                        if total is None:
+                            message = (f"More than {rule.threshold} {noun} within {_duration(rule.window)}: "
+                                       f"on account {account_number}")
+                        else:
+                            message = (f"{participle} ${total / 100:,.2f} within {_duration(rule.window)}: "
+                                       f"on account {account_number}")
+                        alerts.append((index, Alert(positions[index], account_number, rule.name, rule.topic,
+                                                    message)))
+
+            latest = max(timestamps, default=self.__latest)
+            if latest > self.__latest:
+                self.__latest = latest
+                if latest >= self.__next_prune:
+                    self.__prune()
+
+        if len(compiled.rules) > 1:
+            alerts.sort(key=_transaction_index)
+        alerts = [alert for _, alert in alerts]
+        if notify:
+            for alert in alerts:
+                account.notify(alert.message, alert.topic)
+        return alerts
+
+    def __prune(self) -> None:
+        """Drops the windows of accounts with no transaction within the longest rule window.
+
+        Runs at most once per longest window of time, so it costs constant time per
+        transaction on average.
+        """
+        horizon = self.__latest - self.__longest
+        self.__windows = {account_number: windows for account_number, windows in self.__windows.items()
+                          if any(window.newest() > horizon for window in windows)}
+        self.__next_prune = self.__latest + self.__longest
+
+    def apply_transactions(self, accounts: dict, transactions, timestamps: list = None) -> RuleResult:
+        """Apply (account_number, amount) transactions and evaluate the rules over them.
+
+        Transactions are validated and applied like bank_account.apply_transactions, except
+        that the notifications come from the engine's rules instead of the accounts' built-in
+        thresholds. The rules of each account are evaluated over all of its accepted
+        transactions at once, and the alerts are sent after every account has been updated.
+
+        Args:
+            accounts (dict): Maps account_number (str) to BankAccount.
+            transactions (iterable): (account_number, amount) pairs, with a positive amount for
+                a deposit and a negative amount for a withdrawal.
+            timestamps (list): When each transaction happened, in seconds. Defaults to now
+                for all of them.
+
+        Returns:
+            RuleResult: The rejected transactions and the alerts raised.
+
+        Raises:
+            ValueError: If any amount is not a valid non-zero number; nothing is applied.
+        """
+        transactions = list(transactions)
+        amounts = _validated_amounts(amount for _, amount in transactions)
+        if timestamps is None:
+            timestamps = [self.__clock()] * len(transactions)
+        batches = {}
+        rejections = []
+        for position, (account_number, _) in enumerate(transactions):
+            if account_number in accounts:
+                batches.setdefault(account_number, []).append(position)
+            else:
+                rejections.append((position, f"Account {account_number} not found."))
+
+        evaluated = []
+        for account_number, positions in batches.items():
+            account = accounts[account_number]
+            balance = account.balance
+            account_amounts = [amounts[position] for position in positions]
+            account_rejections, _ = account._apply_amounts(account_amounts)
+            rejected = set()
+            for index, message in account_rejections:
+                rejected.add(index)
+                rejections.append((positions[index], message))
+            accepted_positions = []
+            accepted_amounts = []
+            balances = []
+            for index, amount in enumerate(account_amounts):
+                if index not in rejected:
+                    balance += amount
+                    accepted_positions.append(positions[index])
+                    accepted_amounts.append(amount)
+                    balances.append(balance)
+            evaluated.append((account, self.evaluate_many(
+                account, accepted_amounts, balances, [timestamps[position] for position in accepted_positions],
+                notify=False, positions=accepted_positions)))
+
+        alerts = []
+        for account, account_alerts in evaluated:
+            for alert in account_alerts:
+                account.notify(alert.message, alert.topic)
+            alerts.extend(account_alerts)
+        rejections.sort()
+        alerts.sort(key=_alert_position)
+        return RuleResult(rejections, alerts)
+
+def _duration(seconds: float) -> str:
+    """Returns a window length for a message, such as "10 minutes"."""
+    for unit, size in (("hour", 3600), ("minute", 60)):
+        if seconds >= size and seconds % size == 0:
+            count = int(seconds // size)
+            return f"{count} {unit}{'' if count == 1 else 's'}"
+    return f"{seconds:g} seconds"
+
+def _transaction_index(item: tuple) -> int:
+    """Returns the transaction index of an (index, alert) pair."""
+    return item[0]
+
+def _alert_position(alert: Alert) -> int:
+    """Returns the batch position of an alert."""
+    return alert.position
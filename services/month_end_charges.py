@@ -0,0 +1,281 @@
+"""
+Description: Month-end service charge run over every account in accounts.csv.
+Usage:
+    python -m services.month_end_charges [period] [workers]
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import csv
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+import hashlib
+import json
+import logging
+import os
+import sys
+from typing import NamedTuple
+from bank_account.fixed_point import cents_to_text, to_cents
+from user_interface import manage_data
+
+LEDGER_FIELDS = ["account_number", "client_number", "account_type", "balance_before", "charge", "balance_after"]
+
+# Run states recorded in the manifest.
+CHARGING = "charging"
+POSTING = "posting"
+POSTED = "posted"
+
+# The valid client numbers, set once in each worker process.
+_client_numbers = None
+
+class MonthEndSummary(NamedTuple):
+    """The outcome of a month-end run.
+
+    Attributes:
+        period (str): The period the charges were run for, such as "2024-01".
+        accounts_charged (int): The number of accounts charged.
+        total_charges_cents (int): The sum of the charges, in cents.
+        shards (int): The number of shards the accounts were split into.
+        resumed_shards (int): The shards whose ledgers were kept from an interrupted run.
+    """
+    period: str
+    accounts_charged: int
+    total_charges_cents: int
+    shards: int
+    resumed_shards: int
+
+def run_month_end(period: str, workers: int = None, run_dir: str = None) -> MonthEndSummary:
+    """Charges every valid account its service charges and posts them to accounts.csv.
+
+    The journal is compacted first, then accounts.csv is split into line-aligned shards that
+    are charged in a process pool with each account's own service charge strategy. Every
+    shard writes its part of the charges ledger to the run directory; a finished ledger part
+    is the checkpoint for its shard. The charges are then posted as withdrawals by streaming
+    accounts.csv and the ledger into a new accounts.csv that atomically replaces the old one.
+    Unlike a customer withdrawal, a charge is always posted, even when it takes the balance
+    below the account's overdraft limit or minimum balance.
+
+    Running the same period again resumes an interrupted run: finished shards are not charged
+    again, and a run that already posted is not posted twice. Ledger balances are absolute, so
+    posting them again after a crash gives the same result. Balances must not be changed by
+    anything else while a run is in progress.
+
+    Args:
+        period (str): The period being charged, such as "2024-01". Names the run directory.
+        workers (int): The number of worker processes. Defaults to the number of CPUs.
+        run_dir (str): The directory for the manifest and ledger. Defaults to
+            data/month_end/<period>.
+
+    Returns:
+        MonthEndSummary: The totals of the run.
+
+    Raises:
+        RuntimeError: If the journal could not be folded into accounts.csv, the accounts
+            changed since an interrupted run started, or accounts.csv no longer matches the
+            ledger.
+        FileNotFoundError: If accounts.csv does not exist.
+    """
+    if manage_data.get_storage_backend() is not None:
+        raise RuntimeError("The month-end run reads and writes the CSV files, not a storage backend.")
+    workers = workers or os.cpu_count() or 1
+    run_dir = run_dir or os.path.join(manage_data.data_dir, 'month_end', period)
+    os.makedirs(run_dir, exist_ok=True)
+    manifest_path = os.path.join(run_dir, 'manifest.json')
+    manifest = _read_manifest(manifest_path)
+
+    if manifest is None:
+        if not manage_data.compact_journal() and (os.path.exists(manage_data.accounts_journal_path)
+                                                  or os.path.exists(manage_data._compacting_journal_path())):
+            raise RuntimeError("The journal could not be folded into accounts.csv; "
+                               f"the month-end run for {period} was not started.")
+        chunks = manage_data._line_aligned_chunks(manage_data.accounts_csv_path, workers)
+        if chunks is None:
+            raise FileNotFoundError(f"Account file {manage_data.accounts_csv_path} not found")
+        fieldnames, ranges = chunks
+        manifest = {"period": period, "state": CHARGING, "fieldnames": fieldnames, "ranges": ranges,
+                    "source": list(manage_data._snapshot_source_signature())}
+        _write_manifest(manifest_path, manifest)
+
+    if manifest["state"] == POSTED:
+        return _summary(manifest, resumed_shards=len(manifest["ranges"]))
+    if manifest["state"] == POSTING and _file_digest(manage_data.accounts_csv_path) == manifest["posted_digest"]:
+        # The new accounts.csv was installed before the run was interrupted.
+        manifest["state"] = POSTED
+        _write_manifest(manifest_path, manifest)
+        return _summary(manifest, resumed_shards=len(manifest["ranges"]))
+    if list(manage_data._snapshot_source_signature()) != manifest["source"]:
+        raise RuntimeError(f"Accounts changed since the month-end run for {period} started.")
+
+    ledger_paths = [_ledger_path(run_dir, shard) for shard in range(len(manifest["ranges"]))]
+    pending = [shard for shard, path in enumerate(ledger_paths) if not os.path.exists(path)]
+    resumed_shards = len(ledger_paths) - len(pending)
+    if pending:
+        client_numbers = {client.client_number for client in manage_data.iter_clients()}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(client_numbers,)) as executor:
+            shards = [manifest["ranges"][shard] for shard in pending]
+            results = executor.map(_charge_shard, [manage_data.accounts_csv_path] * len(pending),
+                              [manifest["fieldnames"]] * len(pending),
+                              [start for start, _ in shards], [end for _, end in shards],
+                              [ledger_paths[shard] for shard in pending])
+            for errors in results:
+                for error in errors:
+                    logging.error(error)
+
+    accounts_charged, total_charges_cents = _post_charges(ledger_paths, manifest, manifest_path)
+    manifest.update(state=POSTED, accounts_charged=accounts_charged, total_charges_cents=total_charges_cents)
+    _write_manifest(manifest_path, manifest)
+    return _summary(manifest, resumed_shards)
+
+def iter_ledger(run_dir: str):
+    """Yields the rows of a run's charges ledger in accounts.csv order.
+
+    Args:
+        run_dir (str): The directory of the run.
+
+    Yields:
+        dict: A ledger row keyed by LEDGER_FIELDS.
+    """
+    manifest = _read_manifest(os.path.join(run_dir, 'manifest.json'))
+    for shard in range(len(manifest["ranges"]) if manifest else 0):
+        with open(_ledger_path(run_dir, shard), newline='') as file:
+            yield from csv.DictReader(file)
+
+def _init_worker(client_numbers: set) -> None:
+    """Stores the valid client numbers in a worker process."""
+    global _client_numbers
+    _client_numbers = client_numbers
+
+def _charge_shard(path: str, fieldnames: list, start: int, end: int, ledger_path: str) -> list:
+    """Charges the accounts in one shard of accounts.csv and writes its ledger part.
+
+    Invalid rows are left uncharged, as load_data would skip them. The ledger part is written
+    beside its final name and renamed into place once it is complete.
+
+    Returns:
+        list: The error messages for the invalid rows, for the parent process to log.
+    """
+    errors = []
+    parsed = manage_data._parse_account_chunk(path, fieldnames, start, end, {})
+    temp_path = ledger_path + '.tmp'
+    with open(temp_path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(LEDGER_FIELDS)
+        for values, account in manage_data._build_accounts(parsed, _client_numbers, errors.append):
+            balance_before = to_cents(account.balance)
+            charge = to_cents(account.get_service_charges())
+            # Charges skip the withdrawal limits on purpose: the bank always collects them, so
+            # an account at or near its floor is charged into (or further into) the negative.
+            writer.writerow([account.account_number, account.client_number, values[4],
+                             cents_to_text(balance_before), cents_to_text(charge),
+                             cents_to_text(balance_before - charge)])
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, ledger_path)
+    return errors
+
+def _post_charges(ledger_paths: list, manifest: dict, manifest_path: str) -> tuple[int, int]:
+    """Writes the ledger balances into a new accounts.csv and installs it atomically.
+
+    The digest of the new file is recorded in the manifest before it replaces accounts.csv,
+    so a resumed run can tell whether the replacement already happened. The accounts are
+    checked against the manifest again while the journal is locked, so balances changed
+    since the ledger was written are never overwritten with stale ones.
+
+    Returns:
+        tuple: (accounts_charged, total_charges_cents).
+
+    Raises:
+        RuntimeError: If the accounts changed since the run started, or accounts.csv does
+            not contain every ledger row in order.
+    """
+    accounts_path = manage_data.accounts_csv_path
+    temp_path = accounts_path + '.tmp'
+    accounts_charged = 0
+    total_charges_cents = 0
+
+    with manage_data._compaction_lock, manage_data._journal_lock:
+        if list(manage_data._snapshot_source_signature()) != manifest["source"]:
+            raise RuntimeError(f"Accounts changed since the month-end run for {manifest['period']} started.")
+        ledger = _iter_ledger_files(ledger_paths)
+        pending = next(ledger, None)
+        with open(accounts_path, newline='') as source, open(temp_path, 'w', newline='') as target:
+            reader = csv.reader(source)
+            writer = csv.writer(target)
+            header = next(reader)
+            writer.writerow(header)
+            account_column = header.index('account_number')
+            balance_column = header.index('balance')
+            for row in reader:
+                if not row:
+                    continue
+                if pending is not None and row[account_column] == pending["account_number"]:
+                    row[balance_column] = pending["balance_after"]
+                    accounts_charged += 1
+                    total_charges_cents += to_cents(pending["charge"])
+                    pending = next(ledger, None)
+                writer.writerow(row)
+            target.flush()
+            os.fsync(target.fileno())
+        if pending is not None:
+            os.remove(temp_path)
+            raise RuntimeError(f"accounts.csv does not match the ledger at account {pending['account_number']}.")
+
+        manifest.update(state=POSTING, posted_digest=_file_digest(temp_path))
+        _write_manifest(manifest_path, manifest)
+        os.replace(temp_path, accounts_path)
+        manage_data._sync_directory(os.path.dirname(accounts_path))
+
+    logging.info(f"Month-end run {manifest['period']}: charged {accounts_charged} accounts "
+                 f"{cents_to_text(total_charges_cents)}")
+    return (accounts_charged, total_charges_cents)
+
+def _iter_ledger_files(ledger_paths: list):
+    """Yields the rows of the given ledger parts in order."""
+    for path in ledger_paths:
+        with open(path, newline='') as file:
+            yield from csv.DictReader(file)
+
+def _ledger_path(run_dir: str, shard: int) -> str:
+    """Returns the path of the ledger part of a shard."""
+    return os.path.join(run_dir, f'charges-{shard:05d}.csv')
+
+def _read_manifest(path: str):
+    """Returns the manifest of a run, or None if the run has not started."""
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+def _write_manifest(path: str, manifest: dict) -> None:
+    """Atomically replaces the manifest of a run."""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as file:
+        json.dump(manifest, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+def _file_digest(path: str) -> str:
+    """Returns the blake2b digest of a file, or None if it does not exist."""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+def _summary(manifest: dict, resumed_shards: int) -> MonthEndSummary:
+    """Builds the summary of a posted run from its manifest."""
+    return MonthEndSummary(manifest["period"], manifest["accounts_charged"], manifest["total_charges_cents"],
+                           len(manifest["ranges"]), resumed_shards)
+
+if __name__ == "__main__":
+    period = sys.argv[1] if len(sys.argv) > 1 else date.today().strftime("%Y-%m")
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    summary = run_month_end(period, workers)
+    print(f"{summary.period}: charged {summary.accounts_charged} accounts "
+          f"${cents_to_text(summary.total_charges_cents)} in {summary.shards} shards")
@@ -0,0 +1,163 @@
+"""
+Description: asyncio client for the JSON-lines transaction service in services.transaction_server.
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import asyncio
+import itertools
+import json
+from services.transaction_server import DEFAULT_HOST, DEFAULT_PORT, NOT_FOUND
+
+class TransactionClient:
+    """Connection to a transaction server that pipelines concurrent requests.
+
+    Any number of coroutines may call the client at once: every request is written as soon
+    as it is made and matched to its response by id, so a connection carries many requests
+    in flight.
+
+    Attributes:
+        __reader (asyncio.StreamReader): Reads the responses.
+        __writer (asyncio.StreamWriter): Writes the requests.
+        __ids (itertools.count): The ids given to requests.
+        __waiting (dict): Maps the id of each request in flight to its asyncio.Future.
+        __receiver (asyncio.Task): Reads responses and resolves their futures.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Initialize a client over an open connection. Use connect to open one.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's reader.
+            writer (asyncio.StreamWriter): The connection's writer.
+        """
+        self.__reader = reader
+        self.__writer = writer
+        self.__ids = itertools.count(1)
+        self.__waiting = {}
+        self.__receiver = asyncio.create_task(self.__receive())
+
+    @classmethod
+    async def connect(cls, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, path: str = None) -> 'TransactionClient':
+        """Connects to a transaction server over TCP, or over a Unix socket when a path is given.
+
+        Args:
+            host (str): The server address.
+            port (int): The server port.
+            path (str): The path of the server's Unix socket.
+
+        Returns:
+            TransactionClient: The connected client.
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def lookup(self, account_number: str) -> dict:
+        """Returns the description of an account.
+
+        Raises:
+            KeyError: If the account does not exist.
+        """
+        response = await self.request({"op": "lookup", "account_number": account_number})
+        return response["account"]
+
+    async def client_accounts(self, client_number: int) -> list:
+        """Returns the descriptions of every account of a client."""
+        response = await self.request({"op": "lookup", "client_number": client_number})
+        return response["accounts"]
+
+    async def deposit(self, account_number: str, amount: float) -> float:
+        """Deposits an amount into an account and returns the new balance once it is written.
+
+        Raises:
+            KeyError: If the account does not exist.
+            ValueError: If the deposit is rejected.
+        """
+        response = await self.request({"op": "deposit", "account_number": account_number, "amount": amount})
+        return response["account"]["balance"]
+
+    async def withdraw(self, account_number: str, amount: float) -> float:
+        """Withdraws an amount from an account and returns the new balance once it is written.
+
+        Raises:
+            KeyError: If the account does not exist.
+            ValueError: If the withdrawal is rejected.
+        """
+        response = await self.request({"op": "withdraw", "account_number": account_number, "amount": amount})
+        return response["account"]["balance"]
+
+    async def transfer(self, source_number: str, target_number: str, amount: float) -> tuple[float, float]:
+        """Moves an amount between two accounts and returns both new balances once they are written.
+
+        Raises:
+            KeyError: If either account does not exist.
+            ValueError: If the transfer is rejected.
+        """
+        response = await self.request({"op": "transfer", "account_number": source_number,
+                                       "target_account_number": target_number, "amount": amount})
+        source, target = response["accounts"]
+        return (source["balance"], target["balance"])
+
+    async def request(self, request: dict) -> dict:
+        """Sends a request and waits for its successful response.
+
+        Args:
+            request (dict): The request without an id.
+
+        Returns:
+            dict: The response.
+
+        Raises:
+            KeyError: If the server could not find the account.
+            ValueError: If the server rejected the request.
+            ConnectionError: If the connection closed before the response arrived.
+        """
+        request_id = next(self.__ids)
+        future = asyncio.get_running_loop().create_future()
+        self.__waiting[request_id] = future
+        self.__writer.write(json.dumps({"id": request_id, **request}).encode() + b"\n")
+        try:
+            await self.__writer.drain()
+        except ConnectionError:
+            self.__waiting.pop(request_id, None)
+            raise
+        response = await future
+        if not response["ok"]:
+            raise (KeyError if response["code"] == NOT_FOUND else ValueError)(response["error"])
+        return response
+
+    async def close(self) -> None:
+        """Closes the connection. Requests still in flight fail with ConnectionError."""
+        self.__writer.close()
+        try:
+            await self.__writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self.__receiver
+
+    async def __aenter__(self) -> 'TransactionClient':
+        """Returns the client for use in an async with statement."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Closes the connection when the async with block exits."""
+        await self.close()
+
+    async def __receive(self) -> None:
+        """Resolves the future of each response until the connection closes."""
+        try:
+            async for line in self.__reader:
+                response = json.loads(line)
+                future = self.__waiting.pop(response["id"], None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except ConnectionError:
+            pass
+        finally:
+            for future in self.__waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("The connection to the transaction server closed."))
+            self.__waiting.clear()
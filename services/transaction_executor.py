@@ -0,0 +1,197 @@
+"""
+Description: Runs account transactions concurrently in a thread pool with per-account locks.
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+import queue
+import threading
+from typing import NamedTuple
+from bank_account.bank_account import transfer_many
+from user_interface import manage_data
+
+class BalanceSnapshot(NamedTuple):
+    """The balance of an account at the moment a transaction finished.
+
+    It has the account_number and balance attributes that manage_data.update_many reads,
+    so the writer persists the balance the transaction produced rather than a later one.
+    """
+    account_number: str
+    balance: float
+
+class TransactionExecutor:
+    """Thread pool that applies transactions to accounts under per-account locks.
+
+    Every transaction names the accounts it touches and runs while holding their locks,
+    which are always taken in sorted account number order, so transactions over several
+    accounts cannot deadlock and no update to an account is lost. The resulting balances
+    are handed to a single writer thread, which persists them in order with
+    manage_data.update_many, gathering whatever has queued up into one write.
+
+    While an executor is running, its accounts must only be changed through it.
+
+    Attributes:
+        __accounts (dict): Maps account_number (str) to BankAccount.
+        __locks (dict): Maps account_number (str) to the account's threading.Lock.
+        __locks_guard (threading.Lock): Guards creating locks.
+        __pool (ThreadPoolExecutor): Runs the transactions.
+        __persist (bool): Whether balances are written by the writer thread.
+        __journaled (bool): Whether the writer appends to the journal instead of rewriting accounts.csv.
+        __writes (queue.Queue): Lists of BalanceSnapshot waiting to be written, or None to stop.
+        __writer (threading.Thread): The persistence writer.
+    """
+
+    def __init__(self, accounts: dict, workers: int = 4, persist: bool = True, journaled: bool = True) -> None:
+        """Starts the worker threads and the persistence writer.
+
+        Args:
+            accounts (dict): Maps account_number (str) to BankAccount.
+            workers (int): The number of worker threads.
+            persist (bool): If True, write every changed balance with manage_data.
+            journaled (bool): If True, the writer appends to the transaction journal.
+        """
+        self.__accounts = accounts
+        self.__locks = {}
+        self.__locks_guard = threading.Lock()
+        self.__pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transaction")
+        self.__persist = persist
+        self.__journaled = journaled
+        self.__writes = queue.Queue()
+        self.__writer = threading.Thread(target=self.__write_balances, name="transaction-writer", daemon=True)
+        self.__writer.start()
+
+    def submit(self, account_numbers, operation) -> Future:
+        """Runs an operation on some accounts while holding their locks.
+
+        Args:
+            account_numbers (iterable): The account numbers the operation changes.
+            operation (callable): Called with the accounts, in the order given, and returns
+                the result of the transaction. If it raises, the exception is set on the
+                future and nothing is persisted.
+
+        Returns:
+            Future: Resolves to the result of the operation.
+        """
+        account_numbers = list(account_numbers)
+        return self.__pool.submit(self.__run, account_numbers, operation)
+
+    def deposit(self, account_number: str, amount: float) -> Future:
+        """Deposits an amount into an account.
+
+        Returns:
+            Future: Resolves to the new balance, or raises the ValueError from deposit.
+        """
+        def deposit(account):
+            account.deposit(amount)
+            return account.balance
+        return self.submit([account_number], deposit)
+
+    def withdraw(self, account_number: str, amount: float) -> Future:
+        """Withdraws an amount from an account.
+
+        Returns:
+            Future: Resolves to the new balance, or raises the ValueError from withdraw.
+        """
+        def withdraw(account):
+            account.withdraw(amount)
+            return account.balance
+        return self.submit([account_number], withdraw)
+
+    def transfer(self, source_number: str, target_number: str, amount: float) -> Future:
+        """Moves an amount from one account to another with both accounts locked.
+
+        The transfer is made with BankAccount.transfer_to, so a rejected transfer changes
+        neither account, and both balances are written in the same journal record.
+
+        Returns:
+            Future: Resolves to None, or raises the ValueError from transfer_to.
+        """
+        def move(source, target):
+            source.transfer_to(target, amount)
+        return self.submit([source_number, target_number], move)
+
+    def transfer_many(self, source_number: str, transfers) -> Future:
+        """Moves amounts from one account to many others as one transaction.
+
+        Args:
+            source_number (str): The account the amounts are taken from.
+            transfers (iterable): (target account_number, amount) pairs.
+
+        Returns:
+            Future: Resolves to None, or raises the error from bank_account.transfer_many, in
+            which case no account changed.
+        """
+        transfers = list(transfers)
+        def move(source, *targets):
+            transfer_many(source, zip(targets, (amount for _, amount in transfers)))
+        return self.submit([source_number] + [number for number, _ in transfers], move)
+
+    def flush(self) -> None:
+        """Waits until every balance handed to the writer so far has been written."""
+        self.__writes.join()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops accepting transactions, then stops the writer once it has written everything.
+
+        Args:
+            wait (bool): If True, wait for the queued transactions and writes to finish.
+        """
+        self.__pool.shutdown(wait=wait)
+        self.__writes.put(None)
+        if wait:
+            self.__writer.join()
+
+    def __enter__(self) -> 'TransactionExecutor':
+        """Returns the executor for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Shuts the executor down when the with block exits."""
+        self.shutdown()
+
+    def __run(self, account_numbers: list, operation):
+        """Runs an operation in a worker thread with the accounts' locks held in sorted order."""
+        accounts = [self.__accounts[number] for number in account_numbers]
+        locks = [self.__lock_for(number) for number in sorted(set(account_numbers))]
+        for lock in locks:
+            lock.acquire()
+        try:
+            result = operation(*accounts)
+            if self.__persist:
+                # Queued while the locks are held, so each account's balances are written in order.
+                self.__writes.put([BalanceSnapshot(account.account_number, account.balance) for account in accounts])
+            return result
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def __lock_for(self, account_number: str) -> threading.Lock:
+        """Returns the lock of an account, creating it on first use."""
+        lock = self.__locks.get(account_number)
+        if lock is None:
+            with self.__locks_guard:
+                lock = self.__locks.setdefault(account_number, threading.Lock())
+        return lock
+
+    def __write_balances(self) -> None:
+        """Writes queued balances until shutdown, gathering everything queued into one write."""
+        stopping = False
+        while not stopping:
+            batches = [self.__writes.get()]
+            while True:
+                try:
+                    batches.append(self.__writes.get_nowait())
+                except queue.Empty:
+                    break
+            snapshots = [snapshot for batch in batches if batch is not None for snapshot in batch]
+            stopping = None in batches
+            try:
+                if snapshots:
+                    manage_data.update_many(snapshots, self.__journaled)
+            except Exception as e:
+                logging.error(f"Unable to write account balances: {str(e)}")
+            finally:
+                for _ in batches:
+                    self.__writes.task_done()
@@ -0,0 +1,439 @@
+"""
+Description: asyncio transaction service for account lookups, deposits and withdrawals.
+Usage:
+    python -m services.transaction_server [port | unix_socket_path]
+
+Clients send one JSON object per line and receive one JSON object per line, in order:
+    {"id": 1, "op": "lookup", "account_number": "20001"}
+    {"id": 2, "op": "lookup", "client_number": 1001}
+    {"id": 3, "op": "deposit", "account_number": "20001", "amount": 25.0}
+    {"id": 4, "op": "withdraw", "account_number": "20001", "amount": 10.0}
+    {"id": 5, "op": "transfer", "account_number": "20001", "target_account_number": "20002", "amount": 5.0}
+A successful response echoes the id with "ok": true and the account (or "accounts" for a
+client lookup or transfer, source first). A failed one has "ok": false, an "error" message and an error "code".
+"""
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+import math
+import sys
+from bank_account.bank_account import _transfer_many
+from services.transaction_executor import BalanceSnapshot
+from user_interface import manage_data
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# How long changed balances are gathered from every connection before they are written.
+COMMIT_WINDOW = 0.005
+# Responses a connection may have waiting to be sent before the server stops reading its requests.
+MAX_PENDING_RESPONSES = 1024
+# Connections waiting to be accepted. The asyncio default of 100 refuses bursts of clients.
+LISTEN_BACKLOG = 4096
+# Seconds close waits for a connection to send its last responses before dropping it.
+CLOSE_TIMEOUT = 5.0
+
+# Error codes of failed requests.
+INVALID_REQUEST = "invalid_request"
+NOT_FOUND = "not_found"
+REJECTED = "rejected"
+WRITE_FAILED = "write_failed"
+UNAVAILABLE = "unavailable"
+
+class TransactionServer:
+    """Serves lookups, deposits and withdrawals on loaded accounts over a JSON-lines socket.
+
+    Every connection is read continuously, so a client may pipeline requests without waiting
+    for their responses; each request is applied to its account as soon as it is read and
+    the responses are sent back in request order. Changed balances from every connection are
+    gathered for COMMIT_WINDOW seconds and written together with manage_data.update_many on a
+    single writer thread, and a deposit or withdrawal is only answered once its balance has
+    been written. Only one write is in progress at a time; balances changed meanwhile are
+    written as soon as it finishes. If a write fails, the balances it held are put back as
+    they were before its changes. All accounts are changed on the event loop thread, so no
+    locks are needed. Their notifications are sent on a separate notifier thread, in order,
+    so an observer that blocks, such as a client whose NotificationDispatcher queue is full,
+    does not stall the connections.
+
+    While a server is running, its accounts must only be changed through it.
+
+    Attributes:
+        __accounts (dict): Maps account_number (str) to BankAccount.
+        __index (ClientAccountIndex): Maps client numbers to their account numbers, or None.
+        __journaled (bool): Whether balances are appended to the journal instead of rewriting accounts.csv.
+        __commit_window (float): Seconds changed balances are gathered before they are written.
+        __writer (ThreadPoolExecutor): The single thread that runs the writes, in order.
+        __notifier (ThreadPoolExecutor): The single thread that sends account notifications, in order.
+        __pending (dict): Maps account_number (str) to (account, saved) for each account whose
+            balance is waiting to be written, where saved is its balance before those changes.
+        __commit (asyncio.Future): Resolves once the pending balances are written, or None.
+        __writing (asyncio.Task): The write in progress, or None.
+        __connections (dict): Maps the task serving each open connection to its StreamWriter.
+        __reading (set): The connection tasks still reading requests.
+        __closing (bool): True once close has been called; new requests are refused.
+        __server (asyncio.Server): The listening server once started.
+    """
+
+    def __init__(self, accounts: dict, index: manage_data.ClientAccountIndex = None, journaled: bool = True,
+                 commit_window: float = COMMIT_WINDOW) -> None:
+        """Initialize the server without listening yet.
+
+        Args:
+            accounts (dict): Maps account_number (str) to BankAccount.
+            index (ClientAccountIndex): Used to look up the accounts of a client. Client
+                lookups are rejected without one.
+            journaled (bool): If True, balances are appended to the transaction journal.
+            commit_window (float): Seconds changed balances are gathered before they are written.
+        """
+        self.__accounts = accounts
+        self.__index = index
+        self.__journaled = journaled
+        self.__commit_window = commit_window
+        self.__writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transaction-server-writer")
+        self.__notifier = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transaction-server-notifier")
+        self.__pending = {}
+        self.__commit = None
+        self.__writing = None
+        self.__connections = {}
+        self.__reading = set()
+        self.__closing = False
+        self.__server = None
+
+    @classmethod
+    def from_data(cls, **kwargs) -> 'TransactionServer':
+        """Creates a server over the accounts loaded with manage_data.load_data.
+
+        Args:
+            **kwargs: Passed to the TransactionServer constructor.
+
+        Returns:
+            TransactionServer: A server that is not listening yet.
+        """
+        _, accounts, index = manage_data.load_data(build_index=True)
+        return cls(accounts, index, **kwargs)
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, path: str = None) -> asyncio.Server:
+        """Starts listening on a TCP port, or on a Unix socket when a path is given.
+
+        Args:
+            host (str): The address to listen on.
+            port (int): The TCP port, or 0 to pick a free one.
+            path (str): The path of a Unix socket to listen on instead of TCP.
+
+        Returns:
+            asyncio.Server: The listening server.
+        """
+        if path is not None:
+            self.__server = await asyncio.start_unix_server(self.__handle_connection, path=path,
+                                                             backlog=LISTEN_BACKLOG)
+        else:
+            self.__server = await asyncio.start_server(self.__handle_connection, host, port,
+                                                        backlog=LISTEN_BACKLOG)
+        return self.__server
+
+    async def close(self) -> None:
+        """Stops serving, writes every pending balance and stops the writer and notifier threads.
+
+        New requests are refused from the moment close is called. Every open connection stops
+        reading, is sent the responses of the requests it already made and is then closed; a
+        connection that cannot take them within CLOSE_TIMEOUT seconds is dropped.
+        """
+        self.__closing = True
+        if self.__server is not None:
+            self.__server.close()
+        for task in self.__reading:
+            task.cancel()
+        connections = list(self.__connections)
+        if connections:
+            _, stuck = await asyncio.wait(connections, timeout=CLOSE_TIMEOUT)
+            for task in stuck:
+                self.__connections[task].transport.abort()
+            await asyncio.gather(*stuck, return_exceptions=True)
+        if self.__server is not None:
+            await self.__server.wait_closed()
+        await self.flush()
+        self.__writer.shutdown()
+        await asyncio.get_running_loop().run_in_executor(None, self.__notifier.shutdown)
+
+    async def flush(self) -> None:
+        """Writes the pending balances now and waits until every write has finished."""
+        while self.__commit is not None or self.__writing is not None:
+            if self.__writing is None:
+                self.__start_write()
+            await asyncio.wait([self.__writing])
+
+    def handle_request(self, request):
+        """Applies one decoded request.
+
+        Args:
+            request (dict): The decoded request.
+
+        Returns:
+            tuple: (response, commit) where response is the response dict and commit is an
+            asyncio.Future that resolves once the request's balance is written, or None if
+            nothing was changed.
+        """
+        if not isinstance(request, dict):
+            return (_error(None, INVALID_REQUEST, "A request must be a JSON object."), None)
+        request_id = request.get("id")
+        if self.__closing:
+            return (_error(request_id, UNAVAILABLE, "The server is shutting down."), None)
+        operation = request.get("op")
+        if operation == "lookup":
+            return (self.__lookup(request_id, request), None)
+        if operation == "transfer":
+            return self.__transfer(request_id, request)
+        if operation not in ("deposit", "withdraw"):
+            return (_error(request_id, INVALID_REQUEST, f"Unknown operation {operation!r}."), None)
+
+        account = self.__accounts.get(str(request.get("account_number")))
+        if account is None:
+            return (_error(request_id, NOT_FOUND, f"Account {request.get('account_number')} not found."), None)
+        if not _is_finite(request.get("amount")):
+            return (_error(request_id, REJECTED, "Amount must be a finite number."), None)
+        amount = float(request.get("amount"))
+        if amount <= 0:
+            kind = "Deposit" if operation == "deposit" else "Withdrawal"
+            return (_error(request_id, REJECTED, f"{kind} amount must be a positive number."), None)
+        saved = account._saved_balance()
+        try:
+            # Applied without notifying, so the notifications can be sent off the event loop.
+            rejections, messages = account._apply_amounts([amount if operation == "deposit" else -amount])
+        except (ValueError, OverflowError) as e:
+            return (_error(request_id, REJECTED, str(e)), None)
+        if rejections:
+            return (_error(request_id, REJECTED, rejections[0][1]), None)
+        self.__notify([(account, messages)])
+        return ({"id": request_id, "ok": True, "account": _describe(account)}, self.__schedule_write(account, saved))
+
+    def __transfer(self, request_id, request: dict) -> tuple:
+        """Moves an amount between two accounts; both balances go into the same write."""
+        accounts = []
+        for field in ("account_number", "target_account_number"):
+            account = self.__accounts.get(str(request.get(field)))
+            if account is None:
+                return (_error(request_id, NOT_FOUND, f"Account {request.get(field)} not found."), None)
+            accounts.append(account)
+        source, target = accounts
+        saved = (source._saved_balance(), target._saved_balance())
+        try:
+            _, notifications = _transfer_many(source, [(target, request.get("amount"))])
+        except (ValueError, OverflowError) as e:
+            return (_error(request_id, REJECTED, str(e)), None)
+        self.__notify(notifications)
+        self.__schedule_write(source, saved[0])
+        return ({"id": request_id, "ok": True, "accounts": [_describe(source), _describe(target)]},
+                self.__schedule_write(target, saved[1]))
+
+    def __lookup(self, request_id, request: dict) -> dict:
+        """Answers a lookup of one account, or of every account of a client."""
+        if "account_number" in request:
+            account = self.__accounts.get(str(request["account_number"]))
+            if account is None:
+                return _error(request_id, NOT_FOUND, f"Account {request['account_number']} not found.")
+            return {"id": request_id, "ok": True, "account": _describe(account)}
+        if "client_number" in request and self.__index is not None:
+            try:
+                client_number = int(request["client_number"])
+            except (TypeError, ValueError):
+                return _error(request_id, INVALID_REQUEST, "client_number must be an integer.")
+            accounts = self.__index.accounts_for(client_number, self.__accounts)
+            return {"id": request_id, "ok": True, "accounts": [_describe(account) for account in accounts]}
+        return _error(request_id, INVALID_REQUEST, "A lookup needs an account_number or client_number.")
+
+    def __notify(self, notifications: list) -> None:
+        """Sends (account, [(message, topic), ...]) notifications on the notifier thread."""
+        if any(messages for _, messages in notifications):
+            asyncio.get_running_loop().run_in_executor(self.__notifier, _send_notifications, notifications)
+
+    def __schedule_write(self, account, saved) -> asyncio.Future:
+        """Queues an account's balance for the next write and returns the write's future.
+
+        Args:
+            account (BankAccount): The account that was changed.
+            saved: The account's _saved_balance from before the change.
+        """
+        self.__pending.setdefault(account.account_number, (account, saved))
+        if self.__commit is None:
+            loop = asyncio.get_running_loop()
+            self.__commit = loop.create_future()
+            loop.call_later(self.__commit_window, self.__start_write)
+        return self.__commit
+
+    def __start_write(self) -> None:
+        """Starts writing the pending balances, unless a write is already in progress.
+
+        Called when the commit window closes and whenever a write finishes.
+        """
+        if self.__commit is not None and self.__writing is None:
+            self.__writing = asyncio.ensure_future(self.__write_pending())
+            self.__writing.add_done_callback(self.__write_finished)
+
+    def __write_finished(self, task: asyncio.Task) -> None:
+        """Starts the next write once the one in progress has finished."""
+        self.__writing = None
+        self.__start_write()
+
+    async def __write_pending(self) -> None:
+        """Writes the pending balances on the writer thread and resolves their future."""
+        pending, commit = self.__pending, self.__commit
+        self.__pending, self.__commit = {}, None
+        changes = [(account, saved, account._saved_balance()) for account, saved in pending.values()]
+        snapshots = [BalanceSnapshot(account.account_number, account.balance) for account, _, _ in changes]
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self.__writer, manage_data.update_many, snapshots, self.__journaled)
+        except Exception as e:
+            logging.error(f"Unable to write account balances: {str(e)}")
+            self.__roll_back(changes)
+            commit.set_exception(e)
+        else:
+            commit.set_result(None)
+
+    def __roll_back(self, changes: list) -> None:
+        """Takes the changes of a failed write back out of their accounts.
+
+        Args:
+            changes (list): (account, saved, written) for each account of the write, with its
+                saved balance before the changes and the balance that was to be written.
+        """
+        for account, saved, written in changes:
+            current = account._saved_balance()
+            if current == written:
+                account._restore_balance(saved)
+                continue
+            # The account changed again since; keep those changes and queue the result.
+            change = written - saved
+            account._restore_balance(current - change)
+            queued = self.__pending.get(account.account_number)
+            if queued is not None:
+                self.__pending[account.account_number] = (account, queued[1] - change)
+
+    async def __handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Reads the requests of one connection and hands their responses to its sender.
+
+        close cancels the task while it is reading to stop it; the requests already read are
+        still answered and the task then finishes normally.
+        """
+        task = asyncio.current_task()
+        self.__connections[task] = writer
+        responses = asyncio.Queue(MAX_PENDING_RESPONSES)
+        sender = asyncio.create_task(_send_responses(responses, writer))
+        try:
+            self.__reading.add(task)
+            try:
+                await self.__read_requests(reader, responses)
+            except asyncio.CancelledError:
+                if not self.__closing:
+                    raise
+            finally:
+                self.__reading.discard(task)
+            await responses.put(None)
+            await sender
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+        finally:
+            del self.__connections[task]
+
+    async def __read_requests(self, reader: asyncio.StreamReader, responses: asyncio.Queue) -> None:
+        """Reads requests until the client stops sending and queues their responses in order."""
+        while True:
+            try:
+                line = await reader.readline()
+            except (ValueError, ConnectionError):
+                # The line was longer than the stream limit, or the client went away.
+                return
+            if not line:
+                return
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError:
+                await responses.put((_error(None, INVALID_REQUEST, "Invalid JSON."), None))
+                continue
+            await responses.put(self.handle_request(request))
+
+    async def serve_forever(self) -> None:
+        """Serves until cancelled, then writes every pending balance."""
+        try:
+            await self.__server.serve_forever()
+        finally:
+            await self.close()
+
+async def _send_responses(responses: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+    """Sends a connection's responses in request order until it receives None.
+
+    A response that changed a balance is held back until the balance is written.
+    """
+    connected = True
+    while True:
+        item = await responses.get()
+        if item is None:
+            break
+        response, commit = item
+        if commit is not None:
+            try:
+                await asyncio.shield(commit)
+            except Exception as e:
+                response = _error(response["id"], WRITE_FAILED, f"Unable to write the balance: {str(e)}")
+        if not connected:
+            continue
+        writer.write(json.dumps(response).encode() + b"\n")
+        if responses.empty():
+            try:
+                await writer.drain()
+            except ConnectionError:
+                connected = False
+
+def _send_notifications(notifications: list) -> None:
+    """Notifies the observers of each account of its messages, logging any failure."""
+    for account, messages in notifications:
+        for message, topic in messages:
+            try:
+                account.notify(message, topic)
+            except Exception as e:
+                logging.error(f"Unable to notify the observers of account {account.account_number}: {str(e)}")
+
+def _is_finite(amount) -> bool:
+    """Returns whether an amount is a finite number; json.loads accepts NaN and Infinity."""
+    try:
+        return math.isfinite(float(amount))
+    except (TypeError, ValueError):
+        return False
+
+def _describe(account) -> dict:
+    """Returns the JSON description of an account."""
+    return {"account_number": account.account_number, "client_number": account.client_number,
+            "account_type": account.account_type, "balance": account.balance,
+            "date_created": account.date_created.isoformat()}
+
+def _error(request_id, code: str, message: str) -> dict:
+    """Returns the response to a failed request."""
+    return {"id": request_id, "ok": False, "code": code, "error": message}
+
+async def main(address: str = None) -> None:
+    """Loads the accounts and serves them until interrupted.
+
+    Args:
+        address (str): A TCP port, or the path of a Unix socket. Defaults to DEFAULT_PORT.
+    """
+    server = TransactionServer.from_data()
+    if address is not None and not address.isdigit():
+        await server.start(path=address)
+    else:
+        await server.start(port=int(address or DEFAULT_PORT))
+    print(f"Serving transactions on {address or DEFAULT_PORT}")
+    await server.serve_forever()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(sys.argv[1] if len(sys.argv) > 1 else None))
+    except KeyboardInterrupt:
+        pass
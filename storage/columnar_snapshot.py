@@ -0,0 +1,221 @@
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+from array import array
+from datetime import date
+import math
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"PRACCTS1"
+# magic, byte order, row count, source size, source mtime (ns), journal size, type count
+HEADER = struct.Struct("<8sBxxxxxxxqqqqq")
+FLOAT_COLUMNS = ("balance", "overdraft_limit", "overdraft_rate", "minimum_balance", "management_fee")
+STRING_COLUMNS = ("account_number", "client_number")
+BYTE_ORDERS = {"little": 1, "big": 2}
+ALIGNMENT = 8
+
+class AccountsSnapshot:
+    """Read-only, memory-mapped columnar snapshot of the accounts table.
+
+    The file holds one fixed-width array per numeric column (float64, with NaN for
+    "Null"), date ordinals (int32), account type codes (uint8) into an interned table of
+    type names, and an offsets-plus-bytes heap for each string column. Columns are exposed
+    as memoryviews over the mapping, so reading them copies nothing.
+
+    Attributes:
+        source_signature (tuple): (size, mtime_ns, journal_size) of the files the snapshot was written from.
+        type_names (tuple): The account type name for each type code.
+        __file: The open snapshot file.
+        __mapping (mmap.mmap): The memory mapping of the file.
+        __columns (dict): Maps each column name to a memoryview of its values.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Opens and maps the snapshot at the given path.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Raises:
+            FileNotFoundError: If the snapshot does not exist.
+            ValueError: If the file is not a snapshot or was written with another byte order.
+        """
+        self.__columns = {}
+        self.__file = open(path, "rb")
+        try:
+            self.__mapping = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__file.close()
+            raise ValueError(f"{path} is not an accounts snapshot")
+        try:
+            self.__read_layout(path)
+        except Exception:
+            self.close()
+            raise
+
+    def __read_layout(self, path: str) -> None:
+        """Reads the header and builds a memoryview for every column."""
+        if len(self.__mapping) < HEADER.size:
+            raise ValueError(f"{path} is not an accounts snapshot")
+        magic, byte_order, rows, size, mtime_ns, journal_size, type_count = HEADER.unpack_from(self.__mapping)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an accounts snapshot")
+        if byte_order != BYTE_ORDERS[sys.byteorder]:
+            raise ValueError(f"{path} was written on a machine with a different byte order")
+        self.source_signature = (size, mtime_ns, journal_size)
+        self.__rows = rows
+
+        view = memoryview(self.__mapping)
+        offset = HEADER.size
+
+        def take(length: int, typecode: str) -> memoryview:
+            nonlocal offset
+            column = view[offset:offset + length].cast(typecode) if length else memoryview(array(typecode))
+            offset = _aligned(offset + length)
+            return column
+
+        for name in FLOAT_COLUMNS:
+            self.__columns[name] = take(8 * rows, "d")
+        self.__columns["date_created"] = take(4 * rows, "i")
+        self.__columns["account_type"] = take(rows, "B")
+        type_offsets = take(4 * (type_count + 1), "I")
+        type_heap = take(type_offsets[-1] if type_count else 0, "B")
+        self.type_names = tuple(bytes(type_heap[type_offsets[i]:type_offsets[i + 1]]).decode("utf-8")
+                                for i in range(type_count))
+        for name in STRING_COLUMNS:
+            offsets = take(4 * (rows + 1), "I")
+            self.__columns[name] = (offsets, take(offsets[-1] if rows else 0, "B"))
+
+    def __len__(self) -> int:
+        """Returns the number of accounts in the snapshot."""
+        return self.__rows
+
+    def column(self, name: str) -> memoryview:
+        """Returns a zero-copy view of a numeric column.
+
+        Args:
+            name (str): One of the float columns, "date_created" (ordinals) or "account_type" (codes).
+
+        Returns:
+            memoryview: The column values, one per account.
+        """
+        return self.__columns[name]
+
+    def string(self, name: str, row: int) -> str:
+        """Returns a value of a string column.
+
+        Args:
+            name (str): "account_number" or "client_number".
+            row (int): The row index.
+
+        Returns:
+            str: The decoded value.
+        """
+        offsets, heap = self.__columns[name]
+        return bytes(heap[offsets[row]:offsets[row + 1]]).decode("utf-8")
+
+    def row(self, row: int) -> tuple:
+        """Returns one account as a tuple of typed values.
+
+        Args:
+            row (int): The row index.
+
+        Returns:
+            tuple: (account_number, client_number, balance, date_created, account_type,
+            overdraft_limit, overdraft_rate, minimum_balance, management_fee), with None
+            for empty optional values.
+        """
+        columns = self.__columns
+        optional = [_optional(columns[name][row]) for name in FLOAT_COLUMNS[1:]]
+        return (self.string("account_number", row), self.string("client_number", row),
+                columns["balance"][row], date.fromordinal(columns["date_created"][row]),
+                self.type_names[columns["account_type"][row]], *optional)
+
+    def __iter__(self):
+        """Yields every row as returned by row()."""
+        for row in range(self.__rows):
+            yield self.row(row)
+
+    def close(self) -> None:
+        """Releases the column views, the mapping and the file."""
+        for column in self.__columns.values():
+            for view in column if isinstance(column, tuple) else (column,):
+                view.release()
+        self.__columns = {}
+        self.__mapping.close()
+        self.__file.close()
+
+    def __enter__(self) -> 'AccountsSnapshot':
+        """Returns the snapshot for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Closes the snapshot when the with block exits."""
+        self.close()
+
+def write_snapshot(path: str, rows, source_signature: tuple = (0, 0, 0)) -> int:
+    """Writes account rows to a columnar snapshot file.
+
+    The file is written beside its final location and renamed into place, so readers
+    never see a partial snapshot.
+
+    Args:
+        path (str): The path of the snapshot file.
+        rows (iterable): Tuples in the order returned by AccountsSnapshot.row().
+        source_signature (tuple): (size, mtime_ns, journal_size) of the source files.
+
+    Returns:
+        int: The number of rows written.
+    """
+    floats = {name: array("d") for name in FLOAT_COLUMNS}
+    ordinals = array("i")
+    type_codes = array("B")
+    type_table = {}
+    strings = {name: (array("I", [0]), bytearray()) for name in STRING_COLUMNS}
+
+    count = 0
+    for (account_number, client_number, balance, date_created, account_type,
+         overdraft_limit, overdraft_rate, minimum_balance, management_fee) in rows:
+        for name, value in (("account_number", account_number), ("client_number", client_number)):
+            offsets, heap = strings[name]
+            heap += value.encode("utf-8")
+            offsets.append(len(heap))
+        for name, value in zip(FLOAT_COLUMNS, (balance, overdraft_limit, overdraft_rate,
+                                               minimum_balance, management_fee)):
+            floats[name].append(math.nan if value is None else value)
+        ordinals.append(date_created.toordinal())
+        type_codes.append(type_table.setdefault(account_type, len(type_table)))
+        count += 1
+
+    type_offsets = array("I", [0])
+    type_heap = bytearray()
+    for name in type_table:
+        type_heap += name.encode("utf-8")
+        type_offsets.append(len(type_heap))
+
+    sections = [floats[name] for name in FLOAT_COLUMNS] + [ordinals, type_codes, type_offsets, type_heap]
+    for name in STRING_COLUMNS:
+        sections.extend(strings[name])
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, BYTE_ORDERS[sys.byteorder], count, *source_signature, len(type_table)))
+        for section in sections:
+            data = section.tobytes() if isinstance(section, array) else bytes(section)
+            file.write(data)
+            file.write(b"\0" * (_aligned(len(data)) - len(data)))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+    return count
+
+def _aligned(offset: int) -> int:
+    """Rounds an offset up to the section alignment."""
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def _optional(value: float):
+    """Returns None for the NaN used to store an empty optional value."""
+    return None if math.isnan(value) else value
@@ -0,0 +1,175 @@
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import csv
+import sqlite3
+import threading
+
+CLIENT_COLUMNS = ("client_number", "first_name", "last_name", "email_address")
+ACCOUNT_COLUMNS = ("account_number", "client_number", "balance", "date_created", "account_type",
+                   "overdraft_limit", "overdraft_rate", "minimum_balance", "management_fee")
+
+# Optional account columns hold this marker in the CSV files and NULL in the database.
+NULL_MARKER = "Null"
+FETCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+    client_number TEXT PRIMARY KEY,
+    first_name TEXT,
+    last_name TEXT,
+    email_address TEXT
+);
+CREATE TABLE IF NOT EXISTS accounts (
+    account_number TEXT PRIMARY KEY,
+    client_number TEXT,
+    balance REAL,
+    date_created TEXT,
+    account_type TEXT,
+    overdraft_limit REAL,
+    overdraft_rate REAL,
+    minimum_balance REAL,
+    management_fee REAL
+);
+CREATE INDEX IF NOT EXISTS accounts_client_number ON accounts (client_number);
+"""
+
+class SQLiteStorage:
+    """Storage backend keeping clients and accounts in an SQLite database file.
+
+    Records are returned in the same shape as rows of clients.csv and accounts.csv, so
+    user_interface.manage_data validates them exactly as it validates the CSV files. One
+    connection is opened per storage object and shared by every call.
+
+    Attributes:
+        __connection (sqlite3.Connection): The shared database connection.
+        __lock (threading.Lock): Serializes use of the connection across threads.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        """Opens (creating if necessary) the database at the given path.
+
+        Args:
+            db_path (str): The path of the SQLite database file.
+        """
+        self.__connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.__lock = threading.Lock()
+        with self.__lock, self.__connection:
+            self.__connection.executescript(SCHEMA)
+
+    def import_csv(self, clients_csv_path: str, accounts_csv_path: str) -> tuple[int, int]:
+        """Copies every row of the CSV files into the database, replacing existing rows.
+
+        Rows are copied as they are; invalid rows are reported when they are loaded, just
+        as they are for the CSV files.
+
+        Args:
+            clients_csv_path (str): The path of clients.csv.
+            accounts_csv_path (str): The path of accounts.csv.
+
+        Returns:
+            tuple: The number of (client, account) rows imported.
+
+        Raises:
+            FileNotFoundError: If either CSV file is not found.
+        """
+        with open(clients_csv_path, newline='') as csvfile:
+            clients = [self.__to_row(record, CLIENT_COLUMNS) for record in csv.DictReader(csvfile)]
+        with open(accounts_csv_path, newline='') as csvfile:
+            accounts = [self.__to_row(record, ACCOUNT_COLUMNS) for record in csv.DictReader(csvfile)]
+
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                f"INSERT OR REPLACE INTO clients VALUES ({', '.join('?' * len(CLIENT_COLUMNS))})", clients)
+            self.__connection.executemany(
+                f"INSERT OR REPLACE INTO accounts VALUES ({', '.join('?' * len(ACCOUNT_COLUMNS))})", accounts)
+        return (len(clients), len(accounts))
+
+    def iter_client_records(self):
+        """Yields every client record in insertion order.
+
+        Yields:
+            dict: A client record keyed by the clients.csv column names.
+        """
+        yield from self.__query(f"SELECT {', '.join(CLIENT_COLUMNS)} FROM clients ORDER BY rowid",
+                                (), CLIENT_COLUMNS)
+
+    def iter_account_records(self, client_number=None):
+        """Yields account records in insertion order, using the client_number index when filtering.
+
+        Args:
+            client_number (int | str): If given, only that client's records are yielded.
+
+        Yields:
+            dict: An account record keyed by the accounts.csv column names.
+        """
+        columns = ', '.join(ACCOUNT_COLUMNS)
+        if client_number is None:
+            yield from self.__query(f"SELECT {columns} FROM accounts ORDER BY rowid", (), ACCOUNT_COLUMNS)
+        else:
+            yield from self.__query(f"SELECT {columns} FROM accounts WHERE client_number = ? ORDER BY rowid",
+                                    (str(client_number),), ACCOUNT_COLUMNS)
+
+    def get_account_record(self, account_number: str):
+        """Returns the record of a single account using the primary key index.
+
+        Args:
+            account_number (str): The account number to look up.
+
+        Returns:
+            dict: The account record, or None if the account does not exist.
+        """
+        records = list(self.__query(f"SELECT {', '.join(ACCOUNT_COLUMNS)} FROM accounts WHERE account_number = ?",
+                               (account_number,), ACCOUNT_COLUMNS))
+        return records[0] if records else None
+
+    def update_balances(self, balances: dict) -> None:
+        """Stores new balances in a single transaction.
+
+        Args:
+            balances (dict): Maps account_number (str) to its new balance (float).
+        """
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                "UPDATE accounts SET balance = ? WHERE account_number = ?",
+                [(balance, account_number) for account_number, balance in balances.items()]
+            )
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self.__lock:
+            self.__connection.close()
+
+    def __query(self, sql: str, parameters: tuple, columns: tuple):
+        """Runs a query and yields each row as a CSV-style record, fetching in blocks.
+
+        NULL values become the "Null" marker used by the CSV files.
+        """
+        with self.__lock:
+            cursor = self.__connection.execute(sql, parameters)
+        while True:
+            with self.__lock:
+                rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield {column: NULL_MARKER if value is None else value for column, value in zip(columns, row)}
+
+    @staticmethod
+    def __to_row(record: dict, columns: tuple) -> tuple:
+        """Converts a CSV record to a database row, storing the "Null" marker as NULL."""
+        return tuple(None if record.get(column) == NULL_MARKER else record.get(column) for column in columns)
+
+# ONE-SHOT CSV IMPORT:
+if __name__ == "__main__":
+    from user_interface import manage_data
+
+    db_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(manage_data.data_dir, 'pixell_river.db')
+    manage_data.compact_journal()
+    storage = SQLiteStorage(db_path)
+    client_count, account_count = storage.import_csv(manage_data.clients_csv_path, manage_data.accounts_csv_path)
+    storage.close()
+    print(f"Imported {client_count} clients and {account_count} accounts into {db_path}")
@@ -0,0 +1,146 @@
+import unittest
+from datetime import date
+from bank_account import account_store
+from bank_account.account_store import AccountStore
+from bank_account.bank_account import transfer_many
+from bank_account.chequing_account import ChequingAccount
+from bank_account.fixed_point import MAX_CENTS
+from bank_account.savings_account import SavingsAccount
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class TestAccountStore(unittest.TestCase):
+    """Test case for the columnar AccountStore and its account views."""
+
+    ROWS = [
+        ("20001", "1001", 200.00, date(2023, 1, 10), "ChequingAccount", -50.0, 0.035, None, None),
+        ("20002", "1001", 301.54, date(2023, 1, 15), "SavingsAccount", None, None, 50.0, None),
+        ("20003", "1002", 1200.87, date(2023, 2, 1), "InvestmentAccount", None, None, None, 2.55),
+    ]
+
+    def setUp(self):
+        """Set up a store with one account of each type."""
+        self.store = AccountStore.from_values(self.ROWS)
+        self.cents_store = AccountStore.from_values(self.ROWS, fixed_point=True)
+
+    def test_apply_checks_limits_in_order(self):
+        """Test that a batch is checked row by row against the running balance."""
+        result = self.store.apply([0, 0, 1, 1, 2, 2, 7],
+                                  [-240.00, -20.00, -400.00, 0.0, 20000.00, -21200.00, 5.00])
+        self.assertEqual(list(result.codes), [
+            account_store.ACCEPTED, account_store.OVERDRAFT_LIMIT_EXCEEDED,
+            account_store.INSUFFICIENT_FUNDS, account_store.INVALID_AMOUNT,
+            account_store.ACCEPTED, account_store.ACCEPTED, account_store.UNKNOWN_ACCOUNT,
+        ])
+        self.assertEqual(list(result.low_balance), [1, 0, 0, 0, 0, 1, 0])
+        self.assertEqual(list(result.large_transaction), [0, 0, 0, 0, 1, 1, 0])
+        self.assertEqual(result.rejected(), [1, 2, 3, 6])
+        self.assertAlmostEqual(self.store.balances()[0], -40.00)
+        self.assertAlmostEqual(self.store.balances()[2], 0.87)
+
+    def test_apply_matches_account_objects(self):
+        """Test that batch results agree with deposit and withdraw on account objects."""
+        account = ChequingAccount("20001", "1001", 200.00, date(2023, 1, 10), -50.0, 0.035)
+        amounts = [-100.00, -120.00, 35.50, -80.00, -10.00]
+        result = self.store.apply([0] * len(amounts), amounts)
+        for amount, code in zip(amounts, result.codes):
+            try:
+                account.deposit(amount) if amount > 0 else account.withdraw(-amount)
+                self.assertEqual(code, account_store.ACCEPTED)
+            except ValueError:
+                self.assertEqual(code, account_store.OVERDRAFT_LIMIT_EXCEEDED)
+        self.assertEqual(self.store.balances()[0], account.balance)
+
+    def test_view_is_a_bank_account(self):
+        """Test that a view reads and writes the stored account like an account object."""
+        view = self.store.view(self.store.index_of("20002"))
+        expected = SavingsAccount("20002", "1001", 301.54, date(2023, 1, 15), 50.0)
+        self.assertEqual(str(view), str(expected))
+        self.assertEqual(view.account_type, expected.account_type)
+
+        view.withdraw(280.00)
+        self.assertAlmostEqual(self.store.balances()[1], 21.54)
+        self.assertEqual(view.get_service_charges(), 1.00)
+        with self.assertRaisesRegex(ValueError, "Insufficient funds"):
+            view.withdraw(50.00)
+        with self.assertRaisesRegex(ValueError, "overdraft limit"):
+            self.store.view(0).withdraw(300.00)
+
+    def test_duplicate_account_is_rejected(self):
+        """Test that an account number can only be added once."""
+        with self.assertRaises(ValueError):
+            self.store.add(("20001", "1001", 0.0, date(2023, 1, 1), "SavingsAccount", None, None, 50.0, None))
+        self.assertEqual(len(self.store), 3)
+
+    def test_fixed_point_postings_are_exact(self):
+        """Test that fixed-point balances do not drift over many postings."""
+        result = self.cents_store.apply([1] * 1000, [10] * 1000)
+        self.assertEqual(result.rejected(), [])
+        self.assertEqual(self.cents_store.balance_cents(1), 30154 + 10000)
+        self.assertEqual(self.cents_store.view(1).balance, 401.54)
+
+    def test_fixed_point_limits_and_overflow(self):
+        """Test that fixed-point limit checks are exact and overflow is rejected."""
+        result = self.cents_store.apply([0, 0, 2, 2], [-25000, -1, MAX_CENTS, -120087])
+        self.assertEqual(list(result.codes), [account_store.ACCEPTED, account_store.OVERDRAFT_LIMIT_EXCEEDED,
+                                              account_store.BALANCE_OVERFLOW, account_store.ACCEPTED])
+        self.assertEqual(list(result.low_balance), [1, 0, 0, 1])
+        self.assertEqual(list(self.cents_store.balances()), [-5000, 30154, 0])
+        with self.assertRaises(TypeError):
+            self.cents_store.apply([0], [1.5])
+
+        view = self.cents_store.view(2)
+        for amount in (MAX_CENTS / 50, 1e300, float("inf"), "nan"):
+            with self.assertRaises(ValueError):
+                view.update_balance(amount)
+        with self.assertRaisesRegex(ValueError, "too large"):
+            view.deposit(1e300)
+        view.deposit(9e16)
+        with self.assertRaisesRegex(ValueError, "Balance would overflow"):
+            view.deposit(9e16)
+        self.assertEqual(self.cents_store.balance_cents(2), 9 * 10 ** 18)
+
+    def test_fixed_point_transfer_overflow_restores_every_balance(self):
+        """Test that a transfer refused on overflow puts back credits the floor would refuse to undo."""
+        source, savings, investment = (self.cents_store.view(index) for index in range(3))
+        source.update_balance(9e16)
+        savings.update_balance(-321.54)
+        investment.update_balance(9e16)
+        before = [self.cents_store.balance_cents(index) for index in range(3)]
+        with self.assertRaisesRegex(ValueError, "Balance would overflow"):
+            transfer_many(source, [(savings, 5.00), (investment, 5e15)])
+        self.assertEqual([self.cents_store.balance_cents(index) for index in range(3)], before)
+        self.assertEqual(savings.balance, -20.00)
+
+    def test_fixed_point_transfer_error_restores_every_balance(self):
+        """Test that a credit raising instead of being rejected also leaves every balance as it was."""
+        source = SavingsAccount("99999", "1001", 2e17, date(2023, 1, 1), 50.0)
+        savings, investment = self.cents_store.view(1), self.cents_store.view(2)
+        before = [self.cents_store.balance_cents(index) for index in range(3)]
+        with self.assertRaises(OverflowError):
+            transfer_many(source, [(savings, 5.00), (investment, 1e17)])
+        self.assertEqual(source.balance, 2e17)
+        self.assertEqual([self.cents_store.balance_cents(index) for index in range(3)], before)
+
+    def test_fixed_point_views_match_float_views(self):
+        """Test that fixed-point views behave like views of a float store."""
+        for index in range(len(self.store)):
+            self.assertEqual(str(self.cents_store.view(index)), str(self.store.view(index)))
+            self.assertEqual(self.cents_store.view(index).get_service_charges(),
+                             self.store.view(index).get_service_charges())
+        view = self.cents_store.view(0)
+        self.assertEqual(view.apply_transactions([-150.10, -100.00]),
+                         [(1, "Withdrawal exceeds overdraft limit.")])
+        self.assertEqual(self.cents_store.balance_cents(0), 4990)
+
+    def test_service_charges_match_views(self):
+        """Test that batch service charges match each account's own charges."""
+        self.store.apply([0], [-230.00])
+        self.cents_store.apply([0], [-23000])
+        expected = [self.store.view(index).get_service_charges() for index in range(len(self.store))]
+        self.assertEqual(list(self.store.service_charges()), expected)
+        self.assertEqual(list(self.cents_store.service_charges()), [155, 50, 305])
+
+if __name__ == "__main__":
+    unittest.main()
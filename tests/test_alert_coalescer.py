@@ -0,0 +1,89 @@
+import time
+import unittest
+from datetime import date
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from client.client import Client
+from patterns.observer import notification_dispatcher
+from patterns.observer.alert_coalescer import AlertCoalescer
+from patterns.observer.notification_dispatcher import NotificationDispatcher
+from patterns.observer.observer import Observer
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class RecordingObserver(Observer):
+    """Observer that records every message it is updated with."""
+
+    def __init__(self):
+        """Initialize with no messages."""
+        self.messages = []
+
+    def update(self, message: str) -> None:
+        """Record a message."""
+        self.messages.append(message)
+
+class TestAlertCoalescer(unittest.TestCase):
+    """Test case for per-client alert coalescing."""
+
+    def setUp(self):
+        """Create a chequing and a savings account for the same client."""
+        self.chequing = ChequingAccount("CHK123", "1001", 500.00, date(2023, 1, 1), -1000.00, 0.05)
+        self.savings = SavingsAccount("SAV123", "1001", 500.00, date(2023, 1, 1), 50.00)
+
+    def test_alerts_are_grouped_into_one_digest(self):
+        """Test that repeated alerts on each account collapse into one digest line per kind."""
+        observer = RecordingObserver()
+        coalescer = AlertCoalescer(observer, window=None)
+        self.chequing.attach(coalescer)
+        self.savings.attach(coalescer)
+
+        for _ in range(3):
+            self.chequing.withdraw(450.00)
+            self.chequing.deposit(450.00)
+        self.savings.withdraw(420.00)
+        self.chequing.deposit(20000.00)
+        self.assertEqual(observer.messages, [])
+
+        coalescer.flush()
+        self.assertEqual(observer.messages, [
+            "5 alerts: Low balance warning $50.00: on account CHK123 (x3); "
+            "Low balance warning $80.00: on account SAV123; "
+            "Large transaction $20,000.00: on account CHK123"])
+        coalescer.flush()
+        self.assertEqual(len(observer.messages), 1)
+
+    def test_single_alert_is_forwarded_unchanged(self):
+        """Test that a window holding one alert forwards it as it was raised."""
+        observer = RecordingObserver()
+        coalescer = AlertCoalescer(observer, window=None)
+        self.chequing.attach(coalescer)
+        self.chequing.withdraw(450.00)
+        coalescer.flush()
+        self.assertEqual(observer.messages, ["Low balance warning $50.00: on account CHK123"])
+
+    def test_digest_is_sent_when_the_window_ends(self):
+        """Test that the client gets one email once the window passes."""
+        delivered = []
+        dispatcher = NotificationDispatcher(delivered.extend)
+        previous = notification_dispatcher.set_dispatcher(dispatcher)
+        self.addCleanup(notification_dispatcher.set_dispatcher, previous)
+        self.addCleanup(dispatcher.shutdown)
+
+        coalescer = AlertCoalescer(Client(1001, "John", "Doe", "johndoe@pixell.com"), window=0.01)
+        self.chequing.attach(coalescer)
+        for _ in range(100):
+            self.chequing.withdraw(450.00)
+            self.chequing.deposit(450.00)
+        deadline = time.monotonic() + 5
+        while not delivered and time.monotonic() < deadline:
+            time.sleep(0.01)
+            dispatcher.flush()
+
+        self.assertEqual(len(delivered), 1)
+        self.assertEqual(delivered[0].email_address, "johndoe@pixell.com")
+        self.assertTrue(delivered[0].message.endswith(
+            "100 alerts: Low balance warning $50.00: on account CHK123 (x100)"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import unittest
+from datetime import date
+from bank_account import apply_transactions
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from patterns.observer.observer import Observer
+from patterns.observer.observer_registry import CUMULATIVE_AMOUNT, VELOCITY
+from services.alert_rules import (DEFAULT_RULES, DEPOSITS, AlertRuleEngine, amount_above, balance_below,
+                                  count_above, total_above)
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class RecordingObserver(Observer):
+    """Observer that records every message it is updated with."""
+
+    def __init__(self):
+        """Initialize with no messages."""
+        self.messages = []
+
+    def update(self, message: str) -> None:
+        """Record a message."""
+        self.messages.append(message)
+
+class TestAlertRuleEngine(unittest.TestCase):
+    """Test case for the streaming alert rule engine."""
+
+    def setUp(self):
+        """Create a chequing account and a savings account for client 1001."""
+        self.chequing = ChequingAccount("CHK123", "1001", 5000.00, date(2023, 1, 1), -1000.00, 0.05)
+        self.savings = SavingsAccount("SAV123", "1001", 5000.00, date(2023, 1, 1), 50.00)
+        self.accounts = {"CHK123": self.chequing, "SAV123": self.savings}
+
+    def test_default_rules_match_the_built_in_notifications(self):
+        """Test that the default rules send the same notifications as apply_transactions."""
+        transactions = [("CHK123", -4950.00), ("SAV123", 20000.00), ("CHK123", -2000.00), ("CHK123", 40.00)]
+        built_in = RecordingObserver()
+        accounts = {"CHK123": ChequingAccount("CHK123", "1001", 5000.00, date(2023, 1, 1), -1000.00, 0.05),
+                    "SAV123": SavingsAccount("SAV123", "1001", 5000.00, date(2023, 1, 1), 50.00)}
+        for account in accounts.values():
+            account.attach(built_in)
+        expected_rejections = apply_transactions(accounts, transactions)
+
+        observer = RecordingObserver()
+        self.chequing.attach(observer)
+        self.savings.attach(observer)
+        result = AlertRuleEngine().apply_transactions(self.accounts, transactions)
+
+        self.assertEqual(result.rejections, expected_rejections)
+        self.assertEqual(observer.messages, built_in.messages)
+        self.assertEqual([(alert.position, alert.rule) for alert in result.alerts],
+                         [(0, "low_balance"), (1, "large_transaction"), (3, "low_balance")])
+        self.assertEqual(self.chequing.balance, 90.00)
+
+    def test_type_and_client_rules_override_the_general_ones(self):
+        """Test that the most specific rule with a name is the one that applies."""
+        engine = AlertRuleEngine(DEFAULT_RULES + (
+            balance_below(1000.00, account_type="SavingsAccount"),
+            balance_below(0.00, client_number="1001"),
+            balance_below(2000.00, account_type="SavingsAccount", client_number="1001"),
+            amount_above(500.00, name="large_deposit", direction=DEPOSITS, client_number="1002"),
+        ))
+        levels = {(account_type, client): [rule.threshold for rule in engine.compile(account_type, client).rules]
+                  for account_type in ("ChequingAccount", "SavingsAccount") for client in ("1001", "1002")}
+        self.assertEqual(levels, {
+            ("ChequingAccount", "1001"): [0.00, 10000.00],
+            ("SavingsAccount", "1001"): [2000.00, 10000.00],
+            ("ChequingAccount", "1002"): [100.00, 10000.00, 500.00],
+            ("SavingsAccount", "1002"): [1000.00, 10000.00, 500.00],
+        })
+        self.assertIs(engine.compile("SavingsAccount", "1001"), engine.compile("SavingsAccount", "1001"))
+
+        self.savings.withdraw(3500.00)
+        self.assertEqual([alert.message for alert in engine.evaluate(self.savings, -3500.00, notify=False)],
+                         ["Low balance warning $1,500.00: on account SAV123"])
+
+    def test_velocity_rule_counts_withdrawals_in_the_window(self):
+        """Test that a velocity rule fires once more than count withdrawals fall in its window."""
+        engine = AlertRuleEngine([count_above(3, 600)])
+        observer = RecordingObserver()
+        self.chequing.attach(observer, [VELOCITY])
+        result = engine.apply_transactions(self.accounts, [("CHK123", -10.00)] * 4 + [("CHK123", 10.00)] * 3
+                                           + [("CHK123", -10.00)] * 2,
+                                           timestamps=[0, 100, 200, 300, 310, 320, 330, 650, 1000])
+        self.assertEqual([alert.position for alert in result.alerts], [3, 7])
+        self.assertEqual(observer.messages, ["More than 3 withdrawals within 10 minutes: on account CHK123"] * 2)
+
+    def test_cumulative_rule_sums_the_window(self):
+        """Test that a cumulative rule tracks the total withdrawn in its window as it slides."""
+        engine = AlertRuleEngine([total_above(1000.00, 3600)])
+        amounts = [-400.00, -400.00, -300.00, -100.00]
+        timestamps = [0, 10, 20, 3700]
+        alerts = []
+        for amount, timestamp in zip(amounts, timestamps):
+            alerts.extend(engine.post(self.chequing, amount, timestamp))
+        self.assertEqual([(alert.topic, alert.message) for alert in alerts],
+                         [(CUMULATIVE_AMOUNT, "Withdrawn $1,100.00 within 1 hour: on account CHK123")])
+
+        result = engine.apply_transactions(self.accounts, [("SAV123", -50.00)] * 50,
+                                           timestamps=[5000 + second for second in range(50)])
+        self.assertEqual([alert.position for alert in result.alerts], list(range(20, 50)))
+        self.assertEqual(result.alerts[-1].message, "Withdrawn $2,500.00 within 1 hour: on account SAV123")
+
+    def test_window_amounts_round_like_the_limits(self):
+        """Test that amounts with fractions of a cent count in the window as to_cents rounds them."""
+        engine = AlertRuleEngine([total_above(1.62, 3600)])
+        for second in range(3):
+            self.assertEqual(engine.post(self.chequing, -0.545, second), [])
+        self.assertEqual([alert.message for alert in engine.post(self.chequing, -0.01, 3)],
+                         ["Withdrawn $1.63 within 1 hour: on account CHK123"])
+
+    def test_posted_transactions_only_send_the_engine_alerts(self):
+        """Test that post replaces the built-in thresholds with the engine's rules."""
+        engine = AlertRuleEngine(DEFAULT_RULES + (balance_below(0.00, client_number="1001"),
+                                                  amount_above(20000.00, client_number="1001")))
+        observer = RecordingObserver()
+        self.chequing.attach(observer)
+        self.assertEqual(engine.post(self.chequing, -4950.00), [])
+        self.assertEqual(engine.post(self.chequing, 19000.00), [])
+        alerts = engine.post(self.chequing, -20040.00)
+        self.assertEqual(observer.messages, [alert.message for alert in alerts])
+        self.assertEqual([alert.rule for alert in alerts], ["low_balance", "large_transaction"])
+        with self.assertRaisesRegex(ValueError, "overdraft limit"):
+            engine.post(self.chequing, -1000.00)
+        self.assertAlmostEqual(self.chequing.balance, -990.00)
+
+    def test_idle_windows_are_dropped(self):
+        """Test that the windows of accounts without recent transactions are not kept."""
+        engine = AlertRuleEngine([count_above(3, 600)])
+        accounts = [ChequingAccount(str(number), "1001", 5000.00, date(2023, 1, 1), -1000.00, 0.05)
+                    for number in range(100)]
+        for account in accounts:
+            engine.post(account, -10.00, 0)
+        self.assertEqual(engine.windowed_accounts, 100)
+        for timestamp in (100, 200, 300):
+            engine.post(accounts[0], -10.00, timestamp)
+        self.assertEqual(engine.windowed_accounts, 100)
+        self.assertEqual(len(engine.post(accounts[0], -10.00, 700)), 0)
+        self.assertEqual(engine.windowed_accounts, 1)
+        self.assertEqual(len(engine.post(accounts[0], -10.00, 710)), 1)
+
+    def test_invalid_rules_are_rejected(self):
+        """Test that rule functions and the engine validate their arguments."""
+        with self.assertRaises(ValueError):
+            count_above(-1, 60)
+        with self.assertRaises(ValueError):
+            total_above(100.00, 0)
+        with self.assertRaises(ValueError):
+            amount_above("lots")
+        with self.assertRaises(TypeError):
+            AlertRuleEngine([("low_balance", 100.00)])
+
+if __name__ == "__main__":
+    unittest.main()
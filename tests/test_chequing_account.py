@@ -1,6 +1,9 @@
 import unittest
 from datetime import date
+from bank_account.bank_account import apply_transactions, transfer_many
 from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from patterns.observer.observer import Observer
 
 __author__ = "Md Apurba Khan"
 __version__ = "1.4.0"
@@ -22,5 +25,68 @@ class TestChequingAccount(unittest.TestCase):
         expected_charge = 0.50 + (1000.00 * 0.05)  # BASE_SERVICE_CHARGE + overdraft fee (500 * 0.05)
         self.assertEqual(self.account.get_service_charges(), expected_charge)
 
+    def test_apply_transactions_defers_notifications(self):
+        """Test that a batch applies in order, rejects past the limit and notifies afterwards."""
+        messages = []
+        account = self.account
+
+        class RecordingObserver(Observer):
+            def update(self, message):
+                messages.append((message, account.balance))
+
+        observer = RecordingObserver()
+        self.account.attach(observer)
+        rejections = self.account.apply_transactions([-1450.00, -100.00, 20000.00, "-50"])
+        self.assertEqual(rejections, [(1, "Withdrawal exceeds overdraft limit.")])
+        self.assertEqual(self.account.balance, 19000.00)
+        self.assertEqual(messages, [
+            ("Low balance warning $-950.00: on account CHK123", 19000.00),
+            ("Large transaction $20,000.00: on account CHK123", 19000.00),
+        ])
+
+    def test_apply_transactions_validates_before_applying(self):
+        """Test that an invalid amount rejects the whole batch."""
+        with self.assertRaises(ValueError):
+            self.account.apply_transactions([-100.00, "invalid"])
+        with self.assertRaises(ValueError):
+            self.account.apply_transactions([0])
+        self.assertEqual(self.account.balance, 500.00)
+
+    def test_apply_transactions_across_accounts(self):
+        """Test that transactions are applied per account and rejections keep their positions."""
+        savings = SavingsAccount("SAV123", "C001", 100.00, date(2023, 1, 1), 50.0)
+        accounts = {"CHK123": self.account, "SAV123": savings}
+        rejections = apply_transactions(accounts, [("SAV123", -150.00), ("CHK123", -200.00),
+                                                   ("NONE", 5.00), ("SAV123", 25.00)])
+        self.assertEqual(rejections, [(0, "Insufficient funds for withdrawal."), (2, "Account NONE not found.")])
+        self.assertEqual(self.account.balance, 300.00)
+        self.assertEqual(savings.balance, 125.00)
+
+    def test_transfer_enforces_overdraft_limit_atomically(self):
+        """Test that a transfer past the overdraft limit changes neither account."""
+        savings = SavingsAccount("SAV123", "C001", 100.00, date(2023, 1, 1), 50.0)
+        self.account.transfer_to(savings, 1400.00)
+        self.assertEqual((self.account.balance, savings.balance), (-900.00, 1500.00))
+        with self.assertRaisesRegex(ValueError, "overdraft limit"):
+            self.account.transfer_to(savings, 100.01)
+        with self.assertRaises(ValueError):
+            savings.transfer_to(self.account, -5)
+        with self.assertRaises(ValueError):
+            savings.transfer_to(savings, 5)
+        self.assertEqual((self.account.balance, savings.balance), (-900.00, 1500.00))
+
+    def test_transfer_many_is_all_or_nothing(self):
+        """Test that a fan-out either credits every target or changes no account."""
+        payees = [SavingsAccount(f"SAV{number}", "C002", 0.0, date(2023, 1, 1), 50.0) for number in range(1000)]
+        with self.assertRaises(ValueError):
+            transfer_many(self.account, [(payee, 1.51) for payee in payees])
+        self.assertEqual(self.account.balance, 500.00)
+        self.assertTrue(all(payee.balance == 0.0 for payee in payees))
+
+        changed = transfer_many(self.account, [(payee, 1.25) for payee in payees] + [(payees[0], 1.0)])
+        self.assertEqual(changed, [self.account] + payees)
+        self.assertEqual(self.account.balance, -751.00)
+        self.assertEqual((payees[0].balance, payees[1].balance), (2.25, 1.25))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
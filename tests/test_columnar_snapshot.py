@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from storage.columnar_snapshot import AccountsSnapshot, write_snapshot
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+ROWS = [
+    ("20001", "1001", 15000.0, date(2023, 1, 10), "ChequingAccount", -50.0, 0.035, None, None),
+    ("20002", "1001", 301.54, date(2023, 1, 15), "SavingsAccount", None, None, 50.0, None),
+    ("20003", "1002", 1200.87, date(2023, 2, 1), "InvestmentAccount", None, None, None, 2.55),
+]
+
+class TestColumnarSnapshot(unittest.TestCase):
+    """Test case for the columnar accounts snapshot format."""
+
+    def setUp(self):
+        """Create a temporary directory for snapshot files."""
+        self.data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        self.path = os.path.join(self.data_dir, "accounts.snapshot")
+
+    def test_round_trip(self):
+        """Test that rows read back exactly as they were written."""
+        self.assertEqual(write_snapshot(self.path, ROWS, (1, 2, 3)), 3)
+        with AccountsSnapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 3)
+            self.assertEqual(list(snapshot), ROWS)
+            self.assertEqual(snapshot.source_signature, (1, 2, 3))
+            self.assertEqual(snapshot.type_names, ("ChequingAccount", "SavingsAccount", "InvestmentAccount"))
+
+    def test_columns_are_memoryviews(self):
+        """Test that numeric columns are exposed without copying."""
+        write_snapshot(self.path, ROWS)
+        with AccountsSnapshot(self.path) as snapshot:
+            balances = snapshot.column("balance")
+            self.assertIsInstance(balances, memoryview)
+            self.assertEqual(balances.tolist(), [15000.0, 301.54, 1200.87])
+            self.assertEqual(snapshot.column("account_type").tolist(), [0, 1, 2])
+
+    def test_empty_snapshot(self):
+        """Test that a snapshot without rows can be written and read."""
+        write_snapshot(self.path, [])
+        with AccountsSnapshot(self.path) as snapshot:
+            self.assertEqual(list(snapshot), [])
+
+    def test_invalid_file(self):
+        """Test that a file that is not a snapshot is rejected."""
+        with open(self.path, "wb") as file:
+            file.write(b"account_number,client_number\n" * 4)
+        with self.assertRaises(ValueError):
+            AccountsSnapshot(self.path)
+
+if __name__ == "__main__":
+    unittest.main()
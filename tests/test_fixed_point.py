@@ -0,0 +1,31 @@
+import unittest
+from decimal import Decimal
+from bank_account.fixed_point import format_cents, from_cents, to_cents
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class TestFixedPoint(unittest.TestCase):
+    """Test case for the integer cents conversions."""
+
+    def test_to_cents(self):
+        """Test that amounts convert to exact cents."""
+        self.assertEqual(to_cents(301.54), 30154)
+        self.assertEqual(to_cents(-50), -5000)
+        self.assertEqual(to_cents("1200.87"), 120087)
+        self.assertEqual(to_cents(Decimal("0.125")), 12)
+        self.assertEqual(to_cents(0.1 + 0.2), 30)
+
+    def test_to_cents_invalid(self):
+        """Test that values that are not finite numbers are rejected."""
+        for value in ("invalid", None, float("nan"), float("inf")):
+            with self.assertRaises(ValueError):
+                to_cents(value)
+
+    def test_format_cents_matches_float_format(self):
+        """Test that labels match the f"${x:,.2f}" format used by the accounts."""
+        for cents in (0, 5, -95000, 123456789, -1):
+            self.assertEqual(format_cents(cents), f"${from_cents(cents):,.2f}")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 import unittest
 from datetime import date, timedelta
+from unittest.mock import patch
 from bank_account.investment_account import InvestmentAccount
+from patterns.strategy import management_fee_strategy
+from patterns.strategy.management_fee_strategy import ManagementFeeStrategy
 
 __author__ = "Md Apurba Khan"
 __version__ = "1.6.0"
@@ -19,5 +22,25 @@ class TestInvestmentAccount(unittest.TestCase):
         account = InvestmentAccount("INV124", "C001", 1000.00, ten_years_ago, 2.55)
         self.assertEqual(account.get_service_charges(), 0.50)  # Only BASE_SERVICE_CHARGE (fee waived)
 
+    def test_fee_waiver_follows_today(self):
+        """Test that the ten year cutoff moves with the date and expires cached charges."""
+        opened = date(2015, 6, 1)
+        account = InvestmentAccount("INV125", "C001", 1000.00, opened, 2.55)
+
+        class Today(date):
+            current = opened + timedelta(days=3651)
+
+            @classmethod
+            def today(cls):
+                return cls.current
+
+        with patch.object(management_fee_strategy, "date", Today), \
+                patch.object(ManagementFeeStrategy, "TEN_YEARS_AGO", management_fee_strategy._YearsBeforeToday(10)):
+            self.assertEqual(account.get_service_charges(), 0.50 + 2.55)
+            self.assertIn("$2.55", str(account))
+            Today.current += timedelta(days=1)
+            self.assertEqual(account.get_service_charges(), 0.50)
+            self.assertIn("Waived", str(account))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,350 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date
+from unittest.mock import patch
+from bank_account.savings_account import SavingsAccount
+from user_interface import manage_data
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+CLIENTS_CSV = """client_number,first_name,last_name,email_address
+1001,John,Doe,johndoe@pixell.com
+1002,Jane,Smith,janesmith@pixell.com
+"""
+
+ACCOUNTS_CSV = """account_number,client_number,balance,date_created,account_type,overdraft_limit,overdraft_rate,minimum_balance,management_fee
+20001,1001,15000,2023-01-10,ChequingAccount,-50,0.035,Null,Null
+20002,1001,301.54,2023-01-15,SavingsAccount,Null,Null,50,Null
+20003,1002,1200.87,2023-02-01,InvestmentAccount,Null,Null,Null,2.55
+"""
+
+class TestManageData(unittest.TestCase):
+    """Test case for the manage_data persistence functions."""
+
+    def setUp(self):
+        """Write sample data files to a temporary directory and point manage_data at them."""
+        self.data_dir = tempfile.mkdtemp()
+        self.clients_path = os.path.join(self.data_dir, "clients.csv")
+        self.accounts_path = os.path.join(self.data_dir, "accounts.csv")
+        self.journal_path = os.path.join(self.data_dir, "accounts.journal")
+        self.snapshot_path = os.path.join(self.data_dir, "accounts.snapshot")
+        with open(self.clients_path, "w", newline="") as file:
+            file.write(CLIENTS_CSV)
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV)
+
+        for name, value in (("clients_csv_path", self.clients_path),
+                            ("accounts_csv_path", self.accounts_path),
+                            ("accounts_journal_path", self.journal_path),
+                            ("accounts_snapshot_path", self.snapshot_path)):
+            patcher = patch.object(manage_data, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.data_dir)
+
+    def read_balance(self, account_number):
+        """Return the balance column of the given account as stored in accounts.csv."""
+        with open(self.accounts_path, newline="") as file:
+            for line in file:
+                fields = line.strip().split(",")
+                if fields[0] == account_number:
+                    return fields[2]
+        return None
+
+    def test_update_data_rewrites_balance(self):
+        """Test that a non-journaled update rewrites accounts.csv."""
+        _, accounts = manage_data.load_data()
+        accounts["20002"].deposit(100.00)
+        manage_data.update_data(accounts["20002"])
+        self.assertEqual(self.read_balance("20002"), "401.54")
+        self.assertFalse(os.path.exists(self.journal_path))
+
+    def test_journaled_update_is_replayed_by_load_data(self):
+        """Test that journaled balances override accounts.csv when loading."""
+        _, accounts = manage_data.load_data()
+        accounts["20001"].withdraw(500.00)
+        manage_data.update_data(accounts["20001"], journaled=True)
+        accounts["20001"].withdraw(500.00)
+        manage_data.update_data(accounts["20001"], journaled=True)
+
+        self.assertEqual(self.read_balance("20001"), "15000")
+        _, reloaded = manage_data.load_data()
+        self.assertEqual(reloaded["20001"].balance, 14000.00)
+
+    def test_compact_journal_folds_balances_into_csv(self):
+        """Test that compaction writes journaled balances and removes the journal."""
+        _, accounts = manage_data.load_data()
+        accounts["20003"].deposit(99.13)
+        manage_data.update_data(accounts["20003"], journaled=True)
+
+        self.assertTrue(manage_data.compact_journal())
+        self.assertEqual(self.read_balance("20003"), "1300.0")
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertFalse(manage_data.compact_journal())
+
+    def test_background_compaction(self):
+        """Test that a background compaction folds the journal."""
+        _, accounts = manage_data.load_data()
+        accounts["20002"].deposit(0.46)
+        manage_data.update_data(accounts["20002"], journaled=True)
+        manage_data.start_background_compaction().join()
+        self.assertEqual(self.read_balance("20002"), "302.0")
+
+    def test_read_journal_waits_for_compaction(self):
+        """Test that a compaction starting between the two journal files is held until both are read."""
+        _, accounts = manage_data.load_data()
+        accounts["20001"].deposit(1.00)
+        manage_data.update_data(accounts["20001"], journaled=True)
+        read_journal_file = manage_data._read_journal_file
+        compactions = []
+
+        def read_then_compact(path, balances):
+            read_journal_file(path, balances)
+            if not compactions:
+                compactions.append(threading.Thread(target=manage_data.compact_journal))
+                compactions[0].start()
+                compactions[0].join(timeout=0.2)
+
+        with patch.object(manage_data, "_read_journal_file", side_effect=read_then_compact):
+            balances = manage_data.read_journal()
+        compactions[0].join()
+
+        self.assertEqual(balances, {"20001": "15001.0"})
+        self.assertEqual(self.read_balance("20001"), "15001.0")
+
+    def test_update_many_writes_all_balances(self):
+        """Test that update_many writes every account in one pass."""
+        _, accounts = manage_data.load_data()
+        accounts["20001"].deposit(1.00)
+        accounts["20002"].deposit(1.00)
+        manage_data.update_many([accounts["20001"], accounts["20002"]])
+        self.assertEqual(self.read_balance("20001"), "15001.0")
+        self.assertEqual(self.read_balance("20002"), "302.54")
+
+    def test_damaged_journal_records_are_skipped(self):
+        """Test that a torn or corrupted journal record is logged and skipped."""
+        _, accounts = manage_data.load_data()
+        accounts["20001"].deposit(1.00)
+        manage_data.update_data(accounts["20001"], journaled=True)
+        with open(self.journal_path, "a", newline="") as file:
+            file.write("20002,999.99,00000000\r\n20003,12")
+
+        accounts["20003"].deposit(1.00)
+        with self.assertLogs(level="ERROR") as logs:
+            manage_data.update_data(accounts["20003"], journaled=True)
+            balances = manage_data.read_journal()
+        self.assertEqual(balances, {"20001": "15001.0", "20003": "1201.87"})
+        self.assertEqual(len(logs.output), 2)
+
+    def test_update_many_journals_balances_as_one_record(self):
+        """Test that the balances of one write are replayed together or not at all."""
+        _, accounts = manage_data.load_data()
+        accounts["20001"].transfer_to(accounts["20002"], 500.00)
+        manage_data.update_many([accounts["20001"], accounts["20002"]], journaled=True)
+        with open(self.journal_path, newline="") as file:
+            record = file.read()
+        self.assertEqual(len(record.splitlines()), 1)
+
+        with open(self.journal_path, "w", newline="") as file:
+            file.write(record[:record.index("801.54") + 3])
+        with self.assertLogs(level="ERROR"):
+            self.assertEqual(manage_data.read_journal(), {})
+
+    def test_failed_rewrite_keeps_csv_and_journal(self):
+        """Test that a crash while replacing accounts.csv loses neither file."""
+        _, accounts = manage_data.load_data()
+        accounts["20002"].deposit(100.00)
+        replace = os.replace
+
+        def fail_csv_replace(source, destination):
+            if destination == self.accounts_path:
+                raise OSError("disk full")
+            replace(source, destination)
+
+        with patch.object(manage_data.os, "replace", side_effect=fail_csv_replace):
+            with self.assertLogs(level="ERROR"):
+                manage_data.update_data(accounts["20002"])
+
+        self.assertEqual(self.read_balance("20002"), "301.54")
+        _, reloaded = manage_data.load_data()
+        self.assertEqual(reloaded["20002"].balance, 401.54)
+        self.assertTrue(manage_data.compact_journal())
+        self.assertEqual(self.read_balance("20002"), "401.54")
+
+    def test_write_batch_commits_on_exit(self):
+        """Test that a write batch only writes when the with block exits."""
+        _, accounts = manage_data.load_data()
+        with manage_data.WriteBatch(journaled=True) as batch:
+            accounts["20003"].deposit(10.00)
+            batch.add(accounts["20003"])
+            accounts["20003"].deposit(10.00)
+            batch.add(accounts["20003"])
+            self.assertEqual(len(batch), 1)
+            self.assertFalse(os.path.exists(self.journal_path))
+
+        with open(self.journal_path) as file:
+            self.assertEqual(len(file.read().splitlines()), 1)
+        self.assertEqual(manage_data.read_journal(), {"20003": "1220.87"})
+
+    def test_write_batch_group_commit_window(self):
+        """Test that changes added within the commit window are flushed together."""
+        _, accounts = manage_data.load_data()
+        batch = manage_data.WriteBatch(commit_window=0.05)
+        with patch.object(manage_data, "update_many") as update_many:
+            batch.add(accounts["20001"])
+            batch.add(accounts["20002"])
+            deadline = time.monotonic() + 5
+            while not update_many.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+        update_many.assert_called_once_with([accounts["20001"], accounts["20002"]], False)
+
+    def test_load_data_builds_client_index(self):
+        """Test that load_data can return an index of each client's accounts."""
+        _, accounts, index = manage_data.load_data(build_index=True)
+        self.assertEqual(index.account_numbers(1001), ["20001", "20002"])
+        self.assertEqual(index.accounts_for("1002", accounts), [accounts["20003"]])
+        self.assertEqual(index.account_numbers(9999), [])
+        self.assertEqual(index.service_charges_for(1001, accounts), 0.50 + 0.50)
+        self.assertEqual(index.service_charges_for(9999, accounts), 0.0)
+
+    def test_client_index_tracks_new_and_removed_accounts(self):
+        """Test that adding and removing accounts keeps the index current."""
+        _, accounts, index = manage_data.load_data(build_index=True)
+        new_account = SavingsAccount("20004", "1002", 10.00, date(2024, 1, 1), 50.0)
+        index.add(new_account)
+        self.assertEqual(index.account_numbers(1002), ["20003", "20004"])
+        index.remove("20003")
+        self.assertEqual(index.account_numbers(1002), ["20004"])
+        self.assertNotIn("20003", index)
+
+    def test_iter_accounts_streams_valid_accounts(self):
+        """Test that iter_accounts yields the same accounts as load_data, one at a time."""
+        _, accounts = manage_data.load_data()
+        stream = manage_data.iter_accounts()
+        self.assertEqual(next(stream).account_number, "20001")
+        self.assertEqual([account.account_number for account in stream], ["20002", "20003"])
+        self.assertEqual([client.client_number for client in manage_data.iter_clients()], [1001, 1002])
+
+    def test_iter_accounts_logs_invalid_rows(self):
+        """Test that iter_accounts logs and skips invalid rows."""
+        with open(self.accounts_path, "a", newline="") as file:
+            file.write("20004,1001,ten,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+            file.write("20005,9999,10,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+        with self.assertLogs(level="ERROR") as logs:
+            numbers = [account.account_number for account in manage_data.iter_accounts({1001, 1002})]
+        self.assertEqual(numbers, ["20001", "20002", "20003"])
+        self.assertEqual(logs.output, [
+            "ERROR:root:Unable to create bank account: could not convert string to float: 'ten'",
+            "ERROR:root:Bank Account: 20005 contains invalid client number 9999",
+        ])
+
+    def test_management_fee_column_is_optional(self):
+        """Test that investment accounts load from files and records without a management_fee column."""
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write("\n".join(line.rsplit(",", 1)[0] for line in ACCOUNTS_CSV.splitlines()) + "\n")
+        _, accounts = manage_data.load_data()
+        self.assertEqual(sorted(accounts), ["20001", "20002", "20003"])
+        self.assertEqual(accounts["20003"].balance, 1200.87)
+        self.assertEqual([account.account_number for account in manage_data.load_client_accounts(1002)], ["20003"])
+
+        record = {"account_number": "20003", "client_number": "1002", "balance": "1200.87",
+                  "date_created": "2023-02-01", "account_type": "InvestmentAccount"}
+        self.assertEqual(manage_data._parse_account_record(record, {})[-1], None)
+
+    def test_load_data_from_snapshot(self):
+        """Test that load_data reads an up-to-date snapshot instead of parsing accounts.csv."""
+        self.assertEqual(manage_data.write_accounts_snapshot(), 3)
+        _, expected = manage_data.load_data()
+        with patch.object(manage_data._AccountRowDecoder, "decode") as parse:
+            _, accounts = manage_data.load_data(use_snapshot=True)
+        parse.assert_not_called()
+        self.assertEqual({number: str(account) for number, account in accounts.items()},
+                         {number: str(account) for number, account in expected.items()})
+
+    def test_stale_snapshot_is_ignored(self):
+        """Test that a snapshot older than the journal is not used."""
+        manage_data.write_accounts_snapshot()
+        _, accounts = manage_data.load_data()
+        accounts["20001"].deposit(1.00)
+        manage_data.update_data(accounts["20001"], journaled=True)
+
+        self.assertIsNone(manage_data.open_accounts_snapshot())
+        _, reloaded = manage_data.load_data(use_snapshot=True)
+        self.assertEqual(reloaded["20001"].balance, 15001.00)
+
+    def test_parallel_load_matches_serial_load(self):
+        """Test that parsing in a process pool gives the same accounts and errors."""
+        with open(self.accounts_path, "a", newline="") as file:
+            file.write("20004,1001,ten,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+            file.write("20005,9999,10,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+            file.write("20006,1002,10,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+            file.write(",1002,10,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+        with self.assertLogs(level="ERROR") as serial_logs:
+            clients, accounts = manage_data.load_data()
+        with patch.object(manage_data, "PARALLEL_MIN_CHUNK_BYTES", 64):
+            with self.assertLogs(level="ERROR") as parallel_logs:
+                parallel_clients, parallel_accounts = manage_data.load_data(workers=2)
+
+        self.assertEqual(parallel_logs.output, serial_logs.output)
+        self.assertEqual(sorted(parallel_clients), sorted(clients))
+        self.assertEqual({number: str(account) for number, account in parallel_accounts.items()},
+                         {number: str(account) for number, account in accounts.items()})
+
+    def test_load_account_store_matches_load_data(self):
+        """Test that the account store holds the same accounts as load_data."""
+        _, accounts = manage_data.load_data()
+        store = manage_data.load_account_store()
+        self.assertEqual([str(store.view(index)) for index in range(len(store))],
+                         [str(account) for account in accounts.values()])
+
+    def test_incremental_reload_reports_differences(self):
+        """Test that the reloader returns the accounts added, changed and removed."""
+        reloader = manage_data.IncrementalReloader(block_lines=2)
+        clients, accounts = reloader.load()
+        self.assertEqual(list(accounts), ["20001", "20002", "20003"])
+        self.assertFalse(reloader.reload())
+
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV.replace("301.54", "401.54").replace(
+                "20003,1002,1200.87,2023-02-01,InvestmentAccount,Null,Null,Null,2.55\n", ""))
+            file.write("20004,1002,10,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+        diff = reloader.reload()
+        self.assertEqual(list(diff.added), ["20004"])
+        self.assertEqual(diff.changed["20002"].balance, 401.54)
+        self.assertEqual(diff.removed, ["20003"])
+
+        diff.apply(accounts)
+        self.assertEqual(sorted(accounts), ["20001", "20002", "20004"])
+        self.assertIs(reloader.accounts["20001"], accounts["20001"])
+
+    def test_incremental_reload_parses_only_changed_blocks(self):
+        """Test that appending rows only reparses the last block."""
+        reloader = manage_data.IncrementalReloader(block_lines=2)
+        reloader.load()
+        with open(self.accounts_path, "a", newline="") as file:
+            file.write("20004,1002,10,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+
+        decode = manage_data._AccountRowDecoder.decode
+        with patch.object(manage_data._AccountRowDecoder, "decode", autospec=True, side_effect=decode) as parse:
+            diff = reloader.reload()
+        self.assertEqual(list(diff.added), ["20004"])
+        self.assertEqual(parse.call_count, 2)
+
+    def test_incremental_reload_applies_journal(self):
+        """Test that newly journaled balances are reported as changed accounts."""
+        reloader = manage_data.IncrementalReloader()
+        _, accounts = reloader.load()
+        accounts["20001"].deposit(5.00)
+        manage_data.update_data(accounts["20001"], journaled=True)
+
+        diff = reloader.reload()
+        self.assertEqual(list(diff.changed), ["20001"])
+        self.assertEqual(diff.changed["20001"].balance, 15005.00)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from services import month_end_charges
+from tests.test_manage_data import ACCOUNTS_CSV, CLIENTS_CSV
+from user_interface import manage_data
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+# 20001 is overdrawn, 20002 is below its minimum balance and 20004 belongs to no client.
+MONTH_END_ACCOUNTS_CSV = ACCOUNTS_CSV.replace("20001,1001,15000,", "20001,1001,-200,").replace(
+    "301.54", "30.00") + "20004,9999,10,2023-01-10,SavingsAccount,Null,Null,50,Null\n"
+
+class TestMonthEndCharges(unittest.TestCase):
+    """Test case for the month-end service charge run."""
+
+    def setUp(self):
+        """Write sample data files to a temporary directory and point manage_data at them."""
+        self.data_dir = tempfile.mkdtemp()
+        self.run_dir = os.path.join(self.data_dir, "month_end", "2024-01")
+        self.accounts_path = os.path.join(self.data_dir, "accounts.csv")
+        clients_path = os.path.join(self.data_dir, "clients.csv")
+        with open(clients_path, "w", newline="") as file:
+            file.write(CLIENTS_CSV)
+        with open(self.accounts_path, "w", newline="") as file:
+            file.write(MONTH_END_ACCOUNTS_CSV)
+
+        for name, value in (("clients_csv_path", clients_path),
+                            ("accounts_csv_path", self.accounts_path),
+                            ("accounts_journal_path", os.path.join(self.data_dir, "accounts.journal")),
+                            ("accounts_snapshot_path", os.path.join(self.data_dir, "accounts.snapshot")),
+                            ("PARALLEL_MIN_CHUNK_BYTES", 64)):
+            patcher = patch.object(manage_data, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.data_dir)
+
+    def balances(self):
+        """Return the balance of each account in accounts.csv."""
+        with open(self.accounts_path, newline="") as file:
+            return {line.split(",")[0]: line.split(",")[2] for line in file.read().splitlines()[1:]}
+
+    def run_month_end(self):
+        """Run the month-end charges for 2024-01, expecting the invalid row to be logged."""
+        with self.assertLogs(level="ERROR"):
+            return month_end_charges.run_month_end("2024-01", workers=2, run_dir=self.run_dir)
+
+    def test_charges_are_posted_and_ledgered(self):
+        """Test that each valid account is charged by its strategy and the ledger records it."""
+        summary = self.run_month_end()
+        # 0.50 + 200 * 0.035, 0.50 * 2.0, and 0.50 + 2.55 for an investment under ten years old.
+        self.assertEqual(summary.accounts_charged, 3)
+        self.assertEqual(summary.total_charges_cents, 750 + 100 + 305)
+        self.assertGreater(summary.shards, 1)
+        self.assertEqual(self.balances(), {"20001": "-207.50", "20002": "29.00",
+                                           "20003": "1197.82", "20004": "10"})
+        ledger = list(month_end_charges.iter_ledger(self.run_dir))
+        self.assertEqual([row["charge"] for row in ledger], ["7.50", "1.00", "3.05"])
+
+        with self.assertLogs(level="ERROR"):
+            _, accounts = manage_data.load_data()
+        self.assertEqual(accounts["20001"].balance, -207.50)
+
+    def test_rerun_does_not_charge_twice(self):
+        """Test that running a period again leaves the posted balances alone."""
+        self.run_month_end()
+        summary = month_end_charges.run_month_end("2024-01", workers=2, run_dir=self.run_dir)
+        self.assertEqual(summary.resumed_shards, summary.shards)
+        self.assertEqual(self.balances()["20001"], "-207.50")
+
+    def test_interrupted_run_resumes(self):
+        """Test that a run interrupted before posting resumes without recharging finished shards."""
+        replace = os.replace
+
+        def fail_accounts_replace(source, destination):
+            if destination == self.accounts_path:
+                raise OSError("interrupted")
+            replace(source, destination)
+
+        with patch.object(month_end_charges.os, "replace", side_effect=fail_accounts_replace):
+            with self.assertRaises(OSError):
+                self.run_month_end()
+        self.assertEqual(self.balances()["20001"], "-200")
+        # Recharge the last shard, which holds the account of an unknown client.
+        os.remove(os.path.join(self.run_dir, max(name for name in os.listdir(self.run_dir)
+                                                 if name.startswith("charges-"))))
+
+        summary = self.run_month_end()
+        self.assertEqual(summary.resumed_shards, summary.shards - 1)
+        self.assertEqual(self.balances(), {"20001": "-207.50", "20002": "29.00",
+                                           "20003": "1197.82", "20004": "10"})
+
+    def test_failed_compaction_stops_the_run(self):
+        """Test that the run does not start when the journal cannot be folded into accounts.csv."""
+        with self.assertLogs(level="ERROR"):
+            _, accounts = manage_data.load_data()
+        accounts["20001"].deposit(100.00)
+        manage_data.update_data(accounts["20001"], journaled=True)
+        with patch.object(manage_data, "_rewrite_balances", return_value=False):
+            with self.assertRaises(RuntimeError):
+                month_end_charges.run_month_end("2024-01", workers=2, run_dir=self.run_dir)
+        self.assertFalse(os.path.exists(os.path.join(self.run_dir, "manifest.json")))
+
+        summary = self.run_month_end()
+        self.assertEqual(summary.accounts_charged, 3)
+        self.assertEqual(self.balances()["20001"], "-104.00")
+
+    def test_balance_column_is_found_by_name(self):
+        """Test that posting finds the account number column by name, wherever it is."""
+        lines = MONTH_END_ACCOUNTS_CSV.splitlines()
+        with open(self.accounts_path, "w", newline="") as file:
+            for line in lines:
+                fields = line.split(",")
+                file.write(",".join([fields[1], fields[0]] + fields[2:]) + "\n")
+        self.run_month_end()
+        with open(self.accounts_path, newline="") as file:
+            balances = {line.split(",")[1]: line.split(",")[2] for line in file.read().splitlines()[1:]}
+        self.assertEqual(balances, {"20001": "-207.50", "20002": "29.00", "20003": "1197.82", "20004": "10"})
+
+    def test_changed_accounts_stop_a_resumed_run(self):
+        """Test that a run does not resume over accounts changed since it started."""
+        with patch.object(month_end_charges, "_post_charges", side_effect=OSError("interrupted")):
+            with self.assertRaises(OSError):
+                self.run_month_end()
+        with open(self.accounts_path, "a", newline="") as file:
+            file.write("20005,1002,10,2023-01-10,SavingsAccount,Null,Null,50,Null\n")
+        with self.assertRaises(RuntimeError):
+            month_end_charges.run_month_end("2024-01", workers=2, run_dir=self.run_dir)
+
+    def test_accounts_changed_while_charging_are_not_posted(self):
+        """Test that posting stops when a balance changes after the accounts were charged."""
+        with self.assertLogs(level="ERROR"):
+            _, accounts = manage_data.load_data()
+        process_pool = month_end_charges.ProcessPoolExecutor
+
+        def deposit_then_charge(*args, **kwargs):
+            accounts["20001"].deposit(100.00)
+            manage_data.update_data(accounts["20001"], journaled=True)
+            return process_pool(*args, **kwargs)
+
+        with patch.object(month_end_charges, "ProcessPoolExecutor", side_effect=deposit_then_charge):
+            with self.assertRaisesRegex(RuntimeError, "Accounts changed"):
+                self.run_month_end()
+        self.assertEqual(self.balances()["20001"], "-200")
+        with self.assertLogs(level="ERROR"):
+            _, reloaded = manage_data.load_data()
+        self.assertEqual(reloaded["20001"].balance, -100.00)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import threading
+import time
+import unittest
+from datetime import date
+from bank_account.chequing_account import ChequingAccount
+from client.client import Client
+from patterns.observer import notification_dispatcher
+from patterns.observer.notification_dispatcher import Notification, NotificationDispatcher
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class RecordingSink:
+    """Sink that records each notification and the thread that delivered it."""
+
+    def __init__(self, gate: threading.Event = None):
+        """Initialize the sink, optionally holding the worker's deliveries until gate is set."""
+        self.gate = gate
+        self.delivered = []
+
+    def __call__(self, notifications):
+        """Record a batch of notifications."""
+        if self.gate is not None and threading.current_thread().name == "notification-dispatcher":
+            self.gate.wait()
+        self.delivered.extend((threading.current_thread().name, notification) for notification in notifications)
+
+class TestNotificationDispatcher(unittest.TestCase):
+    """Test case for the background notification dispatcher."""
+
+    def test_client_alerts_are_delivered_by_the_worker(self):
+        """Test that a client's alerts go through the shared dispatcher's sink in order."""
+        sink = RecordingSink()
+        dispatcher = NotificationDispatcher(sink)
+        previous = notification_dispatcher.set_dispatcher(dispatcher)
+        self.addCleanup(notification_dispatcher.set_dispatcher, previous)
+
+        account = ChequingAccount("CHK123", "1001", 500.00, date(2023, 1, 1), -1000.00, 0.05)
+        client = Client(1001, "John", "Doe", "johndoe@pixell.com")
+        account.attach(client)
+        account.deposit(20000.00)
+        account.withdraw(20450.00)
+        dispatcher.flush()
+        dispatcher.shutdown()
+
+        self.assertEqual({thread for thread, _ in sink.delivered}, {"notification-dispatcher"})
+        self.assertEqual([notification.message.split(": ", 2)[2] for _, notification in sink.delivered], [
+            "Large transaction $20,000.00: on account CHK123",
+            "Low balance warning $50.00: on account CHK123",
+            "Large transaction $20,450.00: on account CHK123",
+        ])
+        self.assertTrue(all(notification.email_address == "johndoe@pixell.com" for _, notification in sink.delivered))
+
+    def test_full_queue_applies_back_pressure(self):
+        """Test that dispatch waits for room and then delivers on the caller when it times out."""
+        gate = threading.Event()
+        sink = RecordingSink(gate)
+        dispatcher = NotificationDispatcher(sink, maxsize=2, timeout=0.05)
+        for number in range(6):
+            dispatcher.dispatch("a@pixell.com", "Subject", str(number))
+        gate.set()
+        dispatcher.shutdown()
+
+        delivered_by_caller = [notification.message for thread, notification in sink.delivered
+                               if thread == threading.current_thread().name]
+        self.assertEqual(len(sink.delivered), 6)
+        self.assertGreaterEqual(len(delivered_by_caller), 2)
+
+    def test_callers_wait_for_room_concurrently(self):
+        """Test that callers blocked on a full queue do not wait for each other's timeouts."""
+        gate = threading.Event()
+        sink = RecordingSink(gate)
+        dispatcher = NotificationDispatcher(sink, maxsize=1, timeout=0.5)
+        while not sink.delivered:
+            dispatcher.dispatch("a@pixell.com", "Subject", "filler")
+        callers = [threading.Thread(target=dispatcher.dispatch, args=("a@pixell.com", "Subject", str(number)),
+                                    name=f"caller-{number}") for number in range(4)]
+        start = time.monotonic()
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+        elapsed = time.monotonic() - start
+        gate.set()
+        dispatcher.shutdown()
+
+        self.assertLess(elapsed, 1.5)
+        self.assertEqual(sorted(notification.message for thread, notification in sink.delivered
+                                if thread.startswith("caller-")), ["0", "1", "2", "3"])
+
+    def test_shutdown_flushes_queued_notifications(self):
+        """Test that shutdown delivers everything queued and later notifications go inline."""
+        sink = RecordingSink()
+        dispatcher = NotificationDispatcher(sink)
+        for number in range(2000):
+            dispatcher.dispatch("a@pixell.com", "Subject", str(number))
+        dispatcher.shutdown()
+        dispatcher.dispatch("a@pixell.com", "Subject", "late")
+
+        self.assertEqual([notification.message for _, notification in sink.delivered],
+                         [str(number) for number in range(2000)] + ["late"])
+        self.assertEqual(sink.delivered[-1][0], threading.current_thread().name)
+
+    def test_sink_errors_are_logged(self):
+        """Test that a failing sink is logged and the worker keeps delivering."""
+        delivered = []
+
+        def flaky_sink(notifications):
+            if any(notification.message == "bad" for notification in notifications):
+                raise OSError("mail server down")
+            delivered.extend(notifications)
+
+        with NotificationDispatcher(flaky_sink) as dispatcher:
+            with self.assertLogs(level="ERROR"):
+                dispatcher.dispatch("a@pixell.com", "Subject", "bad")
+                dispatcher.flush()
+            dispatcher.dispatch("a@pixell.com", "Subject", "good")
+        self.assertEqual(delivered, [Notification("a@pixell.com", "Subject", "good")])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import gc
+import unittest
+from datetime import date
+from bank_account.chequing_account import ChequingAccount
+from client.client import Client
+from patterns.observer.observer import Observer
+from patterns.observer.observer_registry import LARGE_TRANSACTION, LOW_BALANCE, ObserverRegistry
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class RecordingObserver(Observer):
+    """Observer that records the messages it receives in a shared list."""
+
+    def __init__(self, name: str, received: list):
+        """Initialize with a name and the list to record (name, message) into."""
+        self.name = name
+        self.received = received
+
+    def update(self, message: str) -> None:
+        """Record a message."""
+        self.received.append((self.name, message))
+
+class TestObserverRegistry(unittest.TestCase):
+    """Test case for the weak, topic-indexed observer registry."""
+
+    def setUp(self):
+        """Create an account near its low balance level."""
+        self.account = ChequingAccount("CHK123", "1001", 500.00, date(2023, 1, 1), -1000.00, 0.05)
+        self.received = []
+
+    def test_topics_select_the_notified_observers(self):
+        """Test that observers only get their topics and are notified in attach order."""
+        everything = RecordingObserver("everything", self.received)
+        large = RecordingObserver("large", self.received)
+        low = RecordingObserver("low", self.received)
+        self.account.attach(large, [LARGE_TRANSACTION])
+        self.account.attach(everything)
+        self.account.attach(low, {LOW_BALANCE})
+
+        self.account.withdraw(450.00)
+        self.account.deposit(20000.00)
+        self.account.notify("Statement ready")
+        self.assertEqual(self.received, [
+            ("everything", "Low balance warning $50.00: on account CHK123"),
+            ("low", "Low balance warning $50.00: on account CHK123"),
+            ("large", "Large transaction $20,000.00: on account CHK123"),
+            ("everything", "Large transaction $20,000.00: on account CHK123"),
+            ("large", "Statement ready"),
+            ("everything", "Statement ready"),
+            ("low", "Statement ready"),
+        ])
+
+    def test_attach_detach_and_resubscribe(self):
+        """Test that attach is idempotent, topics can be changed and detach is silent when absent."""
+        registry = ObserverRegistry()
+        first = RecordingObserver("first", self.received)
+        second = RecordingObserver("second", self.received)
+        registry.attach(first)
+        registry.attach(second)
+        registry.attach(first)
+        registry.notify("a", LOW_BALANCE)
+        registry.attach(first, [LARGE_TRANSACTION])
+        registry.notify("b", LOW_BALANCE)
+        registry.notify("c")
+        registry.detach(second)
+        registry.detach(second)
+        registry.notify("d", LARGE_TRANSACTION)
+        self.assertEqual(len(registry), 1)
+        self.assertEqual(self.received, [("first", "a"), ("second", "a"), ("second", "b"),
+                                         ("second", "c"), ("first", "c"), ("first", "d")])
+
+    def test_observers_are_held_weakly(self):
+        """Test that a discarded observer is dropped and equal clients count as one."""
+        observer = RecordingObserver("gone", self.received)
+        self.account.attach(observer)
+        del observer
+        gc.collect()
+        self.account.withdraw(450.00)
+        self.assertEqual(self.received, [])
+        self.assertEqual(len(self.account._observers), 0)
+
+        client = Client(1001, "John", "Doe", "johndoe@pixell.com")
+        self.account.attach(client)
+        self.account.attach(Client(1001, "John", "Doe", "johndoe@pixell.com"))
+        self.assertEqual(len(self.account._observers), 1)
+        self.account.detach(Client(1001, "John", "Doe", "johndoe@pixell.com"))
+        self.assertNotIn(client, self.account._observers)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import gzip
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from utility.outbox_writer import OutboxWriter, format_email
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class TestOutboxWriter(unittest.TestCase):
+    """Test case for the buffered outbox writer."""
+
+    def setUp(self):
+        """Use a temporary outbox file."""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "output", "observer_emails.txt")
+
+    def read(self, path=None) -> str:
+        """Return the contents of the outbox file, or an empty string if it does not exist."""
+        try:
+            with open(path or self.path, encoding="utf-8") as file:
+                return file.read()
+        except FileNotFoundError:
+            return ""
+
+    def test_emails_are_buffered_until_the_buffer_fills(self):
+        """Test that nothing is written until buffer_bytes build up or the writer is flushed."""
+        email = format_email("a@pixell.com", "Subject", "Message")
+        with OutboxWriter(self.path, buffer_bytes=len(email) * 3, flush_interval=None) as outbox:
+            outbox.write("a@pixell.com", "Subject", "Message")
+            outbox.write("a@pixell.com", "Subject", "Message")
+            self.assertEqual(self.read(), "")
+            outbox([("a@pixell.com", "Subject", "Message")])
+            self.assertEqual(self.read(), email * 3)
+            outbox.write("b@pixell.com", "Subject", "Message")
+        self.assertEqual(self.read(), email * 3 + format_email("b@pixell.com", "Subject", "Message"))
+
+    def test_emails_are_flushed_after_the_interval(self):
+        """Test that a buffered email is written once the flush interval passes."""
+        outbox = OutboxWriter(self.path, flush_interval=0.01)
+        self.addCleanup(outbox.close)
+        outbox.write("a@pixell.com", "Subject", "Message")
+        deadline = time.monotonic() + 5
+        while not self.read() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.read(), format_email("a@pixell.com", "Subject", "Message"))
+
+    def test_failed_write_keeps_the_emails(self):
+        """Test that emails stay buffered when the file cannot be written and go out on the next flush."""
+        blocker = os.path.join(self.directory, "output")
+        with open(blocker, "w"):
+            pass
+        outbox = OutboxWriter(self.path, flush_interval=None)
+        outbox.write("a@pixell.com", "Subject", "Message")
+        with self.assertRaises(OSError):
+            outbox.flush()
+
+        os.remove(blocker)
+        outbox.write("b@pixell.com", "Subject", "Message")
+        outbox.close()
+        self.assertEqual(self.read(), format_email("a@pixell.com", "Subject", "Message")
+                         + format_email("b@pixell.com", "Subject", "Message"))
+
+    def test_segments_rotate_and_compress(self):
+        """Test that full segments are renamed, gzipped and that no email is lost or split."""
+        emails = [("a@pixell.com", "Subject", f"Message {number:04d}") for number in range(1000)]
+        record_size = len(format_email(*emails[0]))
+        with OutboxWriter(self.path, buffer_bytes=record_size * 10, flush_interval=None,
+                          segment_bytes=record_size * 100, compress=True) as outbox:
+            for email in emails:
+                outbox.write(*email)
+
+        segments = sorted(name for name in os.listdir(os.path.dirname(self.path)) if name.endswith(".gz"))
+        self.assertEqual(segments, [f"observer_emails.txt.{number:05d}.gz" for number in range(1, 10)])
+        contents = ""
+        for name in segments:
+            with gzip.open(os.path.join(os.path.dirname(self.path), name), "rt", encoding="utf-8") as file:
+                segment = file.read()
+            self.assertLessEqual(len(segment), record_size * 100)
+            contents += segment
+        contents += self.read()
+        self.assertEqual(contents, "".join(format_email(*email) for email in emails))
+
+        with OutboxWriter(self.path, flush_interval=None, segment_bytes=1) as outbox:
+            outbox.write("a@pixell.com", "Subject", "After restart")
+        self.assertTrue(os.path.exists(self.path + ".00010"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 import unittest
 from datetime import date
+from unittest.mock import patch
 from bank_account.savings_account import SavingsAccount
+from patterns.observer.observer import Observer
+from patterns.strategy.minimum_balance_strategy import MinimumBalanceStrategy
 
 __author__ = "Md Apurba Khan"
 __version__ = "1.6.0"
@@ -21,5 +24,44 @@ class TestSavingsAccount(unittest.TestCase):
         self.account.withdraw(60.00)  # Balance = 40.00, below 50.0
         self.assertEqual(self.account.get_service_charges(), 0.50 * 2.0)  # BASE_SERVICE_CHARGE * SERVICE_CHARGE_PREMIUM
 
+    def test_service_charges_are_cached_until_the_balance_changes(self):
+        """Test that the strategy only runs again after the balance changes."""
+        calculate = MinimumBalanceStrategy.calculate_service_charges
+        with patch.object(MinimumBalanceStrategy, "calculate_service_charges", autospec=True,
+                          side_effect=calculate) as strategy:
+            self.assertEqual([self.account.get_service_charges() for _ in range(3)], [0.50] * 3)
+            self.account.withdraw(60.00)
+            self.assertEqual(self.account.get_service_charges(), 1.00)
+            self.account.apply_transactions([20.00])
+            self.assertEqual(self.account.get_service_charges(), 0.50)
+            self.account.apply_transactions([-1000.00])  # Rejected, so the balance is unchanged
+            self.assertEqual(self.account.get_service_charges(), 0.50)
+        self.assertEqual(strategy.call_count, 3)
+
+    def test_accounts_are_slotted_and_share_strategies(self):
+        """Test that accounts have no instance dictionary and share equal strategies."""
+        other = SavingsAccount("SAV124", "C002", 20.00, date(2023, 1, 1), 50.0)
+        self.assertFalse(hasattr(self.account, "__dict__"))
+        self.assertIs(other._SavingsAccount__service_charge_strategy,
+                      self.account._SavingsAccount__service_charge_strategy)
+        self.assertEqual(other.get_service_charges(), 1.00)
+
+    def test_observer_list_is_allocated_on_attach(self):
+        """Test that the observer list is only created when an observer is attached."""
+        messages = []
+
+        class RecordingObserver(Observer):
+            def update(self, message):
+                messages.append(message)
+
+        self.assertIsNone(self.account._observers)
+        self.account.withdraw(60.00)
+        observer = RecordingObserver()
+        self.account.attach(observer)
+        self.account.withdraw(10.00)
+        self.account.detach(observer)
+        self.account.withdraw(10.00)
+        self.assertEqual(messages, ["Low balance warning $30.00: on account SAV123"])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
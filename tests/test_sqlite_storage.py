@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from storage.sqlite_storage import SQLiteStorage
+from user_interface import manage_data
+from tests.test_manage_data import ACCOUNTS_CSV, CLIENTS_CSV
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class TestSQLiteStorage(unittest.TestCase):
+    """Test case for the SQLiteStorage backend."""
+
+    def setUp(self):
+        """Import the sample CSV data into a temporary database and use it as the backend."""
+        self.data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        clients_path = os.path.join(self.data_dir, "clients.csv")
+        accounts_path = os.path.join(self.data_dir, "accounts.csv")
+        with open(clients_path, "w", newline="") as file:
+            file.write(CLIENTS_CSV)
+        with open(accounts_path, "w", newline="") as file:
+            file.write(ACCOUNTS_CSV)
+
+        self.db_path = os.path.join(self.data_dir, "pixell_river.db")
+        self.storage = SQLiteStorage(self.db_path)
+        self.addCleanup(self.storage.close)
+        self.assertEqual(self.storage.import_csv(clients_path, accounts_path), (2, 3))
+
+        patcher = patch.object(manage_data, "_storage_backend", self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_load_data_reads_from_backend(self):
+        """Test that load_data builds the same objects from the database."""
+        clients, accounts = manage_data.load_data()
+        self.assertEqual(sorted(clients), [1001, 1002])
+        self.assertEqual(list(accounts), ["20001", "20002", "20003"])
+        self.assertEqual(accounts["20002"].balance, 301.54)
+        self.assertEqual(accounts["20001"].__class__.__name__, "ChequingAccount")
+
+    def test_update_data_writes_single_row(self):
+        """Test that update_data stores the new balance in the database."""
+        _, accounts = manage_data.load_data()
+        accounts["20003"].withdraw(200.87)
+        manage_data.update_data(accounts["20003"])
+        self.assertAlmostEqual(self.storage.get_account_record("20003")["balance"], 1000.00)
+
+        reopened = SQLiteStorage(self.db_path)
+        self.addCleanup(reopened.close)
+        self.assertAlmostEqual(reopened.get_account_record("20003")["balance"], 1000.00)
+
+    def test_load_client_accounts_uses_backend(self):
+        """Test that a single client's accounts can be queried."""
+        accounts = manage_data.load_client_accounts(1001)
+        self.assertEqual([account.account_number for account in accounts], ["20001", "20002"])
+        self.assertIsNone(self.storage.get_account_record("99999"))
+
+    def test_null_columns_round_trip(self):
+        """Test that empty optional columns come back as the CSV "Null" marker."""
+        record = self.storage.get_account_record("20001")
+        self.assertEqual(record["minimum_balance"], "Null")
+        self.assertEqual(record["overdraft_limit"], -50.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from datetime import date
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from patterns.strategy.minimum_balance_strategy import MinimumBalanceStrategy
+from patterns.strategy.service_charge_strategy import ServiceChargeStrategy
+from patterns.strategy.strategy_registry import StrategyRegistry, strategy_registry
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class FlatFeeStrategy(ServiceChargeStrategy):
+    """A strategy without its own batch kernel, for testing the generic one."""
+
+    __slots__ = ('__fee',)
+
+    def __init__(self, fee: float) -> None:
+        """Initialize with a flat fee."""
+        self.__fee = fee
+
+    def calculate_service_charges(self, account) -> float:
+        """Charge the flat fee on a positive balance, otherwise the base charge."""
+        return self.__fee if account.balance > 0 else self.BASE_SERVICE_CHARGE
+
+class TestStrategyRegistry(unittest.TestCase):
+    """Test case for the strategy batch kernels and the strategy registry."""
+
+    def test_kernels_match_single_account_charges(self):
+        """Test that each built-in kernel agrees with calculate_service_charges."""
+        opened = [date(2010, 1, 1), date(2023, 1, 1), date(2024, 6, 1)]
+        cases = [
+            ("ChequingAccount", [ChequingAccount("1", "1", balance, date(2023, 1, 1), -500.0, rate)
+                                 for balance, rate in ((-123.45, 0.035), (0.0, 0.05), (900.0, 0.01))],
+             {"overdraft_rate": [0.035, 0.05, 0.01], "overdraft_limit": [-500.0] * 3}),
+            ("SavingsAccount", [SavingsAccount("1", "1", balance, date(2023, 1, 1), 50.0)
+                                for balance in (10.0, 50.0, 75.0)],
+             {"minimum_balance": [50.0] * 3}),
+            ("InvestmentAccount", [InvestmentAccount("1", "1", 100.0, created, 2.55) for created in opened],
+             {"management_fee": [2.55] * 3, "account_open_date": opened}),
+        ]
+        for account_type, accounts, params in cases:
+            charges = strategy_registry.calculate_many(account_type, [account.balance for account in accounts],
+                                                       params)
+            self.assertEqual(list(charges), [account.get_service_charges() for account in accounts])
+
+    def test_strategies_are_shared_and_immutable(self):
+        """Test that equal parameters give the same flyweight, which cannot be changed."""
+        strategy = strategy_registry.strategy("SavingsAccount", 50.0)
+        self.assertIs(strategy, MinimumBalanceStrategy.shared(50.0))
+        with self.assertRaises(AttributeError):
+            strategy._MinimumBalanceStrategy__minimum_balance = 0.0
+
+    def test_new_account_types_can_register(self):
+        """Test that a new account type uses its registered kernel, or the generic one."""
+        registry = StrategyRegistry()
+        registry.register("FlatAccount", FlatFeeStrategy)
+        self.assertEqual(list(registry.calculate_many("FlatAccount", [10.0, -5.0], {"fee": [1.25, 1.25]})),
+                         [1.25, 0.50])
+
+        registry.register("FlatAccount", FlatFeeStrategy, kernel=lambda balances, params: [0.0] * len(balances))
+        self.assertEqual(registry.calculate_many("FlatAccount", [10.0], {"fee": [1.25]}), [0.0])
+        self.assertIsInstance(registry.strategy("FlatAccount", 1.25), FlatFeeStrategy)
+        with self.assertRaises(TypeError):
+            registry.register("BadAccount", object)
+
+if __name__ == "__main__":
+    unittest.main()
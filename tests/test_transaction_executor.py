@@ -0,0 +1,106 @@
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import date
+from unittest.mock import patch
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from services.transaction_executor import TransactionExecutor
+from tests.test_manage_data import ACCOUNTS_CSV, CLIENTS_CSV
+from user_interface import manage_data
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class TestTransactionExecutor(unittest.TestCase):
+    """Stress tests for the concurrent transaction executor."""
+
+    def setUp(self):
+        """Use a tiny thread switch interval so races show up quickly."""
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+    def test_concurrent_deposits_are_not_lost(self):
+        """Test that many threads depositing into one account lose no updates."""
+        accounts = {"1": SavingsAccount("1", "1001", 0.0, date(2023, 1, 1), 0.0)}
+        with TransactionExecutor(accounts, workers=8, persist=False) as executor:
+            futures = [executor.deposit("1", 1.0) for _ in range(2000)]
+        self.assertEqual(accounts["1"].balance, 2000.0)
+        self.assertEqual(sorted(future.result() for future in futures), [float(n) for n in range(1, 2001)])
+
+    def test_concurrent_transfers_conserve_money(self):
+        """Test that transfers in both directions between many accounts neither deadlock nor lose money."""
+        accounts = {str(number): ChequingAccount(str(number), "1001", 1000.0, date(2023, 1, 1), -500.0, 0.05)
+                    for number in range(10)}
+        rng = random.Random(5)
+        with TransactionExecutor(accounts, workers=8, persist=False) as executor:
+            futures = [executor.transfer(str(rng.randrange(10)), str(rng.randrange(10)), rng.randrange(1, 400))
+                       for _ in range(3000)]
+        rejected = sum(1 for future in futures if future.exception() is not None)
+        self.assertGreater(rejected, 0)
+        self.assertEqual(sum(account.balance for account in accounts.values()), 10000.0)
+        self.assertTrue(all(account.balance >= -500.0 for account in accounts.values()))
+
+    def test_transfer_many_fans_out_atomically(self):
+        """Test that concurrent fan-outs and transfers over shared accounts conserve money."""
+        accounts = {str(number): SavingsAccount(str(number), "1001", 100.0, date(2023, 1, 1), 0.0)
+                    for number in range(50)}
+        with TransactionExecutor(accounts, workers=8, persist=False) as executor:
+            payrolls = [executor.transfer_many(str(source), [(str(number), 1.0) for number in range(50)
+                                                             if number != source])
+                        for source in range(0, 50, 5)]
+            transfers = [executor.transfer(str(number), str((number + 1) % 50), 10.0) for number in range(50)]
+        self.assertTrue(all(future.exception() is None for future in payrolls + transfers))
+        self.assertEqual(sum(account.balance for account in accounts.values()), 5000.0)
+        self.assertEqual(accounts["0"].balance, 100.0 - 49.0 + 9.0)
+
+    def test_locks_are_taken_in_sorted_order(self):
+        """Test that an operation holds its accounts' locks and sees them in the order given."""
+        accounts = {"a": SavingsAccount("a", "1001", 10.0, date(2023, 1, 1), 0.0),
+                    "b": SavingsAccount("b", "1001", 20.0, date(2023, 1, 1), 0.0)}
+        with TransactionExecutor(accounts, workers=2, persist=False) as executor:
+            future = executor.submit(["b", "a"], lambda b, a: (b.account_number, a.account_number))
+            missing = executor.deposit("z", 1.0)
+        self.assertEqual(future.result(), ("b", "a"))
+        self.assertIsInstance(missing.exception(), KeyError)
+
+    def test_balances_are_persisted_by_the_writer(self):
+        """Test that the writer persists the final balances of every transaction."""
+        data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, data_dir)
+        paths = {"clients_csv_path": os.path.join(data_dir, "clients.csv"),
+                 "accounts_csv_path": os.path.join(data_dir, "accounts.csv"),
+                 "accounts_journal_path": os.path.join(data_dir, "accounts.journal")}
+        for name, path in paths.items():
+            patcher = patch.object(manage_data, name, path)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        with open(paths["clients_csv_path"], "w", newline="") as file:
+            file.write(CLIENTS_CSV)
+        with open(paths["accounts_csv_path"], "w", newline="") as file:
+            file.write(ACCOUNTS_CSV)
+
+        _, accounts = manage_data.load_data()
+        writes = []
+        update_many = manage_data.update_many
+        with patch.object(manage_data, "update_many",
+                          side_effect=lambda snapshots, journaled: (writes.append(threading.current_thread().name),
+                                                                    update_many(snapshots, journaled))):
+            with TransactionExecutor(accounts, workers=4) as executor:
+                for _ in range(100):
+                    executor.transfer("20001", "20003", 10.0)
+                    executor.deposit("20002", 1.0)
+        self.assertEqual(set(writes), {"transaction-writer"})
+
+        _, reloaded = manage_data.load_data()
+        self.assertEqual(reloaded["20001"].balance, 14000.0)
+        self.assertAlmostEqual(reloaded["20002"].balance, 401.54)
+        self.assertAlmostEqual(reloaded["20003"].balance, 2200.87)
+
+if __name__ == "__main__":
+    unittest.main()
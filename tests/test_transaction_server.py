@@ -0,0 +1,196 @@
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from patterns.observer.observer import Observer
+from services.transaction_client import TransactionClient
+from services.transaction_server import TransactionServer
+from tests.test_manage_data import ACCOUNTS_CSV, CLIENTS_CSV
+from user_interface import manage_data
+
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+class TestTransactionServer(unittest.IsolatedAsyncioTestCase):
+    """Test case for the asyncio transaction server and client."""
+
+    async def asyncSetUp(self):
+        """Write sample data files, point manage_data at them and start a server on a free port."""
+        self.data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        paths = {"clients_csv_path": os.path.join(self.data_dir, "clients.csv"),
+                 "accounts_csv_path": os.path.join(self.data_dir, "accounts.csv"),
+                 "accounts_journal_path": os.path.join(self.data_dir, "accounts.journal")}
+        for name, path in paths.items():
+            patcher = patch.object(manage_data, name, path)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        with open(paths["clients_csv_path"], "w", newline="") as file:
+            file.write(CLIENTS_CSV)
+        with open(paths["accounts_csv_path"], "w", newline="") as file:
+            file.write(ACCOUNTS_CSV)
+
+        self.server = TransactionServer.from_data()
+        listener = await self.server.start(port=0)
+        self.port = listener.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        """Stop the server."""
+        await self.server.close()
+
+    async def test_pipelined_requests_are_answered_in_order(self):
+        """Test that requests written together are all answered, in order, with their ids."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        requests = [{"id": 1, "op": "deposit", "account_number": "20002", "amount": 100},
+                    {"id": 2, "op": "lookup", "account_number": "20002"},
+                    {"id": 3, "op": "withdraw", "account_number": "20002", "amount": 1000},
+                    {"id": 4, "op": "lookup", "account_number": "99999"},
+                    {"id": 5, "op": "close"},
+                    {"id": 6, "op": "lookup", "client_number": 1001}]
+        writer.write(b"".join(json.dumps(request).encode() + b"\n" for request in requests) + b"not json\n")
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(7)]
+        writer.close()
+        await writer.wait_closed()
+
+        self.assertEqual([response["id"] for response in responses], [1, 2, 3, 4, 5, 6, None])
+        self.assertAlmostEqual(responses[0]["account"]["balance"], 401.54)
+        self.assertEqual(responses[1]["account"]["account_type"], "SavingsAccount")
+        self.assertEqual([response.get("code") for response in responses[2:]],
+                         ["rejected", "not_found", "invalid_request", None, "invalid_request"])
+        self.assertEqual([account["account_number"] for account in responses[5]["accounts"]], ["20001", "20002"])
+
+    async def test_writes_are_batched_across_connections(self):
+        """Test that deposits from many connections are persisted in a few writes."""
+        writes = []
+        update_many = manage_data.update_many
+        with patch.object(manage_data, "update_many",
+                          side_effect=lambda snapshots, journaled: (writes.append(len(snapshots)),
+                                                                    update_many(snapshots, journaled))):
+            clients = [await TransactionClient.connect(port=self.port) for _ in range(20)]
+            balances = await asyncio.gather(*(client.deposit(number, 1.0) for client in clients
+                                              for number in ("20001", "20002", "20003")))
+            for client in clients:
+                await client.close()
+
+        self.assertEqual(max(balances), 15020.0)
+        self.assertLess(len(writes), 60)
+        _, reloaded = manage_data.load_data()
+        self.assertEqual(reloaded["20001"].balance, 15020.0)
+        self.assertAlmostEqual(reloaded["20002"].balance, 321.54)
+        self.assertAlmostEqual(reloaded["20003"].balance, 1220.87)
+
+    async def test_client_raises_for_failed_requests(self):
+        """Test that the client raises KeyError for unknown accounts and ValueError for rejections."""
+        async with await TransactionClient.connect(port=self.port) as client:
+            with self.assertRaises(KeyError):
+                await client.lookup("99999")
+            with self.assertRaises(ValueError):
+                await client.deposit("20001", -5)
+            with self.assertRaises(ValueError):
+                await client.withdraw("20001", 20000)
+            self.assertEqual(await client.withdraw("20001", 100), 14900.0)
+            self.assertEqual(await client.transfer("20001", "20003", 900), (14000.0, 2100.87))
+            with self.assertRaises(ValueError):
+                await client.transfer("20002", "20003", 1000)
+            self.assertEqual([account["balance"] for account in await client.client_accounts(1002)], [2100.87])
+
+    async def test_close_answers_open_connections_and_refuses_new_requests(self):
+        """Test that close answers what a connection already sent, hangs up and refuses new requests."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(json.dumps({"id": 1, "op": "deposit", "account_number": "20001", "amount": 100}).encode()
+                     + b"\n")
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        await self.server.close()
+
+        self.assertEqual(response["account"]["balance"], 15100.0)
+        self.assertEqual(await reader.readline(), b"")
+        writer.close()
+        await writer.wait_closed()
+        response, commit = self.server.handle_request({"id": 2, "op": "deposit", "account_number": "20001",
+                                                       "amount": 100})
+        self.assertEqual((response["code"], commit), ("unavailable", None))
+        _, reloaded = manage_data.load_data()
+        self.assertEqual(reloaded["20001"].balance, 15100.0)
+
+    async def test_failed_write_restores_balances(self):
+        """Test that balances whose write failed are put back as they were."""
+        async with await TransactionClient.connect(port=self.port) as client:
+            with patch.object(manage_data, "update_many", side_effect=OSError("disk full")), \
+                    self.assertLogs(level="ERROR"):
+                with self.assertRaisesRegex(ValueError, "disk full"):
+                    await client.deposit("20001", 100)
+                with self.assertRaisesRegex(ValueError, "disk full"):
+                    await client.transfer("20003", "20002", 200)
+            self.assertEqual((await client.lookup("20001"))["balance"], 15000.0)
+            self.assertEqual([account["balance"] for account in await client.client_accounts(1001)],
+                             [15000.0, 301.54])
+            self.assertEqual((await client.lookup("20003"))["balance"], 1200.87)
+            self.assertEqual(await client.deposit("20001", 1), 15001.0)
+
+    async def test_non_finite_amounts_are_rejected(self):
+        """Test that NaN and infinite amounts never reach an account."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(b'{"id": 1, "op": "deposit", "account_number": "20001", "amount": NaN}\n'
+                     b'{"id": 2, "op": "withdraw", "account_number": "20001", "amount": -Infinity}\n'
+                     b'{"id": 3, "op": "deposit", "account_number": "20001", "amount": "Infinity"}\n'
+                     b'{"id": 4, "op": "transfer", "account_number": "20001", "target_account_number": "20002", '
+                     b'"amount": "nan"}\n')
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(4)]
+        writer.close()
+        await writer.wait_closed()
+
+        self.assertEqual([response["code"] for response in responses], ["rejected"] * 4)
+        async with await TransactionClient.connect(port=self.port) as client:
+            self.assertEqual((await client.lookup("20001"))["balance"], 15000.0)
+
+    async def test_notifications_do_not_stall_the_event_loop(self):
+        """Test that an observer blocked on a notification does not hold up other requests."""
+        store = manage_data.load_account_store(fixed_point=True)
+        accounts = {view.account_number: view for view in map(store.view, range(len(store)))}
+        release = threading.Event()
+        notified = []
+
+        class BlockingObserver(Observer):
+            def update(self, message):
+                release.wait(5)
+                notified.append((threading.current_thread().name, message))
+
+        observer = BlockingObserver()
+        accounts["20001"].attach(observer)
+        server = TransactionServer(accounts, journaled=False)
+        listener = await server.start(port=0)
+        try:
+            port = listener.sockets[0].getsockname()[1]
+            async with await TransactionClient.connect(port=port) as client:
+                self.assertEqual(await client.deposit("20001", 20000), 35000.0)
+                self.assertEqual(await client.deposit("20001", 20000), 55000.0)
+                description = await client.lookup("20002")
+            self.assertEqual(notified, [])
+        finally:
+            release.set()
+            await server.close()
+
+        self.assertEqual(description["account_type"], "SavingsAccount")
+        self.assertEqual([name.startswith("transaction-server-notifier") for name, _ in notified], [True, True])
+        self.assertEqual([message for _, message in notified], ["Large transaction $20,000.00: on account 20001"] * 2)
+
+    async def test_unix_socket(self):
+        """Test that the server can listen on a Unix socket."""
+        path = os.path.join(self.data_dir, "transactions.sock")
+        server = TransactionServer.from_data(journaled=False)
+        await server.start(path=path)
+        try:
+            async with await TransactionClient.connect(path=path) as client:
+                self.assertEqual((await client.lookup("20001"))["balance"], 15000.0)
+        finally:
+            await server.close()
+
+if __name__ == "__main__":
+    unittest.main()
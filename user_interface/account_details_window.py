@@ -71,7 +71,7 @@ class AccountDetailsWindow(DetailsWindow):
                 self.__account.withdraw(amount)
 
             self.balance_label.setText(f"${self.__account.balance:,.2f}")
-            update_data(self.__account)  # Update accounts.csv
+            update_data(self.__account, journaled=True)  # Journal the new balance
             self.balance_updated.emit(self.__account)  # Emit signal to refresh table
             self.transaction_amount_edit.setText("")
             self.transaction_amount_edit.setFocus()
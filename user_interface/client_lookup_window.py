@@ -6,7 +6,7 @@ from PySide6.QtWidgets import QTableWidgetItem, QMessageBox
 from PySide6.QtCore import Qt, Slot, Signal
 from ui_superclasses.lookup_window import LookupWindow
 from user_interface.account_details_window import AccountDetailsWindow
-from user_interface.manage_data import load_data
+from user_interface.manage_data import ClientAccountIndex, IncrementalReloader
 from bank_account.bank_account import BankAccount
 
 class ClientLookupWindow(LookupWindow):
@@ -15,12 +15,16 @@ class ClientLookupWindow(LookupWindow):
     Attributes:
         __client_listing (dict): Dictionary mapping client numbers to Client objects.
         __accounts (dict): Dictionary mapping account numbers to BankAccount objects.
+        __client_index (ClientAccountIndex): Index mapping client numbers to their account numbers.
+        __reloader (IncrementalReloader): Picks up changes other processes make to the data files.
     """
 
     def __init__(self):
         """Initialize the lookup window and connect events to handlers."""
         super().__init__()
-        self.__client_listing, self.__accounts = load_data()
+        self.__reloader = IncrementalReloader()
+        self.__client_listing, self.__accounts = self.__reloader.load()
+        self.__client_index = ClientAccountIndex(self.__accounts)
 
         # Connect signals to slots
         self.lookup_button.clicked.connect(self.__on_lookup_client)
@@ -42,6 +46,7 @@ class ClientLookupWindow(LookupWindow):
             self.reset_display()
             return
 
+        self.__refresh_data()
         if client_number not in self.__client_listing:
             QMessageBox.information(self, "Not Found", f"Client number: {client_number} not found.")
             self.reset_display()
@@ -51,19 +56,23 @@ class ClientLookupWindow(LookupWindow):
         self.client_info_label.setText(f"{client.last_name}, {client.first_name}")
 
         self.account_table.setRowCount(0)
-        for account in self.__accounts.values():
-            if account.client_number == str(client_number):
-                row = self.account_table.rowCount()
-                self.account_table.insertRow(row)
-                self.account_table.setItem(row, 0, QTableWidgetItem(account.account_number))
-                balance_item = QTableWidgetItem(f"${account.balance:,.2f}")
-                balance_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.account_table.setItem(row, 1, balance_item)
-                self.account_table.setItem(row, 2, QTableWidgetItem(str(account.date_created)))
-                self.account_table.setItem(row, 3, QTableWidgetItem(account.__class__.__name__))
+        for account in self.__client_index.accounts_for(client_number, self.__accounts):
+            row = self.account_table.rowCount()
+            self.account_table.insertRow(row)
+            self.account_table.setItem(row, 0, QTableWidgetItem(account.account_number))
+            balance_item = QTableWidgetItem(f"${account.balance:,.2f}")
+            balance_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.account_table.setItem(row, 1, balance_item)
+            self.account_table.setItem(row, 2, QTableWidgetItem(str(account.date_created)))
+            self.account_table.setItem(row, 3, QTableWidgetItem(account.__class__.__name__))
         self.account_table.resizeColumnsToContents()
         self.toggle_filter(False)  # Reset filter state after lookup
 
+    def __refresh_data(self) -> None:
+        """Applies changes made to the data files since they were last read."""
+        self.__reloader.reload().apply(self.__accounts, self.__client_index)
+        self.__client_listing = self.__reloader.client_listing
+
     @Slot()
     def __on_text_changed(self):
         """Handle text changes in the client number field by clearing the account table."""
@@ -100,18 +109,18 @@ class ClientLookupWindow(LookupWindow):
             account (BankAccount): The updated BankAccount object.
         """
         self.__accounts[account.account_number] = account
+        self.__client_index.add(account)
         client_number = int(self.client_number_edit.text())
         self.account_table.setRowCount(0)
-        for acc in self.__accounts.values():
-            if acc.client_number == str(client_number):
-                row = self.account_table.rowCount()
-                self.account_table.insertRow(row)
-                self.account_table.setItem(row, 0, QTableWidgetItem(acc.account_number))
-                balance_item = QTableWidgetItem(f"${acc.balance:,.2f}")
-                balance_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.account_table.setItem(row, 1, balance_item)
-                self.account_table.setItem(row, 2, QTableWidgetItem(str(acc.date_created)))
-                self.account_table.setItem(row, 3, QTableWidgetItem(acc.__class__.__name__))
+        for acc in self.__client_index.accounts_for(client_number, self.__accounts):
+            row = self.account_table.rowCount()
+            self.account_table.insertRow(row)
+            self.account_table.setItem(row, 0, QTableWidgetItem(acc.account_number))
+            balance_item = QTableWidgetItem(f"${acc.balance:,.2f}")
+            balance_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.account_table.setItem(row, 1, balance_item)
+            self.account_table.setItem(row, 2, QTableWidgetItem(str(acc.date_created)))
+            self.account_table.setItem(row, 3, QTableWidgetItem(acc.__class__.__name__))
         self.account_table.resizeColumnsToContents()
 
     @Slot()
@@ -6,13 +6,23 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 import csv
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+import functools
+import hashlib
+import io
 import logging
+import math
+import threading
+from typing import NamedTuple
+import zlib
 from bank_account.chequing_account import ChequingAccount
 from bank_account.savings_account import SavingsAccount
 from bank_account.investment_account import InvestmentAccount
 from client.client import Client
 from bank_account.bank_account import BankAccount
+from bank_account.account_store import AccountStore
+from storage.columnar_snapshot import AccountsSnapshot, write_snapshot
 
 # GIVEN LOGGING AND FILE ACCESS CODE
 root_dir = os.path.dirname(os.path.dirname(__file__))
@@ -26,107 +36,1256 @@ clients_csv_path = os.path.join(data_dir, 'clients.csv')
 accounts_csv_path = os.path.join(data_dir, 'accounts.csv')
 # END GIVEN LOGGING AND FILE ACCESS CODE
 
-def load_data() -> tuple[dict, dict]:
+# Journaled balance changes are appended here and folded back into accounts.csv by compaction.
+# Each record holds the absolute balances of one write, as account_number,balance pairs, and a
+# checksum, so replaying a record twice is harmless and a record torn by a crash is skipped whole.
+accounts_journal_path = os.path.join(data_dir, 'accounts.journal')
+JOURNAL_COMPACT_BYTES = 64 * 1024
+JOURNAL_FSYNC = True
+
+# Columnar binary copy of the accounts table, written beside accounts.csv.
+accounts_snapshot_path = os.path.join(data_dir, 'accounts.snapshot')
+
+_journal_lock = threading.Lock()
+_compaction_lock = threading.Lock()
+_compaction_thread = None
+
+# Parallel loading splits each file into chunks of at least this many bytes.
+PARALLEL_MIN_CHUNK_BYTES = 1024 * 1024
+
+# The valid client numbers and journaled balances, set once in each account loading worker.
+_worker_client_numbers = None
+_worker_journaled_balances = None
+
+# Number of distinct date_created strings remembered by the account row decoder.
+DATE_CACHE_SIZE = 8192
+
+# Number of accounts.csv lines hashed together by the incremental reloader.
+RELOAD_BLOCK_LINES = 1024
+
+# When set, records are read from and balances written to this backend instead of the CSV files.
+_storage_backend = None
+
+def set_storage_backend(backend) -> None:
+    """Routes load_data, update_data and the streaming readers through a storage backend.
+
+    The backend supplies raw client and account records, which are validated here exactly
+    as rows of the CSV files are, and stores balance updates. Pass None to use the CSV
+    files again.
+
+    Args:
+        backend: An object providing iter_client_records(), iter_account_records(client_number),
+            and update_balances(balances), such as storage.sqlite_storage.SQLiteStorage.
+    """
+    global _storage_backend
+    _storage_backend = backend
+
+def get_storage_backend():
+    """Returns the storage backend in use, or None if the CSV files are used."""
+    return _storage_backend
+
+class ClientAccountIndex:
+    """Secondary index from client number to the numbers of that client's bank accounts.
+
+    Lookups cost O(accounts of the client) instead of a scan of every account. Account
+    numbers are kept in the order they were added.
+
+    Attributes:
+        __accounts_by_client (dict): Maps client_number (str) to a dict used as an ordered
+            set of account numbers.
+        __client_by_account (dict): Maps account_number (str) to its client_number (str).
+    """
+
+    def __init__(self, accounts: dict = None) -> None:
+        """Initializes the index, adding every account in the given dictionary.
+
+        Args:
+            accounts (dict): Maps account_number (str) to BankAccount objects.
+        """
+        self.__accounts_by_client = {}
+        self.__client_by_account = {}
+        for account in (accounts or {}).values():
+            self.add(account)
+
+    def add(self, account: BankAccount) -> None:
+        """Adds a new or changed bank account to the index.
+
+        Args:
+            account (BankAccount): The bank account to index.
+        """
+        client_number = str(account.client_number)
+        previous_client = self.__client_by_account.get(account.account_number)
+        if previous_client == client_number:
+            return
+        if previous_client is not None:
+            self.remove(account.account_number)
+        self.__client_by_account[account.account_number] = client_number
+        self.__accounts_by_client.setdefault(client_number, {})[account.account_number] = None
+
+    def remove(self, account_number: str) -> None:
+        """Removes a bank account from the index.
+
+        Args:
+            account_number (str): The number of the account to remove.
+        """
+        client_number = self.__client_by_account.pop(account_number, None)
+        if client_number is None:
+            return
+        client_accounts = self.__accounts_by_client[client_number]
+        del client_accounts[account_number]
+        if not client_accounts:
+            del self.__accounts_by_client[client_number]
+
+    def account_numbers(self, client_number) -> list:
+        """Returns the account numbers belonging to a client.
+
+        Args:
+            client_number (int | str): The client number to look up.
+
+        Returns:
+            list: The client's account numbers, empty if the client has no accounts.
+        """
+        return list(self.__accounts_by_client.get(str(client_number), ()))
+
+    def accounts_for(self, client_number, accounts: dict) -> list:
+        """Returns the BankAccount objects belonging to a client.
+
+        Args:
+            client_number (int | str): The client number to look up.
+            accounts (dict): Maps account_number (str) to BankAccount objects.
+
+        Returns:
+            list: The client's bank accounts found in accounts.
+        """
+        return [accounts[number] for number in self.__accounts_by_client.get(str(client_number), ())
+                if number in accounts]
+
+    def service_charges_for(self, client_number, accounts: dict) -> float:
+        """Returns the total service charges of a client's accounts.
+
+        Each account's charge comes from get_service_charges, which reuses the charge cached
+        on the account while its balance is unchanged.
+
+        Args:
+            client_number (int | str): The client number to look up.
+            accounts (dict): Maps account_number (str) to BankAccount objects.
+
+        Returns:
+            float: The sum of the service charges, 0.0 if the client has no accounts.
+        """
+        return math.fsum(account.get_service_charges() for account in self.accounts_for(client_number, accounts))
+
+    def __contains__(self, account_number: str) -> bool:
+        """Returns True if the account number is indexed."""
+        return account_number in self.__client_by_account
+
+def load_data(build_index: bool = False, use_snapshot: bool = False, workers: int = None) -> tuple:
     """Loads client and account data from CSV files into dictionaries.
 
     Reads client data from `clients.csv` and account data from `accounts.csv`, creating
-    Client and BankAccount objects respectively. Logs errors if data is invalid or files
-    are not found.
+    Client and BankAccount objects respectively. Balances recorded in the transaction
+    journal replace the balances in `accounts.csv`. Logs errors if data is invalid or
+    files are not found.
+
+    Args:
+        build_index (bool): If True, also build a ClientAccountIndex of the loaded accounts.
+        use_snapshot (bool): If True, read the accounts from the columnar snapshot written by
+            write_accounts_snapshot when it is up to date, skipping CSV parsing.
+        workers (int): If greater than 1, parse the CSV files in this many processes with
+            load_data_parallel.
 
     Returns:
-        tuple: A tuple of (client_listing, accounts) where:
+        tuple: A tuple of (client_listing, accounts), or (client_listing, accounts, index)
+        when build_index is True, where:
             - client_listing (dict): Maps client_number (int) to Client objects.
             - accounts (dict): Maps account_number (str) to BankAccount objects.
+            - index (ClientAccountIndex): Maps each client to its account numbers.
 
     Raises:
         FileNotFoundError: If the CSV files are not found.
         ValueError: If data in the CSV files is invalid (e.g., non-numeric values).
     """
+    snapshot = open_accounts_snapshot() if use_snapshot and _storage_backend is None else None
+    if snapshot is not None:
+        client_listing = {client.client_number: client for client in iter_clients()}
+        with snapshot:
+            accounts = {account.account_number: account
+                        for account in iter_snapshot_accounts(snapshot, client_listing)}
+    elif workers is not None and workers > 1 and _storage_backend is None:
+        client_listing, accounts = load_data_parallel(workers)
+    else:
+        client_listing = {client.client_number: client for client in iter_clients()}
+        accounts = {account.account_number: account for account in iter_accounts(client_listing)}
+
+    if build_index:
+        return (client_listing, accounts, ClientAccountIndex(accounts))
+    return (client_listing, accounts)
+
+def load_data_parallel(workers: int = None) -> tuple[dict, dict]:
+    """Loads client and account data by parsing chunks of the CSV files in a process pool.
+
+    Each file is split into byte ranges aligned on line boundaries and the chunks are parsed
+    in parallel. The workers parse and validate the accounts and return them as compact
+    columns, so the parent only wraps each valid account while the chunks are merged in file
+    order. Errors are logged in file order, so the result and the log match the serial path.
+    Quoted fields must not contain line breaks.
+
+    Args:
+        workers (int): The number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        tuple: A tuple of (client_listing, accounts) as returned by load_data.
+    """
+    workers = workers or os.cpu_count() or 1
+    journaled_balances = read_journal()
     client_listing = {}
     accounts = {}
 
-    # READ CLIENT DATA
+    client_chunks = _line_aligned_chunks(clients_csv_path, workers)
+    if client_chunks is None:
+        logging.error(f"Client file {clients_csv_path} not found")
+    else:
+        fieldnames, ranges = client_chunks
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for results in executor.map(_parse_client_chunk, *_chunk_arguments(clients_csv_path, fieldnames, ranges)):
+                for client, error in results:
+                    if error is not None:
+                        logging.error(error)
+                    else:
+                        client_listing[client.client_number] = client
+
+    account_chunks = _line_aligned_chunks(accounts_csv_path, workers)
+    if account_chunks is None:
+        logging.error(f"Account file {accounts_csv_path} not found")
+    else:
+        fieldnames, ranges = account_chunks
+        # The account pool starts once the clients are known, so each worker receives the
+        # client numbers and journaled balances once rather than with every chunk.
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_account_worker,
+                                 initargs=(set(client_listing), journaled_balances)) as executor:
+            for columns, errors in executor.map(_load_account_chunk,
+                                                *_chunk_arguments(accounts_csv_path, fieldnames, ranges)):
+                for error in errors:
+                    logging.error(error)
+                accounts.update(_accounts_from_columns(columns))
+
+    return (client_listing, accounts)
+
+def _line_aligned_chunks(path: str, workers: int):
+    """Splits a CSV file after its header into byte ranges that start and end on line boundaries.
+
+    Args:
+        path (str): The path of the CSV file.
+        workers (int): The number of worker processes the chunks are shared between.
+
+    Returns:
+        tuple: (fieldnames, ranges) where ranges is a list of (start, end) byte offsets, or
+        None if the file is not found.
+    """
+    try:
+        with open(path, 'rb') as file:
+            header = file.readline()
+            start = file.tell()
+            size = os.fstat(file.fileno()).st_size
+            fieldnames = next(csv.reader(io.TextIOWrapper(io.BytesIO(header), newline='')), [])
+            chunk_count = max(1, min(workers * 4, (size - start) // PARALLEL_MIN_CHUNK_BYTES))
+            chunk_size = max(1, (size - start) // chunk_count)
+
+            ranges = []
+            while start < size:
+                file.seek(min(start + chunk_size, size))
+                file.readline()
+                end = min(file.tell(), size)
+                ranges.append((start, end))
+                start = end
+    except FileNotFoundError:
+        return None
+    return (fieldnames, ranges)
+
+def _chunk_arguments(path: str, fieldnames: list, ranges: list) -> tuple:
+    """Returns the argument lists for mapping a chunk parser over the given ranges."""
+    count = len(ranges)
+    return ([path] * count, [fieldnames] * count, [start for start, _ in ranges], [end for _, end in ranges])
+
+def _read_chunk(path: str, start: int, end: int) -> io.TextIOWrapper:
+    """Returns a text stream over the lines between two byte offsets of a CSV file."""
+    with open(path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return io.TextIOWrapper(io.BytesIO(data), newline='')
+
+def _parse_client_chunk(path: str, fieldnames: list, start: int, end: int) -> list:
+    """Parses a chunk of clients.csv in a worker process.
+
+    Returns:
+        list: A (client, error_message) pair per record, one of which is None.
+    """
+    results = []
+    for record in csv.DictReader(_read_chunk(path, start, end), fieldnames=fieldnames):
+        try:
+            results.append((_create_client(record), None))
+        except ValueError as e:
+            results.append((None, f"Unable to create client: {str(e)}"))
+        except Exception as e:
+            results.append((None, f"Unable to create client: unexpected error - {str(e)}"))
+    return results
+
+def _parse_account_chunk(path: str, fieldnames: list, start: int, end: int, journaled_balances: dict) -> list:
+    """Parses a chunk of accounts.csv into typed values in a worker process.
+
+    Returns:
+        list: A (values, error_message) pair per record, one of which is None.
+    """
+    rows = (row for row in csv.reader(_read_chunk(path, start, end)) if row)
+    return list(_parse_account_rows(rows, _AccountRowDecoder(fieldnames).decode, journaled_balances))
+
+def _init_account_worker(client_numbers: set, journaled_balances: dict) -> None:
+    """Stores the valid client numbers and journaled balances in a worker process."""
+    global _worker_client_numbers, _worker_journaled_balances
+    _worker_client_numbers = client_numbers
+    _worker_journaled_balances = journaled_balances
+
+def _load_account_chunk(path: str, fieldnames: list, start: int, end: int) -> tuple[tuple, list]:
+    """Parses and validates a chunk of accounts.csv in a worker started by _init_account_worker.
+
+    The valid accounts are returned as one list per column, with dates as ordinals, because
+    lists of strings and numbers cross the process boundary far more cheaply than account
+    objects or tuples of typed values.
+
+    Returns:
+        tuple: (columns, errors), where columns holds the account_number, client_number,
+        balance, date ordinal, account_type and the two type-specific parameters of each
+        valid account, as read by _accounts_from_columns, and errors holds the error
+        messages in file order.
+    """
+    columns = ([], [], [], [], [], [], [])
+    (account_numbers, client_numbers, balances, ordinals, account_types,
+     first_parameters, second_parameters) = columns
+    errors = []
+    rows = (row for row in csv.reader(_read_chunk(path, start, end)) if row)
+    parsed = _parse_account_rows(rows, _AccountRowDecoder(fieldnames).decode, _worker_journaled_balances)
+    # The accounts are built here only to validate them exactly as the serial path does.
+    for values, _ in _build_accounts(parsed, _worker_client_numbers, errors.append):
+        (account_number, client_number, balance, date_created, account_type,
+         overdraft_limit, overdraft_rate, minimum_balance, _) = values
+        account_numbers.append(account_number)
+        client_numbers.append(client_number)
+        balances.append(balance)
+        ordinals.append(date_created.toordinal())
+        account_types.append(account_type)
+        if account_type == "ChequingAccount":
+            first_parameters.append(overdraft_limit)
+            second_parameters.append(overdraft_rate)
+        else:
+            first_parameters.append(minimum_balance)
+            second_parameters.append(None)
+    return (columns, errors)
+
+def _accounts_from_columns(columns: tuple) -> dict:
+    """Wraps the validated columns returned by _load_account_chunk in BankAccount objects.
+
+    Returns:
+        dict: Maps account_number (str) to BankAccount, in the order of the records.
+    """
+    accounts = {}
+    dates = {}
+    for (account_number, client_number, balance, ordinal, account_type,
+         first_parameter, second_parameter) in zip(*columns):
+        date_created = dates.get(ordinal)
+        if date_created is None:
+            date_created = dates[ordinal] = date.fromordinal(ordinal)
+        if account_type == "ChequingAccount":
+            account = ChequingAccount._from_parsed(account_number, client_number, balance, date_created,
+                                                   first_parameter, second_parameter)
+        elif account_type == "SavingsAccount":
+            account = SavingsAccount._from_parsed(account_number, client_number, balance, date_created,
+                                                  first_parameter)
+        else:
+            account = InvestmentAccount._from_parsed(account_number, client_number, balance, date_created, 2.55)
+        accounts[account_number] = account
+    return accounts
+
+def iter_clients():
+    """Yields Client objects from clients.csv one at a time.
+
+    Invalid rows are logged and skipped, exactly as in load_data, so the whole file never
+    has to be held in memory.
+
+    Yields:
+        Client: Each valid client in file order.
+    """
+    for record in _client_records():
+        try:
+            client = _create_client(record)
+        except ValueError as e:
+            logging.error(f"Unable to create client: {str(e)}")
+            continue
+        except Exception as e:
+            logging.error(f"Unable to create client: unexpected error - {str(e)}")
+            continue
+        yield client
+
+def iter_accounts(client_numbers=None, client_number=None):
+    """Yields BankAccount objects from accounts.csv one at a time.
+
+    Journaled balances are applied and invalid rows are logged and skipped, exactly as in
+    load_data, so batch jobs can process every account in constant memory.
+
+    Args:
+        client_numbers (container): The valid client numbers (int). If None, they are read
+            with iter_clients.
+        client_number (int | str): If given, only that client's accounts are yielded.
+
+    Yields:
+        BankAccount: Each valid bank account in file order.
+    """
+    for _, account in _iter_account_values(client_numbers, client_number):
+        yield account
+
+def _iter_account_values(client_numbers=None, client_number=None):
+    """Yields the typed values and BankAccount of each valid account record.
+
+    Args:
+        client_numbers (container): The valid client numbers (int). If None, they are read
+            with iter_clients.
+        client_number (int | str): If given, only that client's accounts are yielded.
+
+    Yields:
+        tuple: (values, account) in the order of the records.
+    """
+    if client_numbers is None:
+        client_numbers = {client.client_number for client in iter_clients()}
+    journaled_balances = read_journal() if _storage_backend is None else {}
+    yield from _build_accounts(_parsed_account_records(client_number, journaled_balances), client_numbers)
+
+def _build_accounts(parsed, client_numbers, report_error=logging.error):
+    """Builds accounts from parsed records, logging errors and accounts of unknown clients.
+
+    Args:
+        parsed (iterable): (values, error_message) pairs as yielded by _parse_account_rows.
+        client_numbers (container): The valid client numbers (int).
+        report_error (callable): Called with each error message. Worker processes collect
+            the messages so the parent can log them in order.
+
+    Yields:
+        tuple: (values, account) for each valid account, in the order of the records.
+    """
+    for values, error in parsed:
+        if error is not None:
+            report_error(error)
+            continue
+        try:
+            account = _build_account(values)
+            if int(account.client_number) not in client_numbers:
+                report_error(
+                    f"Bank Account: {account.account_number} contains invalid client number "
+                    f"{account.client_number}"
+                )
+                continue
+        except ValueError as e:
+            report_error(f"Unable to create bank account: {str(e)}")
+            continue
+        except Exception as e:
+            report_error(f"Unable to create bank account: unexpected error - {str(e)}")
+            continue
+        yield (values, account)
+
+def write_accounts_snapshot() -> int:
+    """Writes the valid accounts, with journaled balances applied, to a columnar snapshot.
+
+    The snapshot is written beside accounts.csv and records the size and modification time
+    of accounts.csv and the journal, so load_data can tell when it is out of date.
+
+    Returns:
+        int: The number of accounts written.
+    """
+    signature = _snapshot_source_signature()
+    return write_snapshot(accounts_snapshot_path,
+                          (values for values, _ in _iter_account_values()), signature)
+
+def open_accounts_snapshot():
+    """Opens the columnar accounts snapshot with mmap, if it matches the current data files.
+
+    Returns:
+        AccountsSnapshot: The snapshot, or None if it is missing, unreadable or out of date.
+    """
+    try:
+        snapshot = AccountsSnapshot(accounts_snapshot_path)
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        logging.error(f"Unable to open accounts snapshot: {str(e)}")
+        return None
+    if snapshot.source_signature != _snapshot_source_signature():
+        snapshot.close()
+        return None
+    return snapshot
+
+def iter_snapshot_accounts(snapshot, client_numbers):
+    """Yields BankAccount objects from a columnar snapshot without parsing any text.
+
+    Args:
+        snapshot (AccountsSnapshot): An open accounts snapshot.
+        client_numbers (container): The valid client numbers (int).
+
+    Yields:
+        BankAccount: Each account whose client is valid, in snapshot order.
+    """
+    for values in snapshot:
+        account_number, client_number = values[0], values[1]
+        if int(client_number) not in client_numbers:
+            logging.error(f"Bank Account: {account_number} contains invalid client number {client_number}")
+            continue
+        yield _build_account(values)
+
+def load_account_store(client_numbers=None, fixed_point: bool = False) -> AccountStore:
+    """Loads the valid accounts, with journaled balances applied, into a columnar AccountStore.
+
+    Invalid rows are logged and skipped exactly as in iter_accounts.
+
+    Args:
+        client_numbers (container): The valid client numbers (int). If None, they are read
+            with iter_clients.
+        fixed_point (bool): If True, the store holds money as integer cents.
+
+    Returns:
+        AccountStore: The accounts in file order.
+    """
+    store = AccountStore(fixed_point)
+    for values, _ in _iter_account_values(client_numbers):
+        if values[4] == "InvestmentAccount":
+            # Investment accounts are always loaded with the standard fee, as in _build_account.
+            values = values[:8] + (2.55,)
+        store.add(values)
+    return store
+
+def _snapshot_source_signature() -> tuple:
+    """Returns (size, mtime_ns, journal_size) identifying the current accounts data."""
+    try:
+        stat = os.stat(accounts_csv_path)
+        signature = (stat.st_size, stat.st_mtime_ns)
+    except FileNotFoundError:
+        signature = (0, 0)
+    journal_size = 0
+    for path in (accounts_journal_path, _compacting_journal_path()):
+        if os.path.exists(path):
+            journal_size += os.path.getsize(path)
+    return signature + (journal_size,)
+
+def load_client_accounts(client_number) -> list:
+    """Loads the bank accounts of a single client.
+
+    With a storage backend this is an indexed query; with the CSV files it is a single
+    streaming pass that only parses the client's rows.
+
+    Args:
+        client_number (int | str): The client number to look up.
+
+    Returns:
+        list: The client's valid BankAccount objects.
+    """
+    return list(iter_accounts({int(client_number)}, client_number))
+
+def _client_records():
+    """Yields raw client records from the storage backend or clients.csv."""
+    if _storage_backend is not None:
+        yield from _storage_backend.iter_client_records()
+        return
     try:
         with open(clients_csv_path, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for record in reader:
-                try:
-                    client_number = int(record["client_number"])
-                    first_name = record["first_name"].strip()
-                    last_name = record["last_name"].strip()
-                    email_address = record["email_address"].strip()
-
-                    if not first_name:
-                        raise ValueError("First Name cannot be blank")
-
-                    client = Client(client_number, first_name, last_name, email_address)
-                    client_listing[client_number] = client
-                except ValueError as e:
-                    logging.error(f"Unable to create client: {str(e)}")
-                except Exception as e:
-                    logging.error(f"Unable to create client: unexpected error - {str(e)}")
+            yield from csv.DictReader(csvfile)
     except FileNotFoundError:
         logging.error(f"Client file {clients_csv_path} not found")
 
-    # READ ACCOUNT DATA
+def _parsed_account_records(client_number, journaled_balances: dict):
+    """Yields each account record of the storage backend or accounts.csv as typed values.
+
+    Rows of accounts.csv are decoded by position with _AccountRowDecoder rather than
+    through a dict per row.
+
+    Args:
+        client_number (int | str): If given, only that client's records are yielded.
+        journaled_balances (dict): Maps account_number (str) to a journaled balance.
+
+    Yields:
+        tuple: (values, error_message) pairs, one of which is None.
+    """
+    if _storage_backend is not None:
+        records = _storage_backend.iter_account_records(client_number)
+        yield from _parse_account_rows(records, _parse_account_record, journaled_balances)
+        return
     try:
         with open(accounts_csv_path, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for record in reader:
-                try:
-                    account_number = str(record["account_number"])
-                    client_number = str(record["client_number"])
-                    balance = float(record["balance"])
-                    date_created = datetime.strptime(record["date_created"], "%Y-%m-%d").date()
-                    account_type = record["account_type"]
-
-                    if account_type == "ChequingAccount":
-                        overdraft_limit = float(record["overdraft_limit"])
-                        overdraft_rate = float(record["overdraft_rate"])
-                        account = ChequingAccount(
-                            account_number, client_number, balance, date_created,
-                            overdraft_limit, overdraft_rate
-                        )
-                    elif account_type == "SavingsAccount":
-                        minimum_balance = float(record["minimum_balance"])
-                        account = SavingsAccount(
-                            account_number, client_number, balance, date_created,
-                            minimum_balance
-                        )
-                    elif account_type == "InvestmentAccount":
-                        account = InvestmentAccount(
-                            account_number, client_number, balance, date_created, 2.55
-                        )
-                    else:
-                        raise ValueError("Not a valid account type")
-
-                    if int(client_number) in client_listing:
-                        accounts[account_number] = account
-                    else:
-                        logging.error(
-                            f"Bank Account: {account_number} contains invalid client number {client_number}"
-                        )
-                except ValueError as e:
-                    logging.error(f"Unable to create bank account: {str(e)}")
-                except Exception as e:
-                    logging.error(f"Unable to create bank account: unexpected error - {str(e)}")
+            reader = csv.reader(csvfile)
+            decoder = _AccountRowDecoder(next(reader, []))
+            rows = (row for row in reader if row)
+            if client_number is not None:
+                rows = (row for row in rows if decoder.client_number(row) == str(client_number))
+            yield from _parse_account_rows(rows, decoder.decode, journaled_balances)
     except FileNotFoundError:
         logging.error(f"Account file {accounts_csv_path} not found")
 
-    return (client_listing, accounts)
+def _parse_account_rows(rows, parse, journaled_balances: dict):
+    """Parses account rows, turning parse errors into the messages load_data logs.
+
+    Args:
+        rows (iterable): The rows or records to parse.
+        parse (callable): Converts a row and the journaled balances to typed values.
+        journaled_balances (dict): Maps account_number (str) to a journaled balance.
+
+    Yields:
+        tuple: (values, error_message) pairs, one of which is None.
+    """
+    for row in rows:
+        try:
+            yield (parse(row, journaled_balances), None)
+        except ValueError as e:
+            yield (None, f"Unable to create bank account: {str(e)}")
+        except Exception as e:
+            yield (None, f"Unable to create bank account: unexpected error - {str(e)}")
+
+class _AccountRowDecoder:
+    """Decodes accounts.csv rows by column position.
+
+    Produces the same values and raises the same errors as _parse_account_record does for
+    the equivalent DictReader record, without building a dict for every row.
 
-def update_data(updated_account: BankAccount) -> None:
+    Attributes:
+        __positions (dict): Maps each column name in the header to its position.
+        __width (int): The number of columns in the header.
+    """
+
+    def __init__(self, fieldnames: list) -> None:
+        """Initializes the decoder from the header row.
+
+        Args:
+            fieldnames (list): The column names of accounts.csv.
+        """
+        self.__positions = {name: position for position, name in enumerate(fieldnames)}
+        self.__width = len(fieldnames)
+
+    def client_number(self, row: list) -> str:
+        """Returns the client number column of a row."""
+        position = self.__positions["client_number"]
+        return row[position] if position < len(row) else None
+
+    def decode(self, row: list, journaled_balances: dict) -> tuple:
+        """Converts a row to typed values.
+
+        Args:
+            row (list): A row of accounts.csv.
+            journaled_balances (dict): Maps account_number (str) to a journaled balance that
+                replaces the balance in the row.
+
+        Returns:
+            tuple: Typed values in the order returned by _parse_account_record.
+
+        Raises:
+            ValueError: If the row contains invalid data or an unknown account type.
+        """
+        if len(row) < self.__width:
+            # DictReader fills missing trailing columns with None.
+            row = row + [None] * (self.__width - len(row))
+        positions = self.__positions
+        account_number = str(row[positions["account_number"]])
+        client_number = str(row[positions["client_number"]])
+        balance = float(journaled_balances.get(account_number, row[positions["balance"]]))
+        date_created = _parse_date(row[positions["date_created"]])
+        account_type = row[positions["account_type"]]
+        overdraft_limit = overdraft_rate = minimum_balance = management_fee = None
+
+        if account_type == "ChequingAccount":
+            overdraft_limit = float(row[positions["overdraft_limit"]])
+            overdraft_rate = float(row[positions["overdraft_rate"]])
+        elif account_type == "SavingsAccount":
+            minimum_balance = float(row[positions["minimum_balance"]])
+        elif account_type == "InvestmentAccount":
+            # Investment accounts are built with the standard fee, so the column is optional.
+            position = positions.get("management_fee")
+            try:
+                management_fee = float(row[position]) if position is not None else None
+            except (ValueError, TypeError):
+                management_fee = None
+        else:
+            raise ValueError("Not a valid account type")
+
+        return (account_number, client_number, balance, date_created, account_type,
+                overdraft_limit, overdraft_rate, minimum_balance, management_fee)
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date(text: str) -> date:
+    """Parses a YYYY-MM-DD date, remembering recent results because dates repeat heavily.
+
+    Raises:
+        ValueError: If the text does not match the format.
+    """
+    return datetime.strptime(text, "%Y-%m-%d").date()
+
+def _create_client(record: dict) -> Client:
+    """Creates a Client from a clients.csv record.
+
+    Args:
+        record (dict): A row of clients.csv keyed by column name.
+
+    Returns:
+        Client: The client described by the record.
+
+    Raises:
+        ValueError: If the record contains invalid data.
+    """
+    client_number = int(record["client_number"])
+    first_name = record["first_name"].strip()
+    last_name = record["last_name"].strip()
+    email_address = record["email_address"].strip()
+
+    if not first_name:
+        raise ValueError("First Name cannot be blank")
+
+    return Client(client_number, first_name, last_name, email_address)
+
+def _parse_account_record(record: dict, journaled_balances: dict) -> tuple:
+    """Converts an accounts.csv record to typed values.
+
+    Args:
+        record (dict): A row of accounts.csv keyed by column name.
+        journaled_balances (dict): Maps account_number (str) to a journaled balance that
+            replaces the balance in the record.
+
+    Returns:
+        tuple: (account_number, client_number, balance, date_created, account_type,
+        overdraft_limit, overdraft_rate, minimum_balance, management_fee), with None for
+        the columns the account type does not use.
+
+    Raises:
+        ValueError: If the record contains invalid data or an unknown account type.
+    """
+    account_number = str(record["account_number"])
+    client_number = str(record["client_number"])
+    balance = float(journaled_balances.get(account_number, record["balance"]))
+    date_created = _parse_date(record["date_created"])
+    account_type = record["account_type"]
+    overdraft_limit = overdraft_rate = minimum_balance = management_fee = None
+
+    if account_type == "ChequingAccount":
+        overdraft_limit = float(record["overdraft_limit"])
+        overdraft_rate = float(record["overdraft_rate"])
+    elif account_type == "SavingsAccount":
+        minimum_balance = float(record["minimum_balance"])
+    elif account_type == "InvestmentAccount":
+        try:
+            management_fee = float(record.get("management_fee"))
+        except (ValueError, TypeError):
+            management_fee = None
+    else:
+        raise ValueError("Not a valid account type")
+
+    return (account_number, client_number, balance, date_created, account_type,
+            overdraft_limit, overdraft_rate, minimum_balance, management_fee)
+
+def _build_account(values: tuple) -> BankAccount:
+    """Creates a BankAccount subclass from typed values.
+
+    The values are already parsed, so the accounts are built with the trusted construction
+    path that skips converting and validating them again.
+
+    Args:
+        values (tuple): Typed values in the order returned by _parse_account_record.
+
+    Returns:
+        BankAccount: The bank account described by the values.
+
+    Raises:
+        ValueError: If the account type is unknown.
+    """
+    (account_number, client_number, balance, date_created, account_type,
+     overdraft_limit, overdraft_rate, minimum_balance, _) = values
+
+    if account_type == "ChequingAccount":
+        return ChequingAccount._from_parsed(
+            account_number, client_number, balance, date_created,
+            overdraft_limit, overdraft_rate
+        )
+    elif account_type == "SavingsAccount":
+        return SavingsAccount._from_parsed(
+            account_number, client_number, balance, date_created,
+            minimum_balance
+        )
+    elif account_type == "InvestmentAccount":
+        return InvestmentAccount._from_parsed(
+            account_number, client_number, balance, date_created, 2.55
+        )
+    else:
+        raise ValueError("Not a valid account type")
+
+class ReloadDiff(NamedTuple):
+    """The accounts that changed between two loads of the data files.
+
+    Attributes:
+        added (dict): Maps account_number (str) to each new BankAccount.
+        changed (dict): Maps account_number (str) to the new BankAccount of each changed account.
+        removed (list): The account numbers that no longer exist.
+    """
+    added: dict
+    changed: dict
+    removed: list
+
+    def __bool__(self) -> bool:
+        """Returns True if any account was added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+    def apply(self, accounts: dict, index: ClientAccountIndex = None) -> None:
+        """Applies the differences to a dictionary of accounts and, optionally, its index.
+
+        Args:
+            accounts (dict): Maps account_number (str) to BankAccount objects.
+            index (ClientAccountIndex): An index of accounts to keep current.
+        """
+        for account_number in self.removed:
+            accounts.pop(account_number, None)
+            if index is not None:
+                index.remove(account_number)
+        for account_number, account in {**self.added, **self.changed}.items():
+            accounts[account_number] = account
+            if index is not None:
+                index.add(account)
+
+class IncrementalReloader:
+    """Reloads clients.csv, accounts.csv and the journal, reparsing only what changed.
+
+    The size and modification time of each file decide whether it is read at all. When
+    accounts.csv has changed, it is split into blocks of RELOAD_BLOCK_LINES lines and only
+    blocks whose content hash differs from the previous load are parsed again, so appending
+    to the file costs the appended rows plus one block. The reloader works on the CSV files
+    and ignores any storage backend.
+
+    Attributes:
+        __block_lines (int): The number of lines hashed together.
+        __client_listing (dict): Maps client_number (int) to Client objects.
+        __accounts (dict): Maps account_number (str) to BankAccount objects.
+        __signatures (dict): Maps account_number (str) to the typed values it was built from.
+        __file_states (dict): Maps each file path to its last seen (size, mtime_ns).
+        __journaled_balances (dict): The journaled balances at the last load.
+        __header (bytes): The header line of accounts.csv at the last load.
+        __blocks (list): (hash, entries) per block, where entries is a list of
+            (account_number, values, account) tuples.
+    """
+
+    def __init__(self, block_lines: int = RELOAD_BLOCK_LINES) -> None:
+        """Initializes a reloader that has not loaded anything yet.
+
+        Args:
+            block_lines (int): The number of accounts.csv lines hashed together.
+        """
+        self.__block_lines = block_lines
+        self.__client_listing = {}
+        self.__accounts = {}
+        self.__signatures = {}
+        self.__file_states = {}
+        self.__journaled_balances = {}
+        self.__header = None
+        self.__blocks = []
+
+    @property
+    def client_listing(self) -> dict:
+        """Get the clients from the last load, keyed by client number."""
+        return self.__client_listing
+
+    @property
+    def accounts(self) -> dict:
+        """Get the accounts from the last load, keyed by account number."""
+        return self.__accounts
+
+    def load(self) -> tuple[dict, dict]:
+        """Loads the data files, as load_data does, and remembers their state.
+
+        Returns:
+            tuple: A tuple of (client_listing, accounts). The dictionaries are copies that
+            the caller may update with the diffs returned by reload().
+        """
+        self.reload()
+        return (dict(self.__client_listing), dict(self.__accounts))
+
+    def reload(self) -> ReloadDiff:
+        """Reloads whatever changed since the last load.
+
+        Returns:
+            ReloadDiff: The accounts added, changed and removed since the last load.
+        """
+        clients_changed = self.__file_changed(clients_csv_path)
+        if clients_changed:
+            previous_clients = set(self.__client_listing)
+            self.__client_listing = {client.client_number: client for client in iter_clients()}
+            clients_changed = set(self.__client_listing) != previous_clients
+
+        journal_changed = any([self.__file_changed(accounts_journal_path),
+                               self.__file_changed(_compacting_journal_path())])
+        dirty_accounts = set()
+        if journal_changed:
+            journaled_balances = read_journal()
+            for account_number in journaled_balances.keys() | self.__journaled_balances.keys():
+                if journaled_balances.get(account_number) != self.__journaled_balances.get(account_number):
+                    dirty_accounts.add(account_number)
+            self.__journaled_balances = journaled_balances
+
+        if not (self.__file_changed(accounts_csv_path) or clients_changed or dirty_accounts):
+            return ReloadDiff({}, {}, [])
+        return self.__reload_accounts(clients_changed, dirty_accounts)
+
+    def __reload_accounts(self, reparse_all: bool, dirty_accounts: set) -> ReloadDiff:
+        """Rebuilds the accounts from changed blocks of accounts.csv and diffs the result."""
+        try:
+            with open(accounts_csv_path, 'rb') as file:
+                header = file.readline()
+                lines = file.readlines()
+        except FileNotFoundError:
+            logging.error(f"Account file {accounts_csv_path} not found")
+            header, lines = None, []
+
+        reparse_all = reparse_all or header != self.__header
+        self.__header = header
+        decoder = _AccountRowDecoder(next(csv.reader(io.TextIOWrapper(io.BytesIO(header or b''), newline='')), []))
+
+        blocks = []
+        for number, first in enumerate(range(0, len(lines), self.__block_lines)):
+            block_lines = lines[first:first + self.__block_lines]
+            digest = hashlib.blake2b(b''.join(block_lines), digest_size=16).digest()
+            previous = self.__blocks[number] if number < len(self.__blocks) else None
+            if (not reparse_all and previous is not None and previous[0] == digest
+                    and not any(entry[0] in dirty_accounts for entry in previous[1])):
+                blocks.append(previous)
+            else:
+                blocks.append((digest, self.__parse_block(block_lines, decoder)))
+        self.__blocks = blocks
+
+        accounts = {}
+        signatures = {}
+        added = {}
+        changed = {}
+        for _, entries in blocks:
+            for account_number, values, account in entries:
+                previous_values = self.__signatures.get(account_number)
+                if previous_values is None:
+                    added[account_number] = account
+                elif previous_values != values:
+                    changed[account_number] = account
+                else:
+                    account = self.__accounts[account_number]
+                accounts[account_number] = account
+                signatures[account_number] = values
+        removed = [account_number for account_number in self.__accounts if account_number not in accounts]
+
+        self.__accounts = accounts
+        self.__signatures = signatures
+        return ReloadDiff(added, changed, removed)
+
+    def __parse_block(self, block_lines: list, decoder: _AccountRowDecoder) -> list:
+        """Parses one block of accounts.csv lines into (account_number, values, account) entries."""
+        reader = csv.reader(io.TextIOWrapper(io.BytesIO(b''.join(block_lines)), newline=''))
+        parsed = _parse_account_rows((row for row in reader if row), decoder.decode, self.__journaled_balances)
+        return [(account.account_number, values, account)
+                for values, account in _build_accounts(parsed, self.__client_listing)]
+
+    def __file_changed(self, path: str) -> bool:
+        """Returns True if the size or modification time of a file changed since it was last checked."""
+        try:
+            stat = os.stat(path)
+            state = (stat.st_size, stat.st_mtime_ns)
+        except FileNotFoundError:
+            state = None
+        changed = path not in self.__file_states or self.__file_states[path] != state
+        self.__file_states[path] = state
+        return changed
+
+def read_journal() -> dict:
+    """Reads the transaction journal into a dictionary of the latest balance per account.
+
+    Records still waiting in an interrupted compaction are read first so that newer
+    journal records take precedence. Damaged records are logged and skipped. Both files
+    are read under the compaction and journal locks, so a compaction running at the same
+    time cannot move or fold records between the two reads.
+
+    Returns:
+        dict: Maps account_number (str) to the most recently journaled balance (str).
+    """
+    balances = {}
+    with _compaction_lock, _journal_lock:
+        for path in (_compacting_journal_path(), accounts_journal_path):
+            _read_journal_file(path, balances)
+    return balances
+
+def _read_journal_file(path: str, balances: dict) -> None:
+    """Reads one journal file into balances, verifying each record's checksum.
+
+    Args:
+        path (str): The path of the journal file.
+        balances (dict): Maps account_number (str) to a balance (str); updated in place.
+    """
+    try:
+        with open(path, newline='') as file:
+            for line_number, row in enumerate(csv.reader(file), start=1):
+                if not row:
+                    continue
+                if len(row) >= 3 and len(row) % 2 == 1 and row[-1] == _journal_checksum(row[:-1]):
+                    balances.update(zip(row[0:-1:2], row[1:-1:2]))
+                else:
+                    logging.error(f"Skipping damaged journal record in {path} at line {line_number}: {row}")
+    except FileNotFoundError:
+        pass
+
+def _journal_checksum(fields: list) -> str:
+    """Returns the checksum stored with a journal record of account_number, balance pairs."""
+    return f"{zlib.crc32(','.join(fields).encode('utf-8')):08x}"
+
+def append_journal(updated_account: BankAccount) -> None:
+    """Appends the balance of the given BankAccount to the transaction journal.
+
+    Starts a background compaction once the journal grows past JOURNAL_COMPACT_BYTES.
+
+    Args:
+        updated_account (BankAccount): A bank account containing an updated balance.
+    """
+    _append_journal_records([updated_account])
+
+def _append_journal_records(updated_accounts: list, compact: bool = True) -> bool:
+    """Appends the balances of the given BankAccounts to the transaction journal as one record.
+
+    The balances share a checksum, so after a crash either all of them are replayed or none
+    are. The write is flushed to disk before returning when JOURNAL_FSYNC is set.
+
+    Args:
+        updated_accounts (list): Bank accounts containing updated balances.
+        compact (bool): If True, start a background compaction when the journal is too large.
+
+    Returns:
+        bool: True if the records were written, False if an error was logged.
+    """
+    record = []
+    for account in updated_accounts:
+        record += [account.account_number, str(account.balance)]
+    record.append(_journal_checksum(record))
+
+    try:
+        with _journal_lock:
+            with open(accounts_journal_path, mode='a+', newline='') as file:
+                _end_torn_record(file)
+                csv.writer(file).writerow(record)
+                file.flush()
+                if JOURNAL_FSYNC:
+                    os.fsync(file.fileno())
+                journal_size = file.tell()
+    except PermissionError:
+        logging.error(f"Unable to update {accounts_journal_path}: Permission denied")
+        return False
+    except Exception as e:
+        logging.error(f"Unable to update {accounts_journal_path}: Unexpected error - {str(e)}")
+        return False
+
+    if compact and journal_size >= JOURNAL_COMPACT_BYTES:
+        start_background_compaction()
+    return True
+
+def _end_torn_record(file) -> None:
+    """Ends a record left without a line break by a crash, so new records start on their own line.
+
+    Args:
+        file: A journal file opened in 'a+' mode.
+    """
+    file.seek(0, os.SEEK_END)
+    size = file.tell()
+    if size:
+        file.seek(size - 1)
+        if file.read(1) not in ('\n', '\r'):
+            file.write('\r\n')
+
+def compact_journal() -> bool:
+    """Folds the journaled balances back into accounts.csv and clears the journal.
+
+    The journal is moved aside before it is folded, so transactions journaled while the
+    compaction runs are kept for the next compaction.
+
+    Returns:
+        bool: True if the journal was folded into accounts.csv, False otherwise.
+    """
+    return _fold_journal()
+
+def start_background_compaction() -> threading.Thread:
+    """Runs compact_journal on a background thread unless a compaction is already running.
+
+    Returns:
+        threading.Thread: The thread performing the compaction.
+    """
+    global _compaction_thread
+    with _journal_lock:
+        if _compaction_thread is None or not _compaction_thread.is_alive():
+            _compaction_thread = threading.Thread(target=compact_journal, name="journal-compaction")
+            _compaction_thread.start()
+        return _compaction_thread
+
+def update_data(updated_account: BankAccount, journaled: bool = False) -> None:
     """Updates the accounts.csv file with the balance from the given BankAccount.
 
+    The balance is journaled first and then folded into accounts.csv together with any
+    balances already waiting in the journal, so a crash during the rewrite loses nothing.
+
     Args:
         updated_account (BankAccount): A bank account containing an updated balance.
+        journaled (bool): If True, append the balance to the transaction journal instead of
+            rewriting accounts.csv. Ignored when a storage backend is in use.
 
     Raises:
         FileNotFoundError: If the accounts.csv file is not found.
         PermissionError: If there are permission issues writing to the file.
         Exception: For other unexpected errors during file writing.
     """
+    if _storage_backend is not None:
+        _storage_backend.update_balances({updated_account.account_number: updated_account.balance})
+    elif journaled:
+        append_journal(updated_account)
+    elif _append_journal_records([updated_account], compact=False):
+        _fold_journal()
+
+def update_many(updated_accounts, journaled: bool = False) -> None:
+    """Writes the balances of many BankAccounts in a single pass.
+
+    accounts.csv is rewritten once (or the journal appended to, or the storage backend
+    updated, once) no matter how many accounts are given. If an account appears more than
+    once, its last balance is kept. The balances are persisted together, as one journal record
+    or one backend transaction, so both legs of a transfer survive a crash or neither does.
+
+    Args:
+        updated_accounts (iterable): Bank accounts containing updated balances.
+        journaled (bool): If True, append the balances to the transaction journal instead of
+            rewriting accounts.csv.
+    """
+    latest = {account.account_number: account for account in updated_accounts}
+    if not latest:
+        return
+    if _storage_backend is not None:
+        _storage_backend.update_balances({number: account.balance for number, account in latest.items()})
+    elif journaled:
+        _append_journal_records(list(latest.values()))
+    elif _append_journal_records(list(latest.values()), compact=False):
+        _fold_journal()
+
+class WriteBatch:
+    """Gathers balance changes and writes them together with update_many.
+
+    Use it as a context manager to write everything added inside the block when it exits.
+    When a commit window is given, the first change added to an empty batch schedules a
+    commit after that many seconds, so a burst of transactions shares one flush.
+
+    Attributes:
+        __journaled (bool): Whether commits append to the journal instead of rewriting accounts.csv.
+        __commit_window (float): Seconds to wait before committing, or None to commit only on demand.
+        __pending (dict): Maps account_number (str) to the latest BankAccount added.
+        __timer (threading.Timer): The scheduled group commit, if any.
+        __lock (threading.Lock): Guards the pending changes and the timer.
+    """
+
+    def __init__(self, journaled: bool = False, commit_window: float = None) -> None:
+        """Initializes an empty write batch.
+
+        Args:
+            journaled (bool): If True, commits append to the transaction journal.
+            commit_window (float): Seconds to gather changes before committing automatically.
+        """
+        self.__journaled = journaled
+        self.__commit_window = commit_window
+        self.__pending = {}
+        self.__timer = None
+        self.__lock = threading.Lock()
+
+    def add(self, updated_account: BankAccount) -> None:
+        """Adds a bank account whose balance should be written with the batch.
+
+        Args:
+            updated_account (BankAccount): A bank account containing an updated balance.
+        """
+        with self.__lock:
+            self.__pending[updated_account.account_number] = updated_account
+            if self.__commit_window is not None and self.__timer is None:
+                self.__timer = threading.Timer(self.__commit_window, self.commit)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+    def commit(self) -> None:
+        """Writes every pending balance change in one pass."""
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            pending = list(self.__pending.values())
+            self.__pending.clear()
+        update_many(pending, self.__journaled)
+
+    def __len__(self) -> int:
+        """Returns the number of accounts waiting to be written."""
+        return len(self.__pending)
+
+    def __enter__(self) -> 'WriteBatch':
+        """Returns the batch for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Commits the pending balance changes when the with block exits."""
+        self.commit()
+
+def _compacting_journal_path() -> str:
+    """Returns the path the journal is moved to while it is being compacted."""
+    return accounts_journal_path + '.compacting'
+
+def _fold_journal() -> bool:
+    """Writes the journaled balances into accounts.csv and removes the folded records.
+
+    accounts.csv is replaced atomically, and the folded records are only removed after
+    the replacement, so a crash at any point leaves either the old or the new accounts.csv
+    with every record needed to recover still in the journal.
+
+    Returns:
+        bool: True if accounts.csv was rewritten, False otherwise.
+    """
+    compacting_path = _compacting_journal_path()
+    with _compaction_lock:
+        with _journal_lock:
+            if os.path.exists(accounts_journal_path):
+                if os.path.exists(compacting_path):
+                    # Finish an interrupted compaction together with the newer records.
+                    with open(accounts_journal_path, newline='') as journal, \
+                            open(compacting_path, mode='a+', newline='') as compacting:
+                        _end_torn_record(compacting)
+                        compacting.write(journal.read())
+                        compacting.flush()
+                        os.fsync(compacting.fileno())
+                    os.remove(accounts_journal_path)
+                else:
+                    os.replace(accounts_journal_path, compacting_path)
+
+        balances = {}
+        _read_journal_file(compacting_path, balances)
+        if not balances:
+            if os.path.exists(compacting_path):
+                os.remove(compacting_path)
+            return False
+
+        if not _rewrite_balances(balances):
+            return False
+        os.remove(compacting_path)
+        return True
+
+def _rewrite_balances(balances: dict) -> bool:
+    """Atomically rewrites accounts.csv, replacing the balance of every account in balances.
+
+    The new contents are written to a temporary file beside accounts.csv, flushed to disk
+    and renamed over it, so accounts.csv is never left partly written.
+
+    Args:
+        balances (dict): Maps account_number (str) to the balance (str) to write.
+
+    Returns:
+        bool: True if accounts.csv was rewritten, False if an error was logged.
+    """
     updated_rows = []
+    temp_path = accounts_csv_path + '.tmp'
 
     try:
         with open(accounts_csv_path, mode='r', newline='') as file:
@@ -134,32 +1293,52 @@ def update_data(updated_account: BankAccount) -> None:
             fields = reader.fieldnames
             
             for row in reader:
-                # Keep account_number as string to match updated_account.account_number
+                # Keep account_number as string to match the journaled account numbers
                 account_number = row['account_number']
-                if account_number == updated_account.account_number:
-                    row['balance'] = str(updated_account.balance)  # Convert to string for CSV
+                if account_number in balances:
+                    row['balance'] = balances[account_number]
                 updated_rows.append(row)
 
-        with open(accounts_csv_path, mode='w', newline='') as file:
+        with open(temp_path, mode='w', newline='') as file:
             writer = csv.DictWriter(file, fieldnames=fields)
             writer.writeheader()
             writer.writerows(updated_rows)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, accounts_csv_path)
+        _sync_directory(os.path.dirname(accounts_csv_path))
     except FileNotFoundError:
         logging.error(f"Unable to update accounts.csv: File {accounts_csv_path} not found")
+        return False
     except PermissionError:
         logging.error(f"Unable to update accounts.csv: Permission denied")
+        return False
     except Exception as e:
         logging.error(f"Unable to update accounts.csv: Unexpected error - {str(e)}")
+        return False
+    return True
+
+def _sync_directory(path: str) -> None:
+    """Flushes a directory entry to disk so a rename survives a crash, where the platform allows it."""
+    try:
+        directory = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(directory)
+    except OSError:
+        pass
+    finally:
+        os.close(directory)
 
 # GIVEN TESTING SECTION:
 if __name__ == "__main__":
-    clients, accounts = load_data()
+    clients, accounts, client_index = load_data(build_index=True)
 
     print("=========================================")
     for client in clients.values():
         print(client)
         print(f"{client.client_number} Accounts\n=============")
-        for account in accounts.values():
-            if account.client_number == str(client.client_number):
-                print(f"{account}\n")
+        for account in client_index.accounts_for(client.client_number, accounts):
+            print(f"{account}\n")
         print("=========================================")
\ No newline at end of file
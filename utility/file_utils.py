@@ -2,14 +2,50 @@ __author__ = "ACE Faculty"
 __version__ = "1.0.0"
 __credits__ = "Md Apurba Khan"
 
+import atexit
 import os
+import threading
+from utility.outbox_writer import OutboxWriter
+
+# The buffered writer shared by the simulated email functions, opened on first use.
+_outbox = None
+_outbox_lock = threading.Lock()
+
+def _get_outbox():
+    """Return the shared outbox writer for output/observer_emails.txt."""
+    global _outbox
+    if _outbox is None:
+        with _outbox_lock:
+            if _outbox is None:
+                directory = "output"
+                filename = "observer_emails.txt"
+                project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+                path = os.path.join(project_root, directory, filename)
+                _outbox = OutboxWriter(path)
+    return _outbox
+
+@atexit.register
+def _close_outbox():
+    """Write the emails still buffered when the interpreter exits.
+
+    Registered at import, so it runs after the exit hooks of modules that send emails
+    through this one, such as the notification dispatcher.
+    """
+    if _outbox is not None:
+        _outbox.close()
 
 def simulate_send_email(email_address, subject, message):
-    """Simulate sending an email by writing to a file."""
-    directory = "output"
-    filename = "observer_emails.txt"
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    path = os.path.join(project_root, directory, filename)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "a") as file:
-        file.write(f"---\nTo: {email_address}\nSubject: {subject}\nMessage: {message}\n---\n")
\ No newline at end of file
+    """Simulate sending an email by writing to a file.
+
+    The email goes through a buffered outbox writer that keeps the file open, so it reaches
+    the file within a second, or when the process exits.
+    """
+    _get_outbox().write(email_address, subject, message)
+
+def simulate_send_emails(emails):
+    """Simulate sending many emails, buffered together by the outbox writer.
+
+    Args:
+        emails (iterable): (email_address, subject, message) tuples, written in order.
+    """
+    _get_outbox().write_many(emails)
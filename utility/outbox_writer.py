@@ -0,0 +1,207 @@
+__author__ = "Md Apurba Khan"
+__version__ = "1.0.0"
+
+import glob
+import gzip
+import logging
+import os
+import shutil
+import threading
+
+# Buffered bytes that trigger a write to the file.
+DEFAULT_BUFFER_BYTES = 64 * 1024
+# Seconds a buffered email may wait before it is written.
+DEFAULT_FLUSH_INTERVAL = 1.0
+# Size at which the outbox file is closed and a new segment started.
+DEFAULT_SEGMENT_BYTES = 16 * 1024 * 1024
+
+def format_email(email_address: str, subject: str, message: str) -> str:
+    """Return an email as it is stored in the outbox file.
+
+    Args:
+        email_address (str): The recipient.
+        subject (str): The subject line.
+        message (str): The body of the email.
+
+    Returns:
+        str: The email record.
+    """
+    return f"---\nTo: {email_address}\nSubject: {subject}\nMessage: {message}\n---\n"
+
+class OutboxWriter:
+    """Appends emails to an outbox file through one open, buffered handle.
+
+    Emails are gathered in memory and written together once buffer_bytes have built up or
+    flush_interval seconds after the first buffered email, whichever comes first. When the
+    file would grow past segment_bytes it is closed and renamed to a numbered segment, such
+    as observer_emails.txt.00001, and a new file is started; closed segments can be gzipped
+    in the background. Emails still buffered when the process crashes are lost, so call
+    flush() where an email must be on disk.
+
+    The writer is thread-safe, and calling it with a list of emails writes them all, so it
+    can be used as a NotificationDispatcher sink.
+
+    Attributes:
+        __path (str): The path of the active outbox file.
+        __buffer_bytes (int): Buffered bytes that trigger a write.
+        __flush_interval (float): Seconds an email may stay buffered, or None to wait for size.
+        __segment_bytes (int): The size limit of a segment, or None to never rotate.
+        __compress (bool): Whether closed segments are gzipped.
+        __buffer (list): The encoded emails waiting to be written.
+        __buffered (int): The number of bytes in the buffer.
+        __file: The open outbox file, or None until the first write.
+        __size (int): The size of the active outbox file.
+        __segments (int): The number of the last closed segment.
+        __timer (threading.Timer): The scheduled time-based flush, if any.
+        __compressions (list): The threads gzipping closed segments.
+        __lock (threading.RLock): Guards the buffer, the file and the timer.
+    """
+
+    def __init__(self, path: str, buffer_bytes: int = DEFAULT_BUFFER_BYTES,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+                 compress: bool = False) -> None:
+        """Initialize the writer without opening the file yet.
+
+        Args:
+            path (str): The path of the outbox file. Its directory is created if needed.
+            buffer_bytes (int): Buffered bytes that trigger a write.
+            flush_interval (float): Seconds an email may stay buffered, or None to only write
+                when the buffer is full or flush is called.
+            segment_bytes (int): The size limit of a segment, or None to never rotate.
+            compress (bool): If True, gzip each closed segment to <segment>.gz.
+        """
+        self.__path = path
+        self.__buffer_bytes = buffer_bytes
+        self.__flush_interval = flush_interval
+        self.__segment_bytes = segment_bytes
+        self.__compress = compress
+        self.__buffer = []
+        self.__buffered = 0
+        self.__file = None
+        self.__size = 0
+        self.__segments = None
+        self.__timer = None
+        self.__compressions = []
+        self.__lock = threading.RLock()
+
+    def write(self, email_address: str, subject: str, message: str) -> None:
+        """Buffer one email.
+
+        Args:
+            email_address (str): The recipient.
+            subject (str): The subject line.
+            message (str): The body of the email.
+        """
+        self.write_many([(email_address, subject, message)])
+
+    def write_many(self, emails) -> None:
+        """Buffer many emails, in order.
+
+        Args:
+            emails (iterable): (email_address, subject, message) tuples.
+        """
+        data = "".join(format_email(*email) for email in emails).encode("utf-8")
+        if not data:
+            return
+        with self.__lock:
+            self.__buffer.append(data)
+            self.__buffered += len(data)
+            if self.__buffered >= self.__buffer_bytes:
+                self.flush()
+            elif self.__flush_interval is not None and self.__timer is None:
+                self.__timer = threading.Timer(self.__flush_interval, self.__timed_flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+    __call__ = write_many
+
+    def flush(self) -> None:
+        """Write every buffered email to the outbox file.
+
+        Raises:
+            OSError: If the file cannot be opened or written. The emails stay buffered and
+                are written by the next flush.
+        """
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            if not self.__buffer:
+                return
+            data = b"".join(self.__buffer)
+            self.__open()
+            if self.__segment_bytes is not None and self.__size and self.__size + len(data) > self.__segment_bytes:
+                self.__rotate()
+            self.__file.write(data)
+            self.__file.flush()
+            self.__size += len(data)
+            self.__buffer.clear()
+            self.__buffered = 0
+
+    def close(self) -> None:
+        """Write the buffered emails, close the file and wait for segment compression."""
+        with self.__lock:
+            self.flush()
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+            compressions, self.__compressions = self.__compressions, []
+        for thread in compressions:
+            thread.join()
+
+    def __enter__(self) -> 'OutboxWriter':
+        """Returns the writer for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Closes the writer when the with block exits."""
+        self.close()
+
+    def __timed_flush(self) -> None:
+        """Writes the buffer when the flush interval ends, logging any failure."""
+        try:
+            self.flush()
+        except OSError as e:
+            logging.error(f"Unable to write {self.__path}: {str(e)}")
+
+    def __open(self) -> None:
+        """Opens the outbox file for appending unless it is already open."""
+        if self.__file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.__path)), exist_ok=True)
+            self.__file = open(self.__path, "ab")
+            self.__size = self.__file.tell()
+
+    def __rotate(self) -> None:
+        """Closes the outbox file as the next numbered segment and opens a new one."""
+        if self.__segments is None:
+            self.__segments = _last_segment(self.__path)
+        self.__segments += 1
+        segment_path = f"{self.__path}.{self.__segments:05d}"
+        self.__file.close()
+        os.replace(self.__path, segment_path)
+        self.__file = open(self.__path, "ab")
+        self.__size = 0
+        if self.__compress:
+            thread = threading.Thread(target=_compress_segment, args=(segment_path,), name="outbox-compression")
+            thread.start()
+            self.__compressions = [compression for compression in self.__compressions if compression.is_alive()]
+            self.__compressions.append(thread)
+
+def _last_segment(path: str) -> int:
+    """Returns the number of the last segment closed from an outbox file, or 0 if there is none."""
+    numbers = [0]
+    for name in glob.glob(glob.escape(path) + ".*"):
+        number = name[len(path) + 1:].split(".")[0]
+        if number.isdigit():
+            numbers.append(int(number))
+    return max(numbers)
+
+def _compress_segment(segment_path: str) -> None:
+    """Gzips a closed segment to <segment>.gz and removes the uncompressed file."""
+    try:
+        with open(segment_path, "rb") as source, gzip.open(segment_path + ".gz.tmp", "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.replace(segment_path + ".gz.tmp", segment_path + ".gz")
+        os.remove(segment_path)
+    except OSError as e:
+        logging.error(f"Unable to compress {segment_path}: {str(e)}")